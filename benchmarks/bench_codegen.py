@@ -0,0 +1,142 @@
+"""Measures zod code generation for wide models with many repeated field types.
+
+python -m benchmarks.bench_codegen
+"""
+
+import copy
+import os
+import random
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from pydantic2zod import _codegen
+from pydantic2zod._codegen import Codegen
+from pydantic2zod._known_types import KNOWN_TYPES
+from pydantic2zod._transform import share_equal_types
+from pydantic2zod.model import (
+    AnnotatedType,
+    ClassDecl,
+    ClassField,
+    GenericType,
+    LiteralType,
+    PrimitiveType,
+    PydanticField,
+    PyInteger,
+    PyType,
+    TupleType,
+    UnionType,
+    UserDefinedType,
+)
+
+MODELS = 100
+FIELDS_PER_MODEL = 300
+DISTINCT_TYPES = 300
+
+_render_field_type = _codegen._render_field_type  # pyright: ignore[reportPrivateUsage]
+
+
+def synthetic_types(count: int, max_depth: int) -> list[PyType]:
+    """Like `str`, `Optional[Model]` or `list[int]` nested up to `max_depth`."""
+    rnd = random.Random(0)
+    leaves: list[PyType] = [
+        PrimitiveType(name="str"),
+        PrimitiveType(name="int"),
+        PrimitiveType(name="float"),
+        PrimitiveType(name="bool"),
+        KNOWN_TYPES["uuid.UUID"],
+        KNOWN_TYPES["datetime.datetime"],
+        *[UserDefinedType(name=f"bench.Model{i}") for i in range(MODELS)],
+    ]
+    by_depth = [leaves]
+    types = list(leaves)
+    while len(types) < count:
+        depth = rnd.randrange(1, max_depth + 1)
+        inner = rnd.choice(by_depth[rnd.randrange(min(depth, len(by_depth)))])
+        match rnd.randrange(6):
+            case 0:
+                tp = UnionType([inner, PrimitiveType(name="None")])
+            case 1:
+                tp = GenericType("list", [inner])
+            case 2:
+                tp = GenericType("dict", [PrimitiveType(name="str"), inner])
+            case 3:
+                literals = [LiteralType(f"v{i}") for i in range(rnd.randrange(2, 8))]
+                tp = UnionType([*literals, inner])
+            case 4:
+                tp = TupleType([inner, rnd.choice(leaves)])
+            case _:
+                tp = AnnotatedType(
+                    PrimitiveType(name="int"),
+                    PydanticField(ge=PyInteger(str(rnd.randrange(10)))),
+                )
+        if len(by_depth) <= depth:
+            by_depth.append([])
+        by_depth[min(depth, len(by_depth) - 1)].append(tp)
+        types.append(tp)
+    return types
+
+
+def synthetic_models(max_depth: int) -> list[ClassDecl]:
+    rnd = random.Random(1)
+    types = synthetic_types(DISTINCT_TYPES, max_depth)
+    return [
+        ClassDecl(
+            name=f"Model{m}",
+            full_path=f"bench.Model{m}",
+            base_classes=["BaseModel"],
+            fields=[
+                # The parser creates new objects for every field.
+                ClassField(name=f"field{f}", type=copy.deepcopy(rnd.choice(types)))
+                for f in range(FIELDS_PER_MODEL)
+            ],
+        )
+        for m in range(MODELS)
+    ]
+
+
+def best_of(runs: int, models: list[ClassDecl], to_zod: Callable[..., str]) -> float:
+    timings = []
+    for _ in range(runs):
+        _render_field_type.cache_clear()
+        # Done by the parser.
+        fresh_models = share_equal_types(copy.deepcopy(models))
+        start = time.perf_counter()
+        to_zod(fresh_models)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    codegen = Codegen()
+    print(f"{MODELS} models, {MODELS * FIELDS_PER_MODEL} fields,", end=" ")
+    print(f"{DISTINCT_TYPES} distinct field types")
+
+    for max_depth in [1, 3]:
+        models = synthetic_models(max_depth)
+        memoized = best_of(5, models, codegen.to_zod)
+        _codegen._render_field_type = _render_field_type.__wrapped__  # pyright: ignore[reportPrivateUsage]
+        try:
+            expected = codegen.to_zod(copy.deepcopy(models))
+            not_memoized = best_of(5, models, codegen.to_zod)
+        finally:
+            _codegen._render_field_type = _render_field_type  # pyright: ignore[reportPrivateUsage]
+        assert codegen.to_zod(copy.deepcopy(models)) == expected
+
+        print(f"types nested up to {max_depth} levels:")
+        print(f"  not memoized: {not_memoized * 1000:8.1f} ms")
+        print(
+            f"  memoized:     {memoized * 1000:8.1f} ms"
+            f" ({not_memoized / memoized:.1f}x)"
+        )
+
+    workers = os.cpu_count() or 1
+    models = synthetic_models(3)
+    with ProcessPoolExecutor(workers) as executor:
+        parallel = best_of(5, models, partial(codegen.to_zod, executor=executor))
+    print(f"in {workers} processes: {parallel * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 import logging
+from dataclasses import replace
 
 import pydantic2zod
-from pydantic2zod.model import BuiltinType, ClassDecl
+from pydantic2zod.model import BuiltinType, ClassDecl, ClassField
 
 logging.basicConfig(level=logging.INFO)
 
@@ -11,15 +12,20 @@ class Compiler(pydantic2zod.Compiler):
     MODEL_RENAME_RULES = {"examples.eshop.Product": "Item"}
 
     def _modify_models(self, pydantic_models: list[ClassDecl]) -> list[ClassDecl]:
-        for model in pydantic_models:
-            if model.name == "Item":
-                for f in model.fields:
-                    # In pydantic declarations Product.description is optional.
-                    # Lets make it required in zod.
-                    if f.name == "description":
-                        f.type = BuiltinType(name="str")
-
-        return pydantic_models
+        return [
+            replace(model, fields=[_required_description(f) for f in model.fields])
+            if model.name == "Item"
+            else model
+            for model in pydantic_models
+        ]
+
+
+def _required_description(f: ClassField) -> ClassField:
+    # In pydantic declarations Product.description is optional.
+    # Lets make it required in zod.
+    if f.name == "description":
+        return replace(f, type=BuiltinType(name="str"))
+    return f
 
 
 ts_src = Compiler().parse("examples.eshop").to_zod()
@@ -1,4 +1,19 @@
 from pydantic2zod import model
+from pydantic2zod._cache import CacheStats, ModuleCache
+from pydantic2zod._chunks import ChunkedZodEmitter
+from pydantic2zod._codegen import Emitter, Fragment, TsTypesEmitter, ZodEmitter
 from pydantic2zod._compiler import Compiler
+from pydantic2zod._json_schema import JsonSchemaEmitter
 
-__all__ = ["Compiler", "model"]
+__all__ = [
+    "CacheStats",
+    "ChunkedZodEmitter",
+    "Compiler",
+    "Emitter",
+    "Fragment",
+    "JsonSchemaEmitter",
+    "ModuleCache",
+    "TsTypesEmitter",
+    "ZodEmitter",
+    "model",
+]
@@ -4,6 +4,13 @@
 pydantic2zod > model.ts
 ```
 
+Or keep a compiler running in the background and ask it to compile:
+
+```sh
+pydantic2zod serve --socket /tmp/pydantic2zod.sock &
+pydantic2zod my_pkg.models --daemon /tmp/pydantic2zod.sock > model.ts
+```
+
 Pydantic - declarative data classes in Python.
 zod - declarative data classes in TypeScript.
 
@@ -14,33 +21,206 @@ Compilation is a 2 step process:
 """
 
 import logging
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import rich
 import typer
+from rich.console import Console
 from rich.logging import RichHandler
+from typer.core import TyperGroup
 
+from pydantic2zod._chunks import INDEX
+from pydantic2zod._codegen import Emitter, TsTypesEmitter
 from pydantic2zod._compiler import Compiler
+from pydantic2zod._daemon import Daemon, request_compile
+from pydantic2zod._json_schema import JsonSchemaEmitter
+from pydantic2zod._manifest import (
+    compiler_settings,
+    is_up_to_date,
+    previous_outputs,
+    write_manifest,
+)
+from pydantic2zod._memory import MemoryReport
+from pydantic2zod._trace import Trace
 
 _logger = logging.getLogger(__name__)
 
+_JSON_SCHEMA_SUFFIXES = {".json", ".jsonl", ".ndjson"}
+
 
 def main(
     file: str,
-    out_to: Optional[str],
+    out_to: Optional[str] = typer.Argument(None),
     silent: bool = typer.Option(
         False, "-s", "--silent", help="If true, don't print the logs."
     ),
+    lazy: bool = typer.Option(
+        False, "--lazy", help="Build each schema on first use, not at import time."
+    ),
+    interfaces: bool = typer.Option(
+        False, "--interfaces", help="Emit explicit TypeScript interfaces."
+    ),
+    daemon: Optional[str] = typer.Option(
+        None,
+        "--daemon",
+        help="Unix socket of 'pydantic2zod serve'. Compiles in-process if no daemon"
+        " is listening.",
+    ),
+    check: bool = typer.Option(
+        False, "--check", help="Fail if OUT_TO is out of date instead of compiling."
+    ),
+    json_schema: Optional[str] = typer.Option(
+        None, "--json-schema", help="Also save JSON Schema of the models to this file."
+    ),
+    ts_types: Optional[str] = typer.Option(
+        None, "--ts-types", help="Also save plain TypeScript types to this file."
+    ),
+    jobs: int = typer.Option(
+        1, "-j", "--jobs", help="Generate zod code in this many processes."
+    ),
+    memory_report: bool = typer.Option(
+        False,
+        "--memory-report",
+        help="Print peak and retained memory of parsing each module and codegen.",
+    ),
+    trace: Optional[str] = typer.Option(
+        None,
+        "--trace",
+        help="Save a timeline of the compilation to this file in the Chrome"
+        " trace-event format, e.g. to open it in Perfetto.",
+    ),
+    chunk_size: Optional[int] = typer.Option(
+        None,
+        "--chunk-size",
+        help="Split the zod code into modules of about this many bytes, saved to"
+        " the OUT_TO directory along with index.ts.",
+    ),
+    splice: bool = typer.Option(
+        False,
+        "--splice",
+        help="Update only the changed models' code in OUT_TO, wrapped in markers"
+        " with the digest of the code.",
+    ),
 ) -> None:
+    """Compile a Python module or JSON Schema to zod, printed unless saved to OUT_TO."""
     if not silent:
         logging.basicConfig(
             level="INFO", format="%(message)s", datefmt="[%X]", handlers=[RichHandler()]
         )
+
+    compiler = Compiler()
+    extra_emitters: dict[str, Emitter] = {}
+    if json_schema:
+        extra_emitters[json_schema] = JsonSchemaEmitter()
+    if ts_types:
+        extra_emitters[ts_types] = TsTypesEmitter()
+    settings = compiler_settings(
+        compiler,
+        lazy=lazy,
+        interfaces=interfaces,
+        json_schema=json_schema,
+        ts_types=ts_types,
+        chunk_size=chunk_size,
+        splice=splice,
+    )
+    if chunk_size and not out_to:
+        raise typer.BadParameter("OUT_TO directory is required with --chunk-size")
+    if splice and not out_to:
+        raise typer.BadParameter("OUT_TO is required with --splice")
+    if splice and chunk_size:
+        raise typer.BadParameter("--splice can't be combined with --chunk-size")
+    # The manifest of the chunks is saved along with the index.
+    manifest_of = str(Path(out_to, f"{INDEX}.ts")) if out_to and chunk_size else out_to
+    if manifest_of:
+        # Sources are listed in the manifest saved along with the output.
+        if is_up_to_date(manifest_of, file, settings):
+            rich.print(f"Up to date: '{out_to}'")
+            return
+        if check:
+            rich.print(f"Out of date: '{out_to}'")
+            raise typer.Exit(code=1)
+    elif check:
+        raise typer.BadParameter("OUT_TO is required with --check")
+
     try:
-        zod_src_code = Compiler().parse(file).to_zod()
-        if out_to:
+        compiled = None
+        chunks: dict[str, str] = {}
+        extra_outputs = []
+        from_json_schema = Path(file).suffix in _JSON_SCHEMA_SUFFIXES
+        if daemon and (
+            extra_emitters or from_json_schema or trace or chunk_size or splice
+        ):
+            _logger.info(
+                "The daemon only compiles Python modules, compiling in-process"
+            )
+        elif daemon:
+            try:
+                compiled = request_compile(daemon, file, lazy, interfaces)
+            except OSError:
+                _logger.info("No daemon at '%s', compiling in-process", daemon)
+        if compiled is None:
+            with (
+                MemoryReport() if memory_report else nullcontext() as report,
+                Trace() if trace else nullcontext() as tracer,
+            ):
+                if from_json_schema:
+                    compiler.parse_json_schema(file)
+                else:
+                    compiler.parse(file)
+                if chunk_size:
+                    chunks = compiler.to_zod_chunks(chunk_size, lazy, interfaces)
+                    zod_src = chunks.pop(f"{INDEX}.ts")
+                    extra_outputs = compiler.emit(list(extra_emitters.values()))
+                else:
+                    with (
+                        ProcessPoolExecutor(jobs) if jobs > 1 else nullcontext()
+                    ) as executor:
+                        if splice and out_to:
+                            zod_src = compiler.splice_zod(
+                                _read_existing(out_to), lazy, interfaces, executor
+                            )
+                            extra_outputs = compiler.emit(list(extra_emitters.values()))
+                        else:
+                            zod_emitter = compiler.zod_emitter(
+                                lazy, interfaces, executor
+                            )
+                            zod_src, *extra_outputs = compiler.emit(
+                                [zod_emitter, *extra_emitters.values()]
+                            )
+            if report:
+                Console(stderr=True).print(str(report), highlight=False)
+            if tracer and trace:
+                tracer.save(trace)
+                rich.print(f"Saved trace to: '{trace}'")
+            compiled = (zod_src, compiler.source_files())
+
+        zod_src_code, source_files = compiled
+        for fname, code in zip(extra_emitters, extra_outputs):
+            Path(fname).write_text(code)
+            rich.print(f"Saved to: '{fname}'")
+        if out_to and chunk_size:
+            index_file = str(Path(out_to, f"{INDEX}.ts"))
+            chunk_files = _save_chunks(Path(out_to), chunks, index_file)
+            Path(index_file).write_text(zod_src_code)
+            write_manifest(
+                index_file,
+                file,
+                settings,
+                source_files,
+                [*chunk_files, *extra_emitters],
+            )
+            rich.print(f"Saved {len(chunks)} chunks to: '{out_to}'")
+        elif out_to and splice and zod_src_code == _read_existing(out_to):
+            # Keeps the file untouched for the tools watching it.
+            write_manifest(out_to, file, settings, source_files, list(extra_emitters))
+            rich.print(f"No models changed: '{out_to}'")
+        elif out_to:
             Path(out_to).write_text(zod_src_code)
+            write_manifest(out_to, file, settings, source_files, list(extra_emitters))
             rich.print(f"Saved to: '{out_to}'")
         else:
             rich.print(zod_src_code)
@@ -48,5 +228,65 @@ def main(
         _logger.exception("Compiler failed:")
 
 
+def _read_existing(out_to: str) -> str:
+    fname = Path(out_to)
+    return fname.read_text() if fname.is_file() else ""
+
+
+def _save_chunks(out_dir: Path, chunks: dict[str, str], index_file: str) -> list[str]:
+    """Also removes the chunks saved by the previous compilation which are gone."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    chunk_files = [str(out_dir / fname) for fname in chunks]
+    for fname in previous_outputs(index_file):
+        if fname.parent == out_dir and fname.suffix == ".ts":
+            if str(fname) not in chunk_files:
+                fname.unlink(missing_ok=True)
+    for fname, code in chunks.items():
+        (out_dir / fname).write_text(code)
+    return chunk_files
+
+
+def serve(
+    socket: Optional[str] = typer.Option(
+        None, "--socket", help="Unix socket to listen on. Uses stdio if not given."
+    ),
+    silent: bool = typer.Option(
+        False, "-s", "--silent", help="If true, don't print the logs."
+    ),
+) -> None:
+    """Keep parsed modules in memory and serve JSON-RPC compile requests."""
+    if not silent:
+        # stdout is reserved for the responses.
+        handler = RichHandler(console=Console(stderr=True))
+        logging.basicConfig(
+            level="INFO", format="%(message)s", datefmt="[%X]", handlers=[handler]
+        )
+    if socket:
+        Daemon().serve_unix_socket(socket)
+    else:
+        Daemon().serve_stdio(sys.stdin, sys.stdout)
+
+
+class _CompileByDefault(TyperGroup):
+    """Runs `compile` unless another command is given, so that
+    `pydantic2zod my_pkg.models` keeps working."""
+
+    def parse_args(self, ctx: Any, args: list[str]) -> list[str]:
+        if (
+            args
+            and args[0] not in self.commands
+            and args[0] not in ctx.help_option_names
+        ):
+            args = [_COMPILE, *args]
+        return super().parse_args(ctx, args)
+
+
+_COMPILE = "compile"
+
+app = typer.Typer(cls=_CompileByDefault, add_completion=False)
+app.command(_COMPILE)(main)
+app.command()(serve)
+
+
 if __name__ == "__main__":
-    typer.run(main)
+    app()
@@ -0,0 +1,77 @@
+"""Limits how far the parser follows the models' dependencies."""
+
+import sys
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
+
+_INSTALLED_PACKAGE_DIRS = {"site-packages", "dist-packages"}
+
+
+@dataclass(frozen=True)
+class CrawlBoundaries:
+    """The module asked to be parsed is always parsed. The boundaries apply to the
+    modules it depends on."""
+
+    roots: frozenset[str] = field(default_factory=frozenset)
+    """Packages the parser may descend into: 'my_pkg', 'other_pkg.models'.
+    Any package when empty."""
+
+    max_depth: int | None = None
+    """How many imports away from the parsed module to follow the dependencies.
+    `0` parses only the given module."""
+
+    installed_packages: bool = True
+    """Whether to parse the standard library and the packages installed into
+    site-packages."""
+
+    own_packages: frozenset[str] = field(default_factory=frozenset)
+    """Top-level packages of the parsed modules. Parsed even when installed packages
+    are not, e.g. from a wheel in a Docker image, see `around()`."""
+
+    def around(self, *module_names: str) -> "CrawlBoundaries":
+        """The same boundaries for parsing the given modules."""
+        own_packages = {m.split(".")[0] for m in module_names}
+        return replace(self, own_packages=self.own_packages | own_packages)
+
+    def allow(self, module_name: str, depth: int) -> bool:
+        """
+        Args:
+            module_name: the module a dependency is declared in.
+            depth: the number of imports between it and the parsed module.
+        """
+        if self.max_depth is not None and depth > self.max_depth:
+            return False
+        if self.roots and not any(
+            module_name == root or module_name.startswith(f"{root}.")
+            for root in self.roots
+        ):
+            return False
+        if self.installed_packages or module_name.split(".")[0] in self.own_packages:
+            return True
+        return not is_installed(module_name)
+
+
+@lru_cache
+def is_installed(module_name: str) -> bool:
+    """Whether the module is a part of the standard library or of a package installed
+    into site-packages.
+
+    Looks only at the top level package, so that the module is not imported.
+    """
+    top_level = module_name.split(".")[0]
+    if top_level in sys.stdlib_module_names:
+        return True
+    try:
+        spec = find_spec(top_level)
+    except ValueError:
+        # `__main__` and the modules created at runtime have no spec.
+        return False
+    if not spec:
+        return False
+
+    locations = list(spec.submodule_search_locations or [])
+    if spec.origin:
+        locations.append(spec.origin)
+    return any(_INSTALLED_PACKAGE_DIRS & set(Path(p).parts) for p in locations)
@@ -0,0 +1,152 @@
+"""Parsed modules kept in memory between compilations."""
+
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, replace
+from hashlib import sha256
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydantic2zod._trace import trace_span
+from pydantic2zod.model import ClassDecl
+
+if TYPE_CHECKING:
+    # networkx is slow to import.
+    from networkx import DiGraph
+
+_logger = logging.getLogger(__name__)
+
+ParsedModule = tuple[list[ClassDecl], list[str], "DiGraph"]
+"""Pydantic models, the models they depend on from other modules and the model
+graph of a single module."""
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    """Cached modules returned, including the ones touched but not modified."""
+    misses: int = 0
+    """Modules parsed as they were not cached or their source changed."""
+    evictions: int = 0
+    """Least recently used modules dropped to stay within the limits."""
+    entries: int = 0
+    size: int = 0
+    """Approximate memory in bytes taken by the cached modules."""
+
+
+@dataclass
+class _Entry:
+    mtime: tuple[int, int]
+    """Modification time and size of the source file."""
+    digest: str
+    parsed: ParsedModule
+    size: int
+    """Of the pickled parse results, approximately the memory they take."""
+
+
+class ModuleCache:
+    """Reuses parsed modules until their source files change.
+
+    The modification time is checked first and the content hash only when the time
+    differs, so touching a file without changing it doesn't trigger parsing.
+
+    Every `Compiler` keeps a cache of its own across `parse()` calls. Share one
+    between several compilers:
+
+    Usage:
+        cache = ModuleCache(max_entries=500)
+        Compiler(module_cache=cache).parse("my_pkg.models").to_zod()
+        # Parses only the files modified since.
+        Compiler(module_cache=cache).parse("my_pkg.models").to_zod()
+        print(cache.stats())
+    """
+
+    def __init__(
+        self, max_entries: int | None = 1000, max_bytes: int | None = None
+    ) -> None:
+        """
+        Args:
+            max_entries: the least recently used modules are evicted beyond this
+                many. `None` for no limit.
+            max_bytes: the same for the approximate size of the cached modules.
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._size = 0
+        self._stats = CacheStats()
+        # Compilers running in several threads may share the cache. Parsing is
+        # done outside the lock.
+        self._lock = threading.Lock()
+
+    def get_or_parse(
+        self, key: Hashable, fname: str, parse: Callable[[str], ParsedModule]
+    ) -> ParsedModule:
+        """
+        Args:
+            key: identifies the parse results, e.g. the same module might be parsed
+                for different models.
+            fname: the source file of the module.
+            parse: parses the given source code when it's not cached yet.
+
+        Returns:
+            the cached results themselves, the models are immutable and the
+            crawler doesn't modify the lists nor the graph.
+        """
+        stat = os.stat(fname)
+        mtime = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry.mtime == mtime:
+            return self._hit(key, entry, fname)
+
+        with trace_span("read_file", "io", file=fname):
+            source = Path(fname).read_text()
+        digest = sha256(source.encode()).hexdigest()
+        if entry and entry.digest == digest:
+            entry.mtime = mtime
+            return self._hit(key, entry, fname)
+
+        parsed = parse(source)
+        entry = _Entry(mtime, digest, parsed, len(pickle.dumps(parsed)))
+        with self._lock:
+            self._stats.misses += 1
+            self._put(key, entry)
+        return parsed
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return replace(self._stats, entries=len(self._entries), size=self._size)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _hit(self, key: Hashable, entry: _Entry, fname: str) -> ParsedModule:
+        _logger.debug("'%s' is up to date", fname)
+        with self._lock:
+            self._stats.hits += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return entry.parsed
+
+    def _put(self, key: Hashable, entry: _Entry) -> None:
+        if outdated := self._entries.pop(key, None):
+            self._size -= outdated.size
+        self._entries[key] = entry
+        self._size += entry.size
+        # The module just parsed stays even if it alone is over the limit.
+        while len(self._entries) > 1 and self._over_limits():
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+            self._stats.evictions += 1
+
+    def _over_limits(self) -> bool:
+        if self._max_entries is not None and len(self._entries) > self._max_entries:
+            return True
+        return self._max_bytes is not None and self._size > self._max_bytes
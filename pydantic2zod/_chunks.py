@@ -0,0 +1,226 @@
+"""Splits the generated zod code into several modules, so that bundlers could load
+the rarely used schemas lazily."""
+
+import logging
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+
+from pydantic2zod._codegen import (
+    LAZY_HELPER,
+    base_model,
+    base_models,
+    model_deps,
+    render_models,
+)
+from pydantic2zod._trace import trace_span
+from pydantic2zod.model import ClassDecl
+
+_logger = logging.getLogger(__name__)
+
+INDEX = "index"
+"""The module re-exporting every chunk."""
+_ROOT_CHUNK = "models"
+"""All the models when they fit the budget, the chunks are named after the packages
+otherwise."""
+_INDEX_HEADER = """
+/**
+ * NOTE: automatically generated by the pydantic2zod compiler.
+ */
+"""
+
+
+@dataclass(frozen=True)
+class Chunk:
+    name: str
+    """Also the module name, e.g. `billing.models` for `./billing.models.ts`."""
+    models: Sequence[ClassDecl]
+    """Dependencies first."""
+
+
+class ChunkedZodEmitter:
+    """Generates zod schemas split into chunks of about the given size.
+
+    The chunks follow the Python packages: a chunk holds the models of the largest
+    package or module which fits the budget, so a model stays in the same chunk
+    until its package outgrows the budget. A module too large on its own is split
+    in several chunks. Each chunk imports only the schemas it refers to.
+
+    Usage:
+        chunks = ChunkedZodEmitter(50_000).emit_chunks(models)
+        # {"index.ts": ..., "billing.models.ts": ..., "orders.ts": ...}
+    """
+
+    def __init__(
+        self,
+        max_chunk_size: int,
+        gen_header: Callable[[], str] | None = None,
+        lazy: bool = False,
+        interfaces: bool = False,
+    ) -> None:
+        """
+        Args:
+            max_chunk_size: of the models' code in bytes, without the imports. The
+                models that refer to each other in a cycle end up in the same chunk,
+                which might exceed the budget.
+            lazy, interfaces: see `ZodEmitter`.
+        """
+        self._max_chunk_size = max_chunk_size
+        self._gen_header = gen_header or (lambda: "")
+        self._lazy = lazy
+        self._interfaces = interfaces
+
+    def emit_chunks(self, models: list[ClassDecl]) -> dict[str, str]:
+        """
+        Returns:
+            file name -> code. `index.ts` re-exports every chunk.
+        """
+        with trace_span("ChunkedZodEmitter", "codegen", models=len(models)):
+            bases = base_models(models)
+            rendered = render_models(models, self._lazy, self._interfaces, bases)
+            code = {cls.name: c for cls, c in zip(models, rendered)}
+            chunks = split_into_chunks(
+                models,
+                lambda cls: len(code[cls.name].encode()),
+                self._max_chunk_size,
+                # The shapes of the base models are not exported.
+                inseparable_bases=self._interfaces,
+            )
+
+            files = {
+                f"{INDEX}.ts": "\n".join(
+                    [_INDEX_HEADER, *[f'export * from "./{c.name}";' for c in chunks]]
+                )
+                + "\n"
+            }
+            chunk_of = {cls.name: c.name for c in chunks for cls in c.models}
+            for chunk in chunks:
+                chunk_code = [self._gen_header()]
+                if imports := self._imports(chunk, chunk_of):
+                    chunk_code.append("\n".join(imports) + "\n")
+                if self._lazy:
+                    chunk_code.append(LAZY_HELPER)
+                chunk_code += [code[cls.name] for cls in chunk.models]
+                files[f"{chunk.name}.ts"] = "\n".join(chunk_code)
+            return files
+
+    def _imports(self, chunk: Chunk, chunk_of: dict[str, str]) -> list[str]:
+        imported: dict[str, set[str]] = {}
+        for cls in chunk.models:
+            for dep in model_deps(cls):
+                if (dep_chunk := chunk_of.get(dep, chunk.name)) != chunk.name:
+                    imported.setdefault(dep_chunk, set()).add(dep)
+
+        imports = []
+        for dep_chunk, names in sorted(imported.items()):
+            symbols = sorted(names)
+            if self._interfaces:
+                # The interfaces refer to each other's types too.
+                symbols = [*symbols, *[f"type {n}Type" for n in sorted(names)]]
+            imports.append(f'import {{ {", ".join(symbols)} }} from "./{dep_chunk}";')
+        return imports
+
+
+def split_into_chunks(
+    models: list[ClassDecl],
+    size_of: Callable[[ClassDecl], int],
+    max_chunk_size: int,
+    inseparable_bases: bool = False,
+) -> list[Chunk]:
+    """
+    Args:
+        models: dependencies first.
+        size_of: the size of the model's code.
+        inseparable_bases: keep the models in the same chunk as their bases.
+
+    Returns:
+        chunks sorted by name, each with the models in the given order.
+    """
+    paths = [(_module_path(cls), cls) for cls in models]
+    chunk_of: dict[str, str] = {}
+    for name, chunk_models in _split_package((), paths, size_of, max_chunk_size):
+        chunk_of |= {cls.name: name for cls in chunk_models}
+    chunk_of = _merge_cycles(models, chunk_of, inseparable_bases)
+
+    chunks: dict[str, list[ClassDecl]] = {}
+    for cls in models:
+        chunks.setdefault(chunk_of[cls.name], []).append(cls)
+    return [Chunk(name, chunks[name]) for name in sorted(chunks)]
+
+
+_ModulePath = tuple[str, ...]
+
+
+def _module_path(cls: ClassDecl) -> _ModulePath:
+    module = cls.full_path.rpartition(".")[0]
+    return tuple(module.split(".")) if module else ()
+
+
+def _split_package(
+    package: _ModulePath,
+    models: list[tuple[_ModulePath, ClassDecl]],
+    size_of: Callable[[ClassDecl], int],
+    max_chunk_size: int,
+) -> Iterator[tuple[str, list[ClassDecl]]]:
+    """The whole package when it fits the budget, otherwise its modules and
+    subpackages one by one."""
+    name = ".".join(package) or _ROOT_CHUNK
+    if sum(size_of(cls) for _, cls in models) <= max_chunk_size:
+        yield name, [cls for _, cls in models]
+        return
+
+    # Models declared in the package's `__init__` or in the module itself.
+    own_models = [cls for path, cls in models if path == package]
+    for part, part_models in enumerate(
+        _split_module(own_models, size_of, max_chunk_size)
+    ):
+        # Module names can't start with a digit, so no clashes with submodules.
+        yield (f"{name}.{part + 1}" if part else name), part_models
+
+    submodules: dict[str, list[tuple[_ModulePath, ClassDecl]]] = {}
+    for path, cls in models:
+        if path != package:
+            submodules.setdefault(path[len(package)], []).append((path, cls))
+    for submodule in sorted(submodules):
+        yield from _split_package(
+            (*package, submodule), submodules[submodule], size_of, max_chunk_size
+        )
+
+
+def _split_module(
+    models: list[ClassDecl], size_of: Callable[[ClassDecl], int], max_chunk_size: int
+) -> list[list[ClassDecl]]:
+    """Consecutive models, so the later parts depend only on the earlier ones."""
+    parts: list[list[ClassDecl]] = []
+    size = 0
+    for cls in models:
+        if not parts or size + size_of(cls) > max_chunk_size:
+            parts.append([])
+            size = 0
+        parts[-1].append(cls)
+        size += size_of(cls)
+    return parts
+
+
+def _merge_cycles(
+    models: list[ClassDecl], chunk_of: dict[str, str], inseparable_bases: bool
+) -> dict[str, str]:
+    """ES modules importing each other would access the schemas before they are
+    declared, so the chunks in a cycle are merged."""
+    # networkx is slow to import.
+    from networkx import DiGraph, strongly_connected_components
+
+    graph = DiGraph()
+    graph.add_nodes_from(chunk_of.values())
+    for cls in models:
+        for dep in model_deps(cls):
+            if dep in chunk_of:
+                graph.add_edge(chunk_of[cls.name], chunk_of[dep])
+        if inseparable_bases and (base := base_model(cls)) in chunk_of:
+            graph.add_edge(chunk_of[base], chunk_of[cls.name])
+
+    merged_into: dict[str, str] = {}
+    for cycle in strongly_connected_components(graph):
+        if len(cycle) > 1:
+            _logger.info("Merged chunks importing each other: %s", sorted(cycle))
+        merged_into |= {chunk: min(cycle) for chunk in cycle}
+    return {name: merged_into[chunk] for name, chunk in chunk_of.items()}
@@ -1,17 +1,30 @@
 """Produces valid TypeScript code - `zod` declarations."""
 
 import logging
-from typing import Callable
-
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
+from hashlib import sha256
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, Protocol, cast
+
+from pydantic2zod._memory import memory_phase
+from pydantic2zod._rename import RenameRules
+from pydantic2zod._trace import trace_span, worker_result, worker_task
+from pydantic2zod._transform import map_field_types, replace_types
 from pydantic2zod.model import (
     AnnotatedType,
     AnyType,
     BuiltinType,
     ClassDecl,
     ClassField,
+    EnumDecl,
     GenericType,
+    KnownType,
     LiteralType,
     PrimitiveType,
+    PyBool,
     PydanticField,
     PyDict,
     PyFloat,
@@ -27,11 +40,29 @@ from pydantic2zod.model import (
     UserDefinedType,
 )
 
+if TYPE_CHECKING:
+    from pydantic2zod._chunks import ChunkedZodEmitter
+
 _logger = logging.getLogger(__name__)
 
 
+class Emitter(Protocol):
+    """Generates code of some kind from the parsed models."""
+
+    def emit(self, models: list[ClassDecl]) -> str:
+        """
+        Args:
+            models: sorted so that dependencies come first. Must not be modified as
+                the other emitters generate code from the same models.
+        """
+        ...
+
+
 class Codegen:
-    """Adjustable zod code generator."""
+    """Adjustable zod code generator.
+
+    Models are renamed and modified once and then passed to one or more emitters.
+    """
 
     def __init__(
         self,
@@ -39,46 +70,298 @@ class Codegen:
         modify_models: Callable[[list[ClassDecl]], list[ClassDecl]] | None = None,
         gen_header: Callable[[], str] | None = None,
     ) -> None:
-        self._model_rename_rules = model_rename_rules or {}
-        self._modify_models = modify_models or (lambda m: m)
+        """
+        Args:
+            modify_models: returns the modified models, e.g. created with
+                `dataclasses.replace()`.
+        """
+        self._rename_rules = RenameRules(model_rename_rules or {})
+        self._modify_models = modify_models
         self._gen_header = gen_header or (lambda: "")
 
-    def to_zod(self, pydantic_models: list[ClassDecl]) -> str:
-        self._apply_model_rename_rules(pydantic_models)
-        models = self._modify_models(pydantic_models)
+    def to_zod(
+        self,
+        pydantic_models: list[ClassDecl],
+        lazy: bool = False,
+        interfaces: bool = False,
+        executor: Executor | None = None,
+    ) -> str:
+        """See `ZodEmitter`."""
+        emitter = ZodEmitter(self._gen_header, lazy, interfaces, executor)
+        return self.emit(pydantic_models, [emitter])[0]
+
+    def emit(
+        self, pydantic_models: list[ClassDecl], emitters: Sequence[Emitter]
+    ) -> list[str]:
+        """Run every emitter over the same models.
+
+        The models are immutable, so code could be generated from the same ones
+        again with other settings or concurrently.
+
+        Returns:
+            code generated by each emitter.
+        """
+        with memory_phase("codegen"):
+            models = self._prepare_models(pydantic_models)
+            return [_emit(e, models) for e in emitters]
+
+    def emit_chunks(
+        self, pydantic_models: list[ClassDecl], emitter: "ChunkedZodEmitter"
+    ) -> dict[str, str]:
+        """Same as `emit()` for the zod code split into several files.
+
+        Returns:
+            file name -> code.
+        """
+        with memory_phase("codegen"):
+            return emitter.emit_chunks(self._prepare_models(pydantic_models))
+
+    def emit_fragments(
+        self, pydantic_models: list[ClassDecl], emitter: "ZodEmitter"
+    ) -> list["Fragment"]:
+        """Same as `emit()` for the code of each model on its own."""
+        with memory_phase("codegen"):
+            models = self._prepare_models(pydantic_models)
+            with trace_span("ZodEmitter", "codegen", models=len(models)):
+                return emitter.emit_fragments(models)
+
+    def _prepare_models(self, pydantic_models: list[ClassDecl]) -> list[ClassDecl]:
+        models = self._apply_model_rename_rules(pydantic_models)
+        if self._modify_models:
+            models = self._modify_models(models)
         _warn_about_duplicate_models(models)
+        return [m for m in models if not m.name.startswith("_")]
+
+    def _apply_model_rename_rules(
+        self, pydantic_models: list[ClassDecl]
+    ) -> list[ClassDecl]:
+        """
+        Returns:
+            the models which are not renamed and don't refer to the renamed ones
+            are the same objects.
+        """
+        if not self._rename_rules:
+            return pydantic_models
+
+        models = map_field_types(
+            pydantic_models, lambda tp: replace_types(tp, self._renamed_type)
+        )
+        return [
+            replace(m, name=new_name)
+            if (new_name := self._rename_rules.rename(m.full_path))
+            else m
+            for m in models
+        ]
+
+    def _renamed_type(self, type_name: str) -> UserDefinedType | None:
+        if new_name := self._rename_rules.rename(type_name):
+            return UserDefinedType(name=new_name)
+        return None
+
+
+def _emit(emitter: Emitter, models: list[ClassDecl]) -> str:
+    with trace_span(type(emitter).__name__, "codegen", models=len(models)):
+        return emitter.emit(models)
+
+
+class ZodEmitter:
+    """Generates zod schemas."""
+
+    def __init__(
+        self,
+        gen_header: Callable[[], str] | None = None,
+        lazy: bool = False,
+        interfaces: bool = False,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        Args:
+            lazy: export every schema behind a memoized accessor, `Model()`, so that
+                it is only constructed on first use together with the schemas it
+                depends on.
+            interfaces: declare `export interface ModelType` from the model itself
+                and annotate the schema as `z.ZodType<ModelType>` instead of
+                inferring the type with `z.infer`.
+            executor: generate the code for the models in parallel, e.g. in a
+                `ProcessPoolExecutor`. The output is the same as without it.
+        """
+        self._gen_header = gen_header or (lambda: "")
+        self._lazy = lazy
+        self._interfaces = interfaces
+        self._executor = executor
+
+    def emit(self, models: list[ClassDecl]) -> str:
+        return "\n".join([self.header(), *self._render(models)])
+
+    def emit_fragments(self, models: list[ClassDecl]) -> list["Fragment"]:
+        """The code of each model on its own, without the header. Same as `emit()`
+        otherwise, e.g. to update only the changed models in the generated file.
+        """
+        return [
+            Fragment(cls.name, code.rstrip("\n"), tuple(sorted(model_deps(cls))))
+            for cls, code in zip(models, self._render(models))
+        ]
+
+    def header(self) -> str:
+        """Precedes the models' code."""
+        code = [self._gen_header()]
+        if self._lazy:
+            code.append(LAZY_HELPER)
+        return "\n".join(code)
+
+    def _render(self, models: list[ClassDecl]) -> list[str]:
+        render = partial(
+            render_models,
+            lazy=self._lazy,
+            interfaces=self._interfaces,
+            base_models=base_models(models),
+        )
+        if self._executor is None:
+            return render(models)
+
+        batch_size = max(_MIN_BATCH_SIZE, len(models) // _BATCHES_PER_EMIT + 1)
+        batches = _batches(models, batch_size)
+        return list(
+            chain(*map(worker_result, self._executor.map(worker_task(render), batches)))
+        )
+
+
+@dataclass(frozen=True)
+class Fragment:
+    """The generated code of a single model."""
+
+    name: str
+    code: str
+    depends_on: Sequence[str] = ()
+    """The models the code refers to, which must be declared before it unless the
+    schemas are lazy."""
+
+    @property
+    def digest(self) -> str:
+        """Changes only when the code does."""
+        return sha256(self.code.encode()).hexdigest()[:16]
+
+
+_MIN_BATCH_SIZE = 50
+"""Smaller batches spend more time sending the models to the workers than rendering
+them."""
+_BATCHES_PER_EMIT = 16
 
+
+def _batches(models: list[ClassDecl], size: int) -> list[list[ClassDecl]]:
+    return [models[i : i + size] for i in range(0, len(models), max(size, 1))]
+
+
+def base_models(models: list[ClassDecl]) -> dict[str, frozenset[str]]:
+    """Models other models inherit from: with interfaces their schemas are typed as
+    plain `z.ZodType` which can't be `.extend()`ed, so we share the shape.
+
+    Returns:
+        base model -> its fields, inherited ones included, which the subclasses'
+        interfaces must omit to override.
+    """
+    classes = {cls.name: cls for cls in models if not isinstance(cls, EnumDecl)}
+    bases: dict[str, frozenset[str]] = {}
+    for cls in classes.values():
+        if (base := base_model(cls)) is None or base in bases:
+            continue
+        fields, seen = set[str](), set[str]()
+        ancestor = base
+        while ancestor is not None and ancestor in classes and ancestor not in seen:
+            seen.add(ancestor)
+            if ancestor in bases:
+                fields |= bases[ancestor]
+                break
+            fields.update(f.name for f in classes[ancestor].fields)
+            ancestor = base_model(classes[ancestor])
+        bases[base] = frozenset(fields)
+    return bases
+
+
+def render_models(
+    models: list[ClassDecl],
+    lazy: bool,
+    interfaces: bool,
+    base_models: Mapping[str, frozenset[str]],
+) -> list[str]:
+    """The code of each model, independent of the other models, so that batches
+    could be rendered in parallel and joined."""
+    rendered = []
+    for cls in models:
         code = Lines()
-        code.add(self._gen_header())
+        with trace_span("codegen_model", "codegen", model=cls.name):
+            if isinstance(cls, EnumDecl):
+                _enum_to_zod(cls, code, lazy)
+            elif interfaces:
+                _class_to_ts_interface(cls, code, base_models)
+                _class_to_annotated_zod(cls, code, lazy, cls.name in base_models)
+            else:
+                _class_to_zod(cls, code, lazy)
+        code.add("")
+        rendered.append(str(code))
+    return rendered
+
+
+def model_deps(cls: ClassDecl) -> set[str]:
+    """Names of the models referred to by the model's code."""
+    if isinstance(cls, EnumDecl):
+        return set()
+    deps = set(chain(*[_referenced_models(f.type) for f in cls.fields]))
+    if base := base_model(cls):
+        deps.add(base)
+    return deps
+
 
+def base_model(cls: ClassDecl) -> str | None:
+    """The model extended by the model's schema."""
+    if isinstance(cls, EnumDecl) or not cls.base_classes:
+        return None
+    base = cls.base_classes[0]
+    return None if base in ["BaseModel", "GenericModel"] else base
+
+
+def _referenced_models(field_type: PyType) -> Iterator[str]:
+    match field_type:
+        case UserDefinedType(name=name):
+            # As rendered by the codegen.
+            yield name.split(".")[-1]
+        case (
+            GenericType(type_vars=types)
+            | UnionType(types=types)
+            | TupleType(types=types)
+        ):
+            for tp in types:
+                yield from _referenced_models(tp)
+        case AnnotatedType(type_=type_):
+            yield from _referenced_models(type_)
+        case _:
+            ...
+
+
+class TsTypesEmitter:
+    """Generates plain TypeScript types: an interface per model and a union of
+    values per enum, named like the types exported along with zod schemas."""
+
+    def emit(self, models: list[ClassDecl]) -> str:
+        code = Lines()
+        code.add(_TS_TYPES_HEADER)
+
+        bases = base_models(models)
         for cls in models:
-            if not cls.name.startswith("_"):
-                _class_to_zod(cls, code)
-                code.add("")
+            if isinstance(cls, EnumDecl):
+                _enum_to_ts_type(cls, code)
+            else:
+                _class_to_ts_interface(cls, code, bases)
+            code.add("")
 
         return str(code)
 
-    def _apply_model_rename_rules(self, pydantic_models: list[ClassDecl]) -> None:
-        for model in pydantic_models:
-            if new_name := self._model_rename_rules.get(model.full_path):
-                model.name = new_name
-
-            for field in model.fields:
-                self._rename_models_in_fields(field.type)
-
-    def _rename_models_in_fields(self, field_type: PyType) -> None:
-        match field_type:
-            case UserDefinedType(name=type_name):
-                if new_name := self._model_rename_rules.get(type_name):
-                    field_type.name = new_name
-            case GenericType(type_vars=type_vars):
-                for type_var in type_vars:
-                    self._rename_models_in_fields(type_var)
-            case UnionType(types=types):
-                for type_ in types:
-                    self._rename_models_in_fields(type_)
-            case _:
-                ...
+
+_TS_TYPES_HEADER = """
+/**
+ * NOTE: automatically generated by the pydantic2zod compiler.
+ */
+"""
 
 
 def _warn_about_duplicate_models(models: list[ClassDecl]) -> None:
@@ -94,24 +377,157 @@ def _warn_about_duplicate_models(models: list[ClassDecl]) -> None:
         )
 
 
-def _class_to_zod(cls: ClassDecl, code: "Lines") -> None:
+LAZY_HELPER = """/** Builds the schema on first use and reuses it afterwards. */
+function _lazy<T>(build: () => T): () => T {
+  let schema: T | undefined;
+  return () => (schema ??= build());
+}
+"""
+
+
+def _class_to_zod(cls: ClassDecl, code: "Lines", lazy: bool = False) -> None:
     if comment := cls.comment:
         _comment_to_ts(comment, code)
 
     if cls.base_classes[0] in ["BaseModel", "GenericModel"]:
         constructor = "z.object({"
     else:
-        constructor = f"{cls.base_classes[0]}.extend({{"
+        constructor = f"{_schema_ref(cls.base_classes[0], lazy)}.extend({{"
 
-    code.add(f"export const {cls.name} = {constructor}")
+    if lazy:
+        code.add(f"export const {cls.name} = _lazy(() => {constructor}")
+    else:
+        code.add(f"export const {cls.name} = {constructor}")
 
     with code as indent_code:
         for f in cls.fields:
-            _class_field_to_zod(f, indent_code)
+            _class_field_to_zod(f, indent_code, lazy)
             code.add(",", inline=True)
 
-    code.add("}).strict();")
-    code.add(f"export type {cls.name}Type = z.infer<typeof {cls.name}>;")
+    code.add("}).strict());" if lazy else "}).strict();")
+    _type_to_ts(cls.name, code, lazy)
+
+
+def _class_to_annotated_zod(
+    cls: ClassDecl, code: "Lines", lazy: bool, is_base: bool
+) -> None:
+    """Generate the zod schema checked against the interface declared up front."""
+    schema_type = f"z.ZodType<{cls.name}Type, z.ZodTypeDef, unknown>"
+    if lazy:
+        declaration = f"export const {cls.name}: () => {schema_type} = _lazy(() => "
+    else:
+        declaration = f"export const {cls.name}: {schema_type} = "
+    closing = ")" if lazy else ""
+
+    if is_base:
+        shape = f"_{cls.name}Shape"
+        code.add(f"const {shape} = _lazy(() => ({{" if lazy else f"const {shape} = {{")
+        _class_fields_to_zod(cls, code, lazy)
+        code.add("}));" if lazy else "};")
+        code.add(
+            f"{declaration}z.object({_schema_ref(shape, lazy)}).strict(){closing};"
+        )
+    else:
+        code.add(f"{declaration}z.object({{")
+        _class_fields_to_zod(cls, code, lazy)
+        code.add(f"}}).strict(){closing};")
+
+
+def _class_fields_to_zod(cls: ClassDecl, code: "Lines", lazy: bool) -> None:
+    with code as indent_code:
+        if cls.base_classes[0] not in ["BaseModel", "GenericModel"]:
+            base_shape = _schema_ref(f"_{cls.base_classes[0]}Shape", lazy)
+            indent_code.add(f"...{base_shape},")
+        for f in cls.fields:
+            _class_field_to_zod(f, indent_code, lazy)
+            code.add(",", inline=True)
+
+
+def _class_to_ts_interface(
+    cls: ClassDecl, code: "Lines", base_models: Mapping[str, frozenset[str]]
+) -> None:
+    if comment := cls.comment:
+        _comment_to_ts(comment, code)
+
+    if (base := base_model(cls)) is None:
+        code.add(f"export interface {cls.name}Type {{")
+    elif overridden := [
+        f'"{f.name}"' for f in cls.fields if f.name in base_models.get(base, ())
+    ]:
+        # An interface can't change the type of an inherited property.
+        omitted = " | ".join(overridden)
+        code.add(
+            f"export interface {cls.name}Type extends Omit<{base}Type, {omitted}> {{"
+        )
+    else:
+        code.add(f"export interface {cls.name}Type extends {base}Type {{")
+
+    with code as indent_code:
+        for f in cls.fields:
+            # zod infers keys which accept `undefined` as optional.
+            optional = "?" if _accepts_undefined(f.type) else ""
+            ts_type = _class_field_type_to_ts(f.type)
+            indent_code.add(f"{f.name}{optional}: {ts_type};")
+
+    code.add("}")
+
+
+def _enum_to_ts_type(enum: EnumDecl, code: "Lines") -> None:
+    if comment := enum.comment:
+        _comment_to_ts(comment, code)
+
+    code.add(f"export type {enum.name}Type =")
+    with code as indent_code:
+        for member in enum.members:
+            indent_code.add("| ")
+            _value_to_zod(member.value, indent_code)
+    code.add(";", inline=True)
+
+
+def _enum_to_zod(enum: EnumDecl, code: "Lines", lazy: bool = False) -> None:
+    if comment := enum.comment:
+        _comment_to_ts(comment, code)
+
+    declaration = f"export const {enum.name} = "
+    if lazy:
+        declaration += "_lazy(() => "
+    closing = ")" if lazy else ""
+
+    values = [m.value for m in enum.members]
+    if all(isinstance(v, PyString) for v in values):
+        code.add(declaration)
+        _literal_enum_to_zod([cast(PyString, v).value for v in values], code)
+        code.add(f"{closing};", inline=True)
+    else:
+        code.add(f"{declaration}z.nativeEnum({{")
+        with code as indent_code:
+            for member in enum.members:
+                indent_code.add(f"{member.name}: ")
+                _value_to_zod(member.value, indent_code)
+                indent_code.add(",", inline=True)
+        code.add(f"}} as const){closing};")
+
+    _type_to_ts(enum.name, code, lazy)
+
+
+def _type_to_ts(name: str, code: "Lines", lazy: bool) -> None:
+    if lazy:
+        code.add(f"export type {name}Type = z.infer<ReturnType<typeof {name}>>;")
+    else:
+        code.add(f"export type {name}Type = z.infer<typeof {name}>;")
+
+
+def _schema_ref(name: str, lazy: bool) -> str:
+    """Reference another schema declared in the generated module."""
+    return f"{name}()" if lazy else name
+
+
+def _literal_enum_to_zod(values: list[str], code: "Lines") -> None:
+    code.add("z.enum([", inline=True)
+    with code as indent_code:
+        for v in values:
+            indent_code.add(f'"{v}",')
+    code.add("])")
 
 
 def _comment_to_ts(comment: str, code: "Lines") -> None:
@@ -126,12 +542,12 @@ def _comment_to_ts(comment: str, code: "Lines") -> None:
     code.add(" */")
 
 
-def _class_field_to_zod(field: ClassField, code: "Lines") -> None:
+def _class_field_to_zod(field: ClassField, code: "Lines", lazy: bool = False) -> None:
     if comment := field.comment:
         _comment_to_ts(comment, code)
 
     code.add(f"{field.name}: ")
-    _class_field_type_to_zod(field.type, None, code)
+    code.add_block(_render_field_type(field.type, lazy))
 
     if default := field.default_value:
         code.add(".default(", inline=True)
@@ -147,6 +563,8 @@ def _value_to_zod(pyval: PyValue, code: "Lines") -> None:
             code.add(value, inline=True)
         case PyNone():
             code.add("null", inline=True)
+        case PyBool(value=value):
+            code.add("true" if value else "false", inline=True)
         case PyName(value=name):
             code.add(name, inline=True)
         case PyDict():
@@ -157,99 +575,290 @@ def _value_to_zod(pyval: PyValue, code: "Lines") -> None:
             raise AssertionError(f"Unsupported value type: '{other}'")
 
 
+@lru_cache(maxsize=4096)
+def _render_field_type(field_type: PyType, lazy: bool) -> str:
+    """Large models repeat the same few field types over and over, so the rendered
+    code is reused for the structurally equal types."""
+    code = Lines()
+    code.add("")
+    _class_field_type_to_zod(field_type, None, code, lazy)
+    return str(code)
+
+
 def _class_field_type_to_zod(
-    field_type: PyType, type_constraints: PydanticField | None, code: "Lines"
+    field_type: PyType,
+    type_constraints: PydanticField | None,
+    code: "Lines",
+    lazy: bool = False,
+) -> None:
+    render = _FIELD_TYPE_TO_ZOD.get(type(field_type))
+    if render is None:
+        raise AssertionError(f"Unsupported field type: '{field_type}'")
+    render(field_type, type_constraints, code, lazy)
+
+
+def _builtin_type_to_zod(
+    field_type: BuiltinType | PrimitiveType,
+    type_constraints: PydanticField | None,
+    code: "Lines",
+    lazy: bool,
+) -> None:
+    match type_name := field_type.name:
+        case "str":
+            code.add("z.string()", inline=True)
+
+        case "int" | "float":
+            code.add("z.number()", inline=True)
+            if type_name == "int":
+                code.add(".int()", inline=True)
+            if type_constraints:
+                if type_constraints.gt is not None:
+                    code.add(".gt(", inline=True)
+                    _value_to_zod(type_constraints.gt, code)
+                    code.add(")", inline=True)
+                if type_constraints.ge is not None:
+                    code.add(".gte(", inline=True)
+                    _value_to_zod(type_constraints.ge, code)
+                    code.add(")", inline=True)
+                if type_constraints.lt is not None:
+                    code.add(".lt(", inline=True)
+                    _value_to_zod(type_constraints.lt, code)
+                    code.add(")", inline=True)
+                if type_constraints.le is not None:
+                    code.add(".lte(", inline=True)
+                    _value_to_zod(type_constraints.le, code)
+                    code.add(")", inline=True)
+
+        case "None":
+            code.add("z.null()", inline=True)
+        case "bool":
+            code.add("z.boolean()", inline=True)
+        case "dict":
+            code.add("z.record(z.any())", inline=True)
+        case "list":
+            code.add("z.array(z.any())", inline=True)
+        case other:
+            raise AssertionError(f"Unsupported field type: '{other}'")
+
+
+def _literal_type_to_zod(
+    field_type: LiteralType,
+    type_constraints: PydanticField | None,
+    code: "Lines",
+    lazy: bool,
+) -> None:
+    code.add(f'z.literal("{field_type.value}")', inline=True)
+
+
+def _union_type_to_zod(
+    field_type: UnionType,
+    type_constraints: PydanticField | None,
+    code: "Lines",
+    lazy: bool,
+) -> None:
+    types = field_type.types
+    literals = _literal_values(types)
+    if len(literals) <= 1:
+        _types_list_to_zod("union", types, type_constraints, code, lazy)
+        return
+
+    # Literal["a", "b", ...] is a set of strings: z.enum() validates it with a
+    # single lookup instead of trying each z.literal() one by one.
+    other_types = [t for t in types if not isinstance(t, LiteralType)]
+    if not other_types:
+        _literal_enum_to_zod(literals, code)
+        return
+
+    code.add("z.union([", inline=True)
+    with code as indent_code:
+        code.add("")
+        _literal_enum_to_zod(literals, indent_code)
+        code.add(",", inline=True)
+        for tp in other_types:
+            code.add("")
+            _class_field_type_to_zod(tp, type_constraints, indent_code, lazy)
+            code.add(",", inline=True)
+    code.add("])")
+
+
+def _tuple_type_to_zod(
+    field_type: TupleType,
+    type_constraints: PydanticField | None,
+    code: "Lines",
+    lazy: bool,
+) -> None:
+    _types_list_to_zod("tuple", field_type.types, type_constraints, code, lazy)
+
+
+def _types_list_to_zod(
+    zod_obj: str,
+    types: Sequence[PyType],
+    type_constraints: PydanticField | None,
+    code: "Lines",
+    lazy: bool,
+) -> None:
+    code.add(f"z.{zod_obj}([", inline=True)
+    with code as indent_code:
+        code.add("")
+        for i, tp in enumerate(types):
+            _class_field_type_to_zod(tp, type_constraints, indent_code, lazy)
+            code.add(",", inline=True)
+            if i < len(types) - 1:
+                code.add("")
+    code.add("])")
+
+
+def _generic_type_to_zod(
+    field_type: GenericType,
+    type_constraints: PydanticField | None,
+    code: "Lines",
+    lazy: bool,
 ) -> None:
+    match field_type.generic:
+        case "dict":
+            code.add("z.record(", inline=True)
+        case "list":
+            code.add("z.array(", inline=True)
+        case "tuple":
+            code.add("z.tuple(", inline=True)
+        case other:
+            raise AssertionError(f"Unsupported generic type: '{other}'")
+
+    type_vars = field_type.type_vars
+    for i, tv in enumerate(type_vars):
+        _class_field_type_to_zod(tv, type_constraints, code, lazy)
+        if i < len(type_vars) - 1:
+            code.add(", ", inline=True)
+    code.add(")", inline=True)
+
+
+def _user_defined_type_to_zod(
+    field_type: UserDefinedType,
+    type_constraints: PydanticField | None,
+    code: "Lines",
+    lazy: bool,
+) -> None:
+    type_name = field_type.name.split(".")[-1]
+    code.add(_schema_ref(type_name, lazy), inline=True)
+
+
+def _known_type_to_zod(
+    field_type: KnownType,
+    type_constraints: PydanticField | None,
+    code: "Lines",
+    lazy: bool,
+) -> None:
+    code.add(field_type.zod, inline=True)
+
+
+def _any_type_to_zod(
+    field_type: AnyType,
+    type_constraints: PydanticField | None,
+    code: "Lines",
+    lazy: bool,
+) -> None:
+    code.add("z.any()", inline=True)
+
+
+def _annotated_type_to_zod(
+    field_type: AnnotatedType,
+    type_constraints: PydanticField | None,
+    code: "Lines",
+    lazy: bool,
+) -> None:
+    _class_field_type_to_zod(field_type.type_, field_type.metadata, code, lazy)
+
+
+_FIELD_TYPE_TO_ZOD: dict[
+    type, Callable[[Any, PydanticField | None, "Lines", bool], None]
+] = {
+    BuiltinType: _builtin_type_to_zod,
+    PrimitiveType: _builtin_type_to_zod,
+    LiteralType: _literal_type_to_zod,
+    UnionType: _union_type_to_zod,
+    TupleType: _tuple_type_to_zod,
+    GenericType: _generic_type_to_zod,
+    UserDefinedType: _user_defined_type_to_zod,
+    KnownType: _known_type_to_zod,
+    AnyType: _any_type_to_zod,
+    AnnotatedType: _annotated_type_to_zod,
+}
+"""Renders the zod schema of each `PyType` subclass."""
+
+
+def _class_field_type_to_ts(field_type: PyType) -> str:
+    """TypeScript equivalent of the type `_class_field_type_to_zod()` validates."""
     match field_type:
         case BuiltinType(name=type_name) | PrimitiveType(name=type_name):
             match type_name:
                 case "str":
-                    code.add("z.string()", inline=True)
-
+                    return "string"
                 case "int" | "float":
-                    code.add("z.number()", inline=True)
-                    if type_name == "int":
-                        code.add(".int()", inline=True)
-                    if type_constraints:
-                        if type_constraints.gt is not None:
-                            code.add(".gt(", inline=True)
-                            _value_to_zod(type_constraints.gt, code)
-                            code.add(")", inline=True)
-                        if type_constraints.ge is not None:
-                            code.add(".gte(", inline=True)
-                            _value_to_zod(type_constraints.ge, code)
-                            code.add(")", inline=True)
-                        if type_constraints.lt is not None:
-                            code.add(".lt(", inline=True)
-                            _value_to_zod(type_constraints.lt, code)
-                            code.add(")", inline=True)
-                        if type_constraints.le is not None:
-                            code.add(".lte(", inline=True)
-                            _value_to_zod(type_constraints.le, code)
-                            code.add(")", inline=True)
-
+                    return "number"
                 case "None":
-                    code.add("z.null()", inline=True)
+                    return "null"
                 case "bool":
-                    code.add("z.boolean()", inline=True)
+                    return "boolean"
                 case "dict":
-                    code.add("z.record(z.any())", inline=True)
+                    return "Record<string, any>"
                 case "list":
-                    code.add("z.array(z.any())", inline=True)
+                    return "Array<any>"
                 case other:
                     raise AssertionError(f"Unsupported field type: '{other}'")
 
         case LiteralType(value=value):
-            code.add(f'z.literal("{value}")', inline=True)
+            return f'"{value}"'
 
-        case UnionType(types=types) | TupleType(types=types):
-            zod_obj = "union" if isinstance(field_type, UnionType) else "tuple"
-            code.add(f"z.{zod_obj}([", inline=True)
-            with code as indent_code:
-                code.add("")
-                for i, tp in enumerate(types):
-                    _class_field_type_to_zod(tp, type_constraints, indent_code)
-                    code.add(",", inline=True)
-                    if i < len(types) - 1:
-                        code.add("")
-            code.add("])")
+        case UnionType(types=types):
+            return " | ".join(_class_field_type_to_ts(tp) for tp in types)
+
+        case TupleType(types=types):
+            return f"[{', '.join(_class_field_type_to_ts(tp) for tp in types)}]"
 
         case GenericType(generic=generic, type_vars=type_vars):
+            args = ", ".join(_class_field_type_to_ts(tv) for tv in type_vars)
             match generic:
                 case "dict":
-                    code.add("z.record(", inline=True)
+                    return f"Record<{args}>"
                 case "list":
-                    code.add("z.array(", inline=True)
+                    return f"Array<{args}>"
                 case "tuple":
-                    code.add("z.tuple(", inline=True)
+                    return f"[{args}]"
                 case other:
                     raise AssertionError(f"Unsupported generic type: '{other}'")
 
-            for i, tv in enumerate(type_vars):
-                _class_field_type_to_zod(tv, type_constraints, code)
-                if i < len(type_vars) - 1:
-                    code.add(", ", inline=True)
-            code.add(")", inline=True)
-
         case UserDefinedType(name=type_name):
-            if type_name == "uuid.UUID":
-                code.add("z.string().uuid()", inline=True)
-            elif type_name == "datetime.datetime":
-                code.add("z.string().datetime()", inline=True)
-            else:
-                type_name = type_name.split(".")[-1]
-                code.add(type_name, inline=True)
+            return f"{type_name.split('.')[-1]}Type"
+
+        case KnownType(ts=ts):
+            return ts
 
         case AnyType():
-            code.add("z.any()", inline=True)
+            return "any"
 
-        case AnnotatedType(type_=type_, metadata=metadata):
-            _class_field_type_to_zod(type_, metadata, code)
+        case AnnotatedType(type_=type_):
+            return _class_field_type_to_ts(type_)
 
         case other:
             raise AssertionError(f"Unsupported field type: '{other}'")
 
 
+def _accepts_undefined(field_type: PyType) -> bool:
+    match field_type:
+        case AnyType():
+            return True
+        case UnionType(types=types):
+            return any(_accepts_undefined(tp) for tp in types)
+        case AnnotatedType(type_=type_):
+            return _accepts_undefined(type_)
+        case _:
+            return False
+
+
+def _literal_values(types: Sequence[PyType]) -> list[str]:
+    return [t.value for t in types if isinstance(t, LiteralType)]
+
+
 class Lines:
     """A helper to deal with indentation."""
 
@@ -271,5 +880,16 @@ class Lines:
         else:
             self._lines.append(" " * self._indent + text)
 
+    def add_block(self, text: str) -> None:
+        """Add multiline text inline, indenting all but the first line."""
+        if "\n" not in text:
+            self._lines[-1] += text
+            return
+
+        first, *rest = text.split("\n")
+        self._lines[-1] += first
+        indent = " " * self._indent
+        self._lines.extend(indent + ln for ln in rest)
+
     def __str__(self) -> str:
         return "\n".join(self._lines)
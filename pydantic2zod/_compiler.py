@@ -1,11 +1,21 @@
-from importlib import import_module
+import asyncio
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor
+from functools import partial
+from pathlib import Path
 from typing import ClassVar
 
 from typing_extensions import Self
 
-from pydantic2zod._codegen import Codegen
-from pydantic2zod._parser import parse
-from pydantic2zod.model import ClassDecl
+from pydantic2zod import _ir
+from pydantic2zod._boundaries import CrawlBoundaries
+from pydantic2zod._cache import ModuleCache
+from pydantic2zod._codegen import Codegen, Emitter, Fragment, ZodEmitter
+from pydantic2zod._known_types import KNOWN_TYPES
+from pydantic2zod._memory import memory_phase
+from pydantic2zod._splice import splice
+from pydantic2zod._trace import trace_span
+from pydantic2zod.model import ClassDecl, KnownType
 
 
 class Compiler:
@@ -22,6 +32,11 @@ class Compiler:
     qualified name:
 
         pkg.module.ModelName -> Model1
+        billing.v2.*Response -> V2$1
+        legacy.**.* -> Legacy$2
+
+    See `pydantic2zod/_rename.py` for the syntax, regular expressions are supported
+    too.
     """
 
     IGNORE_TYPES: ClassVar[set[str]] = set()
@@ -30,28 +45,329 @@ class Compiler:
     .e.g. `pkg1.module1.MyType` - say when `MyType` is a deeply nested
     complicated type that pydantic2zod is not capable of parsing, we can
     tell the parser to ignore parsing it and instead use `Any` type.
+
+    `vendor.sdk.*` ignores every type in `vendor.sdk` and its subpackages. Their
+    modules are not even imported.
+    """
+
+    KNOWN_TYPES: ClassVar[list[KnownType]] = []
+    """Types mapped directly to zod, in addition to the built-in ones like
+    `uuid.UUID`, `decimal.Decimal` or `pydantic.EmailStr`, see
+    `pydantic2zod/_known_types.py`. Their modules are not parsed.
+
+    .e.g. `KnownType("bson.ObjectId", "z.string()", "string")`
     """
 
-    def __init__(self) -> None:
+    CRAWL_ROOTS: ClassVar[set[str]] = set()
+    """Packages the parser may follow the models' dependencies into, e.g.
+    `{"my_pkg"}`. Any package when empty.
+
+    The models beyond the crawl boundaries are not parsed and the fields of those
+    types become `Any`.
+    """
+
+    MAX_CRAWL_DEPTH: ClassVar[int | None] = None
+    """How many imports away from the parsed module to follow the dependencies."""
+
+    CRAWL_INSTALLED_PACKAGES: ClassVar[bool] = True
+    """Whether to follow the dependencies into the standard library and the packages
+    installed into site-packages, e.g. shared models or third-party SDKs. When
+    `False`, the parsed module's own package is followed nevertheless."""
+
+    def __init__(self, module_cache: ModuleCache | None = None) -> None:
+        """
+        Args:
+            module_cache: parsed modules shared between compilations, see
+                `ModuleCache`. A cache of this compiler's own is used when not
+                given, so parsing several modules reuses their common dependencies.
+        """
+        # Captured once, so that changing the class attributes later doesn't affect
+        # the compilations running in other threads.
+        self._ignore_types = set(self.IGNORE_TYPES)
+        self._crawl_boundaries = CrawlBoundaries(
+            frozenset(self.CRAWL_ROOTS),
+            self.MAX_CRAWL_DEPTH,
+            self.CRAWL_INSTALLED_PACKAGES,
+        )
+        self._known_types = KNOWN_TYPES | {t.name: t for t in self.KNOWN_TYPES}
+        modifies_models = type(self)._modify_models is not Compiler._modify_models
         self._codegen = Codegen(
-            self.MODEL_RENAME_RULES, self._modify_models, self._gen_header
+            dict(self.MODEL_RENAME_RULES),
+            self._modify_models if modifies_models else None,
+            self._gen_header,
         )
+        self._module_cache = ModuleCache() if module_cache is None else module_cache
         self._pydantic_models: list[ClassDecl] = []
+        self._source_files: list[str] = []
 
     def parse(self, module_name: str) -> Self:
         """Parse pydantic models from the given module."""
-        m = import_module(module_name)
-        self._pydantic_models = parse(m, self.IGNORE_TYPES)
+        # libcst is slow to import, let's not do it until we have to parse something.
+        from pydantic2zod._parser import crawl
+
+        with memory_phase("parse"), trace_span("parse", "compile", module=module_name):
+            parsed = crawl(
+                module_name,
+                self._ignore_types,
+                self._module_cache,
+                self._crawl_boundaries,
+                self._known_types,
+            )
+        self._pydantic_models = parsed.models
+        self._source_files = parsed.source_files
+        return self
+
+    def parse_classes(self, classes: Iterable[type]) -> Self:
+        """Build the models from live pydantic classes and enums instead of parsing
+        their sources.
+
+        Usage:
+            Compiler().parse_classes([User, Order]).to_zod()
+
+        Much cheaper than `parse()` when the classes are imported anyway, e.g. at
+        app startup. Picks up the models built by `pydantic.create_model()` and the
+        fields inherited from mixins too. The models the given ones depend on are
+        included as well. Field comments come from `Field(description=...)`.
+        """
+        from pydantic2zod._introspect import introspect
+
+        with memory_phase("introspect"):
+            result = introspect(
+                classes,
+                self._ignore_types,
+                self._crawl_boundaries,
+                self._known_types,
+            )
+        self._pydantic_models = result.models
+        self._source_files = result.source_files
+        return self
+
+    def parse_json_schema(self, *paths: str | Path) -> Self:
+        """Build the models from JSON Schema documents instead of Python sources.
+
+        Usage:
+            Compiler().parse_json_schema("orders.schema.json").to_zod()
+
+        Args:
+            paths: `.json` files with a single document, e.g. saved from pydantic's
+                `model_json_schema()`, or `.jsonl` files with a document per line.
+        """
+        from pydantic2zod._json_schema_input import read_json_schemas
+
+        with memory_phase("parse"):
+            self._pydantic_models = read_json_schemas(paths, self._known_types)
+        self._source_files = [str(Path(p).absolute()) for p in paths]
+        return self
+
+    async def aparse(
+        self,
+        module_name: str,
+        executor: Executor | None = None,
+        timeout: float | None = None,
+    ) -> Self:
+        """Parse pydantic models without blocking the event loop.
+
+        Usage:
+            compiler = await Compiler().aparse("my_pkg.models", timeout=30)
+            ts_src = await compiler.ato_zod()
+
+        Args:
+            executor: runs the CPU bound parsing. The default loop executor is used
+                when not given. A process pool works too.
+            timeout: seconds after which parsing is cancelled with
+                `asyncio.TimeoutError`.
+        """
+        from pydantic2zod._parser import acrawl
+
+        parsed = await asyncio.wait_for(
+            acrawl(
+                module_name,
+                self._ignore_types,
+                executor,
+                self._crawl_boundaries,
+                self._known_types,
+            ),
+            timeout,
+        )
+        self._pydantic_models = parsed.models
+        self._source_files = parsed.source_files
         return self
 
-    def to_zod(self) -> str:
-        """Generate zod data model declarations."""
-        return self._codegen.to_zod(self._pydantic_models)
+    async def ato_zod(
+        self,
+        lazy: bool = False,
+        interfaces: bool = False,
+        executor: Executor | None = None,
+    ) -> str:
+        """`to_zod()` run in the `executor`, the default loop executor if not given."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, partial(self.to_zod, lazy, interfaces)
+        )
+
+    def dump_ir(self, path: str | Path) -> None:
+        """Save the parsed models so that `load_ir()` could generate code from them
+        later, e.g. in a different process or on a different machine."""
+        _ir.dump(path, self._pydantic_models, self._source_files)
+
+    def load_ir(self, path: str | Path) -> Self:
+        """Load the models saved by `dump_ir()` instead of parsing the sources.
+
+        Raises:
+            ValueError: when the file was saved by an incompatible pydantic2zod.
+        """
+        self._pydantic_models, self._source_files = _ir.load(path)
+        return self
+
+    def load_models(
+        self, models: list[ClassDecl], source_files: list[str] | None = None
+    ) -> Self:
+        """Generate code from the models parsed by another compiler, e.g. one with
+        different rename rules.
+
+        Usage:
+            parsed = Compiler().parse("my_pkg.models")
+            public_src = PublicApiCompiler().load_models(parsed.models()).to_zod()
+            internal_src = parsed.to_zod()
+
+        The models are immutable, hence shared rather than copied.
+        """
+        self._pydantic_models = models
+        self._source_files = source_files or []
+        return self
+
+    def models(self) -> list[ClassDecl]:
+        """The parsed models, dependencies first."""
+        return self._pydantic_models
+
+    @property
+    def module_cache(self) -> ModuleCache:
+        return self._module_cache
+
+    def source_files(self) -> list[str]:
+        """Python files the models were parsed from."""
+        return self._source_files
+
+    def to_zod(
+        self,
+        lazy: bool = False,
+        interfaces: bool = False,
+        executor: Executor | None = None,
+    ) -> str:
+        """Generate zod data model declarations.
+
+        Args:
+            lazy: export each schema behind a memoized accessor which builds it on
+                first use instead of at module import time.
+            interfaces: declare explicit TypeScript interfaces for the models and
+                type the schemas with them instead of `z.infer`. Much cheaper for
+                `tsc` on large outputs.
+            executor: generate the code for batches of models in parallel, e.g. in
+                a `ProcessPoolExecutor`. Pays off with thousands of models.
+        """
+        return self._codegen.to_zod(self._pydantic_models, lazy, interfaces, executor)
+
+    def to_zod_chunks(
+        self,
+        max_chunk_size: int,
+        lazy: bool = False,
+        interfaces: bool = False,
+    ) -> dict[str, str]:
+        """Generate zod declarations split into modules of about `max_chunk_size`
+        bytes, so that bundlers could load the rarely used schemas lazily.
+
+        Usage:
+            chunks = Compiler().parse("my_pkg.models").to_zod_chunks(50_000)
+            for fname, code in chunks.items():
+                Path("schemas", fname).write_text(code)
+
+        The models of a Python package or module stay in the same chunk until it
+        outgrows the budget. See `ChunkedZodEmitter` for the details and `to_zod()`
+        for the other args.
+
+        Returns:
+            file name -> code. `index.ts` re-exports every chunk.
+        """
+        from pydantic2zod._chunks import ChunkedZodEmitter
+
+        emitter = ChunkedZodEmitter(max_chunk_size, self._gen_header, lazy, interfaces)
+        return self._codegen.emit_chunks(self._pydantic_models, emitter)
+
+    def to_zod_fragments(
+        self,
+        lazy: bool = False,
+        interfaces: bool = False,
+        executor: Executor | None = None,
+    ) -> list[Fragment]:
+        """Generate the zod declarations of each model on its own.
+
+        Usage:
+            for fragment in Compiler().parse("my_pkg.models").to_zod_fragments():
+                print(fragment.name, fragment.digest)
+
+        The same code as `to_zod()` without the header, see it for the args.
+
+        Returns:
+            the models' code, dependencies first.
+        """
+        emitter = self.zod_emitter(lazy, interfaces, executor)
+        return self._codegen.emit_fragments(self._pydantic_models, emitter)
+
+    def splice_zod(
+        self,
+        existing: str,
+        lazy: bool = False,
+        interfaces: bool = False,
+        executor: Executor | None = None,
+    ) -> str:
+        """Update only the declarations of the changed models in the code generated
+        by `splice_zod()` before.
+
+        Usage:
+            out_to = Path("model.ts")
+            existing = out_to.read_text() if out_to.exists() else ""
+            if (code := compiler.splice_zod(existing)) != existing:
+                out_to.write_text(code)
+
+        Every declaration is wrapped in markers carrying the digest of its code, so
+        the unchanged ones stay as they are, where they are. See `to_zod()` for the
+        other args.
+
+        Args:
+            existing: code to update, any other code is replaced.
+        """
+        emitter = self.zod_emitter(lazy, interfaces, executor)
+        fragments = self._codegen.emit_fragments(self._pydantic_models, emitter)
+        return splice(existing, emitter.header(), fragments)
+
+    def emit(self, emitters: Sequence[Emitter]) -> list[str]:
+        """Generate several outputs from the same parsed models in one pass.
+
+        Usage:
+            compiler = Compiler().parse("my_pkg.models")
+            zod_src, schema = compiler.emit(
+                [compiler.zod_emitter(), JsonSchemaEmitter()]
+            )
+
+        Returns:
+            code generated by each emitter in the same order.
+        """
+        return self._codegen.emit(self._pydantic_models, emitters)
+
+    def zod_emitter(
+        self,
+        lazy: bool = False,
+        interfaces: bool = False,
+        executor: Executor | None = None,
+    ) -> ZodEmitter:
+        """zod emitter with this compiler's header, see `to_zod()` for the args."""
+        return ZodEmitter(self._gen_header, lazy, interfaces, executor)
 
     def _modify_models(self, pydantic_models: list[ClassDecl]) -> list[ClassDecl]:
         """Override in case you want to apply some transformations on models.
 
-        e.g. remove default field values.
+        e.g. remove default field values. The models are immutable, return the
+        modified ones created with `dataclasses.replace()`.
         """
         return pydantic_models
 
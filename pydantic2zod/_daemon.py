@@ -0,0 +1,192 @@
+"""Long-lived compiler process which keeps parsed modules in memory.
+
+Repeated compilations then only parse the source files that changed since.
+Requests and responses are JSON-RPC 2.0 messages, one per line:
+
+    --> {"jsonrpc": "2.0", "id": 1, "method": "compile", "params": {"module": "a.b"}}
+    <-- {"jsonrpc": "2.0", "id": 1, "result": {"code": "...", "sources": [...]}}
+
+Methods:
+    compile: params `module`, optional `lazy` and `interfaces` - see
+        `Compiler.to_zod()`. Returns the generated TypeScript `code` and the
+        `sources` - Python files the models were parsed from.
+    shutdown: stops the daemon.
+"""
+
+import importlib
+import json
+import logging
+import os
+import socket
+import socketserver
+from typing import Any, TextIO
+
+from pydantic2zod._cache import ModuleCache
+from pydantic2zod._compiler import Compiler
+
+_logger = logging.getLogger(__name__)
+
+_INVALID_REQUEST = -32600
+_METHOD_NOT_FOUND = -32601
+_INVALID_PARAMS = -32602
+_PARSE_ERROR = -32700
+_COMPILE_ERROR = -32000
+
+_COMPILE_PARAMS = {"module", "lazy", "interfaces"}
+
+
+class Daemon:
+    """Serves compile requests with a warm module cache."""
+
+    def __init__(self, compiler_cls: type[Compiler] = Compiler) -> None:
+        self._compiler_cls = compiler_cls
+        self._module_cache = ModuleCache()
+        self._stopped = False
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    def handle(self, request_line: str) -> str:
+        """Process a single JSON-RPC request and return the response."""
+        try:
+            request = json.loads(request_line)
+        except json.JSONDecodeError as e:
+            return _error(None, _PARSE_ERROR, str(e))
+
+        if not isinstance(request, dict):
+            return _error(None, _INVALID_REQUEST, "The request must be an object")
+        request_id = request.get("id")
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            return _error(request_id, _INVALID_PARAMS, "'params' must be an object")
+
+        match request.get("method"):
+            case "compile":
+                if not isinstance(params.get("module"), str):
+                    return _error(request_id, _INVALID_PARAMS, "'module' is required")
+                if unknown := params.keys() - _COMPILE_PARAMS:
+                    return _error(
+                        request_id,
+                        _INVALID_PARAMS,
+                        f"Unknown params: {', '.join(sorted(unknown))}",
+                    )
+                if not all(
+                    isinstance(params.get(flag, False), bool)
+                    for flag in ["lazy", "interfaces"]
+                ):
+                    return _error(
+                        request_id, _INVALID_PARAMS, "'lazy' and 'interfaces' are bool"
+                    )
+                try:
+                    return _result(request_id, self._compile(**params))
+                except Exception as e:
+                    _logger.exception("Compiler failed:")
+                    return _error(request_id, _COMPILE_ERROR, str(e))
+            case "shutdown":
+                self._stopped = True
+                return _result(request_id, None)
+            case other:
+                return _error(request_id, _METHOD_NOT_FOUND, f"Unknown method: {other}")
+
+    def serve_stdio(self, stdin: TextIO, stdout: TextIO) -> None:
+        for line in stdin:
+            if not line.strip():
+                continue
+            stdout.write(self.handle(line) + "\n")
+            stdout.flush()
+            if self._stopped:
+                break
+
+    def serve_unix_socket(self, path: str) -> None:
+        """Serve requests one by one till `shutdown` is received."""
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    self.wfile.write((daemon.handle(line.decode()) + "\n").encode())
+                    if daemon.stopped:
+                        break
+
+        if os.path.exists(path):
+            if _is_listening(path):
+                raise RuntimeError(f"Another daemon is listening on '{path}'")
+            # Left over by a daemon which was killed.
+            os.remove(path)
+        with socketserver.UnixStreamServer(path, Handler) as server:
+            _logger.info("Listening on '%s'", path)
+            try:
+                while not self._stopped:
+                    server.handle_request()
+            finally:
+                os.remove(path)
+
+    def _compile(
+        self, module: str, lazy: bool = False, interfaces: bool = False
+    ) -> dict[str, Any]:
+        # New modules might have been added since the last request.
+        importlib.invalidate_caches()
+        compiler = self._compiler_cls(module_cache=self._module_cache).parse(module)
+        return {
+            "code": compiler.to_zod(lazy=lazy, interfaces=interfaces),
+            "sources": compiler.source_files(),
+        }
+
+
+def request_compile(
+    socket_path: str, module: str, lazy: bool = False, interfaces: bool = False
+) -> tuple[str, list[str]]:
+    """Ask the daemon listening on the given socket to compile the module.
+
+    Returns:
+        generated code and the Python files the models were parsed from.
+
+    Raises:
+        OSError: when no daemon is listening.
+        RuntimeError: when the daemon fails to compile the module.
+    """
+    params = {"module": module, "lazy": lazy, "interfaces": interfaces}
+    result = _request(socket_path, "compile", params)
+    return result["code"], result["sources"]
+
+
+def request_shutdown(socket_path: str) -> None:
+    _request(socket_path, "shutdown", {})
+
+
+def _request(socket_path: str, method: str, params: dict[str, Any]) -> Any:
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile("rw") as conn:
+            conn.write(json.dumps(request) + "\n")
+            conn.flush()
+            response = json.loads(conn.readline())
+
+    if error := response.get("error"):
+        raise RuntimeError(error["message"])
+    return response["result"]
+
+
+def _is_listening(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def _result(request_id: Any, result: Any) -> str:
+    return json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+
+def _error(request_id: Any, code: int, message: str) -> str:
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        }
+    )
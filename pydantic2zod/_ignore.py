@@ -0,0 +1,50 @@
+"""Fully qualified type names and whole packages to skip when parsing."""
+
+from collections.abc import Iterable
+
+_SUBTREE = "*"
+_EXACT = "."
+"""Can't be a name segment, so marks the end of an exact name."""
+
+_Trie = dict[str, "_Trie"]
+
+
+class IgnoredTypes:
+    """A trie of the dotted name segments.
+
+        pkg.module.MyType    the type only
+        vendor.sdk.*         every type in `vendor.sdk` and its subpackages
+
+    Checking a name costs the same regardless of how many types are ignored.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._trie: _Trie = {}
+        for pattern in patterns:
+            segments = pattern.split(".")
+            if any(_SUBTREE in s for s in segments[:-1]) or (
+                _SUBTREE in segments[-1] and segments[-1] != _SUBTREE
+            ):
+                raise ValueError(
+                    f"Unsupported ignore pattern '{pattern}': only a trailing '.*'"
+                    " is allowed"
+                )
+
+            node = self._trie
+            for segment in segments:
+                node = node.setdefault(segment, {})
+            if segments[-1] != _SUBTREE:
+                node[_EXACT] = {}
+
+    def __contains__(self, full_name: object) -> bool:
+        if not isinstance(full_name, str):
+            return False
+
+        node = self._trie
+        for segment in full_name.split("."):
+            if _SUBTREE in node:
+                return True
+            if (next_node := node.get(segment)) is None:
+                return False
+            node = next_node
+        return _EXACT in node
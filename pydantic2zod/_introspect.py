@@ -0,0 +1,347 @@
+"""Builds the program model from live pydantic classes instead of their sources.
+
+Handy when the models are imported already anyway, e.g. at app startup, and for the
+models the parser can't see: built by `create_model()` or inheriting fields from
+mixins.
+"""
+
+import collections.abc
+import enum
+import logging
+import sys
+import types
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Annotated, Any, Literal, TypeVar, Union, get_args, get_origin
+
+import pydantic
+
+from pydantic2zod._boundaries import CrawlBoundaries
+from pydantic2zod._ignore import IgnoredTypes
+from pydantic2zod._transform import share_equal_types
+from pydantic2zod._values import PRIMITIVES, literal_type, to_value
+from pydantic2zod.model import (
+    AnnotatedType,
+    AnyType,
+    BuiltinType,
+    ClassDecl,
+    ClassField,
+    EnumDecl,
+    EnumMember,
+    GenericType,
+    KnownType,
+    PrimitiveType,
+    PydanticField,
+    PyDict,
+    PyList,
+    PyType,
+    PyValue,
+    TupleType,
+    UnionType,
+    UserDefinedType,
+)
+
+_logger = logging.getLogger(__name__)
+
+_PYDANTIC_V2 = pydantic.VERSION.startswith("2")
+
+_LISTS = {list, set, frozenset, collections.abc.Sequence, collections.abc.Set}
+"""Serialized as JSON arrays."""
+
+_DICTS = {dict, collections.abc.Mapping}
+
+_UNIONS = {Union, types.UnionType}
+
+
+@dataclass
+class IntrospectResult:
+    models: list[ClassDecl]
+    """Dependencies come first."""
+    source_files: list[str]
+    """Files of the modules the models are declared in."""
+
+
+def introspect(
+    classes: Iterable[type],
+    ignore_types: set[str],
+    boundaries: CrawlBoundaries,
+    known_types: Mapping[str, KnownType],
+) -> IntrospectResult:
+    """Same as `pydantic2zod._parser.crawl()` but for the given pydantic models and
+    enums: the models they depend on are included too.
+
+    Args:
+        boundaries: `depth` is the number of modules between the given classes and
+            the ones they depend on.
+    """
+    classes = list(classes)
+    introspection = _Introspect(
+        IgnoredTypes(ignore_types),
+        boundaries.around(*[cls.__module__ for cls in classes]),
+        known_types,
+    )
+    for cls in classes:
+        introspection.add(cls, depth=0)
+
+    if introspection.beyond_boundaries:
+        _logger.warning(
+            "Not crawling beyond the boundaries, these types become 'Any': %s",
+            ", ".join(sorted(introspection.beyond_boundaries)),
+        )
+    models = share_equal_types(list(introspection.models.values()))
+    return IntrospectResult(models, list(introspection.source_files))
+
+
+@dataclass
+class _Introspect:
+    ignore_types: IgnoredTypes
+    boundaries: CrawlBoundaries
+    known_types: Mapping[str, KnownType]
+    models: dict[str, ClassDecl] = field(default_factory=dict)
+    """In the order the dependencies come first."""
+    beyond_boundaries: set[str] = field(default_factory=set)
+    source_files: dict[str, None] = field(default_factory=dict)
+    _seen: set[str] = field(default_factory=set)
+    _deps: list[tuple[type, int]] = field(default_factory=list)
+    """Of the class being introspected, with their depth."""
+
+    def add(self, cls: type, depth: int) -> None:
+        """Add the class and the models it depends on, dependencies first.
+
+        Doesn't recurse as long chains of models would exceed the recursion limit.
+        """
+        if (full_path := _full_path(cls)) in self._seen:
+            return
+        self._seen.add(full_path)
+
+        stack = [(cls, self._decl(cls, depth), iter(self._take_deps()))]
+        while stack:
+            cls, cls_decl, deps = stack[-1]
+            for dep, dep_depth in deps:
+                if (dep_path := _full_path(dep)) not in self._seen:
+                    self._seen.add(dep_path)
+                    dep_decl = self._decl(dep, dep_depth)
+                    stack.append((dep, dep_decl, iter(self._take_deps())))
+                    break
+            else:
+                stack.pop()
+                self.models[cls_decl.full_path] = cls_decl
+                if fname := getattr(sys.modules.get(cls.__module__), "__file__", None):
+                    self.source_files[fname] = None
+
+    def _decl(self, cls: type, depth: int) -> ClassDecl:
+        if issubclass(cls, enum.Enum):
+            return _enum_decl(cls)
+        return self._class_decl(cls, depth)
+
+    def _take_deps(self) -> list[tuple[type, int]]:
+        deps, self._deps = self._deps, []
+        return deps
+
+    def _class_decl(self, cls: type[pydantic.BaseModel], depth: int) -> ClassDecl:
+        bases = [b for b in cls.__bases__ if _is_model(b)]
+        base = bases[0] if bases else None
+        if base and not _is_pydantic_base(base):
+            self._add_dependency(base, cls, depth)
+
+        type_vars = [
+            tv.__name__ for tv in getattr(cls, "__parameters__", ()) if _is_typevar(tv)
+        ]
+        fields = []
+        inherited = _model_fields(base) if base else {}
+        own_annotations = cls.__dict__.get("__annotations__", {})
+        for name, model_field in _model_fields(cls).items():
+            if name in inherited and name not in own_annotations:
+                continue
+            annotation, constraints, default_value, comment = model_field
+            field_type = self._to_type(annotation, cls, depth)
+            if constraints:
+                field_type = AnnotatedType(type_=field_type, metadata=constraints)
+            fields.append(
+                ClassField(
+                    name=name,
+                    type=field_type,
+                    default_value=default_value,
+                    comment=comment,
+                )
+            )
+        return ClassDecl(
+            name=cls.__name__,
+            full_path=_full_path(cls),
+            fields=fields,
+            base_classes=[b.__name__ for b in bases] or ["BaseModel"],
+            comment=cls.__dict__.get("__doc__"),
+            type_vars=type_vars,
+        )
+
+    def _add_dependency(self, dep: type, cls: type, depth: int) -> bool:
+        """
+        Returns:
+            whether the dependency is within the crawl boundaries.
+        """
+        if dep.__module__ != cls.__module__:
+            depth += 1
+        if not self.boundaries.allow(dep.__module__, depth):
+            self.beyond_boundaries.add(_full_path(dep))
+            return False
+        self._deps.append((dep, depth))
+        return True
+
+    def _to_type(self, annotation: Any, cls: type, depth: int) -> PyType:
+        if primitive := PRIMITIVES.get(annotation):
+            return PrimitiveType(name=primitive)
+        if annotation is Any or _is_typevar(annotation):
+            # Yet to learn how to parse generic type variables.
+            return AnyType()
+        if annotation in _LISTS or annotation is tuple:
+            return BuiltinType(name="list")
+        if annotation in _DICTS:
+            return BuiltinType(name="dict")
+
+        origin, args = get_origin(annotation), get_args(annotation)
+        if origin is Annotated:
+            type_ = self._to_type(args[0], cls, depth)
+            if constraints := _constraints(args[1:]):
+                return AnnotatedType(type_=type_, metadata=constraints)
+            return type_
+        if origin in _UNIONS:
+            union_types = []
+            for arg in args:
+                match self._to_type(arg, cls, depth):
+                    case UnionType(types=arg_types):
+                        union_types += arg_types
+                    case arg_type:
+                        union_types.append(arg_type)
+            return UnionType(types=union_types)
+        if origin is Literal:
+            return literal_type(args)
+        if origin in _LISTS:
+            return GenericType(
+                generic="list", type_vars=[self._to_type(args[0], cls, depth)]
+            )
+        if origin in _DICTS:
+            return GenericType(
+                generic="dict", type_vars=[self._to_type(a, cls, depth) for a in args]
+            )
+        if origin is tuple:
+            if len(args) == 2 and args[1] is Ellipsis:
+                return GenericType(
+                    generic="list", type_vars=[self._to_type(args[0], cls, depth)]
+                )
+            return TupleType(types=[self._to_type(a, cls, depth) for a in args])
+
+        if not isinstance(annotation, type):
+            _logger.warning(
+                "Unsupported type '%s' of a '%s' field", annotation, cls.__name__
+            )
+            return AnyType()
+
+        full_path = _full_path(annotation)
+        if known_type := self.known_types.get(full_path):
+            return known_type
+        if full_path in self.ignore_types:
+            _logger.info("Ignore parsing '%s'", full_path)
+            return AnyType()
+        if _is_model(annotation) or issubclass(annotation, enum.Enum):
+            if self._add_dependency(annotation, cls, depth):
+                return UserDefinedType(name=full_path)
+            return AnyType()
+        # e.g. `class Ulid(str): ...` validates as a plain string.
+        for base in annotation.__mro__:
+            if primitive := PRIMITIVES.get(base):
+                return PrimitiveType(name=primitive)
+
+        _logger.warning(
+            "Unsupported type '%s' of a '%s' field", full_path, cls.__name__
+        )
+        return AnyType()
+
+
+def _model_fields(
+    cls: type[pydantic.BaseModel],
+) -> dict[str, tuple[Any, PydanticField | None, PyValue | None, str | None]]:
+    """Field annotation, constraints, default value and description by field name."""
+    if _PYDANTIC_V2:
+        return {
+            name: (
+                info.annotation,
+                _constraints(info.metadata),
+                _default_value(info.default, info.default_factory),
+                info.description,
+            )
+            for name, info in cls.model_fields.items()
+        }
+
+    # `ModelField`s in pydantic v1.
+    v1_fields: dict[str, Any] = cls.__fields__
+    return {
+        name: (
+            model_field.annotation,
+            _constraints([model_field.field_info]),
+            _default_value(
+                ... if model_field.required else model_field.default,
+                model_field.default_factory,
+            ),
+            model_field.field_info.description,
+        )
+        for name, model_field in v1_fields.items()
+    }
+
+
+def _constraints(metadata: Iterable[Any]) -> PydanticField | None:
+    """Number constraints from `Field(gt=0)` or the `annotated_types` it produces."""
+    constraints: dict[str, PyValue] = {}
+    for item in metadata:
+        if nested := getattr(item, "metadata", None):
+            # `FieldInfo` in pydantic v2.
+            item = _constraints(nested)
+        for c in ["gt", "ge", "lt", "le"]:
+            if (value := getattr(item, c, None)) is not None:
+                constraints[c] = (
+                    value if isinstance(value, PyValue) else to_value(value)
+                )
+    return PydanticField(**constraints) if constraints else None
+
+
+def _default_value(default: Any, default_factory: Any) -> PyValue | None:
+    if default_factory is list:
+        return PyList()
+    if default_factory is dict:
+        return PyDict()
+    if default_factory is not None:
+        _logger.warning("Unsupported default factory: '%s'", default_factory)
+        return None
+    if default is ... or _is_undefined(default):
+        return None
+    return to_value(default)
+
+
+def _enum_decl(cls: type[enum.Enum]) -> EnumDecl:
+    return EnumDecl(
+        name=cls.__name__,
+        full_path=_full_path(cls),
+        base_classes=[b.__name__ for b in cls.__bases__],
+        comment=cls.__dict__.get("__doc__"),
+        members=[EnumMember(name=m.name, value=to_value(m.value)) for m in cls],
+    )
+
+
+def _full_path(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _is_pydantic_base(cls: type) -> bool:
+    """`BaseModel` or `GenericModel`."""
+    return cls.__module__.split(".")[0] == "pydantic"
+
+
+def _is_model(cls: Any) -> bool:
+    return isinstance(cls, type) and issubclass(cls, pydantic.BaseModel)
+
+
+def _is_typevar(tp: Any) -> bool:
+    return isinstance(tp, TypeVar)
+
+
+def _is_undefined(value: Any) -> bool:
+    return type(value).__name__ == "PydanticUndefinedType"
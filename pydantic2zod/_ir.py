@@ -0,0 +1,82 @@
+"""Serializes the parsed program model so that code could be generated elsewhere.
+
+Every `pydantic2zod.model` dataclass is encoded as a JSON object tagged with the
+class name. Fields holding their default value are omitted to keep the files small.
+"""
+
+import dataclasses
+import json
+from pathlib import Path
+from typing import Any
+
+from pydantic2zod import model
+from pydantic2zod._transform import share_equal_types
+from pydantic2zod.model import ClassDecl
+
+IR_VERSION = 2
+"""Bump when the encoding or `pydantic2zod.model` changes incompatibly."""
+
+_FORMAT = "pydantic2zod-ir"
+_TAG = "_t"
+
+_MODEL_TYPES: dict[str, type] = {
+    name: cls
+    for name, cls in vars(model).items()
+    if isinstance(cls, type) and dataclasses.is_dataclass(cls)
+}
+
+
+def dump(path: str | Path, models: list[ClassDecl], source_files: list[str]) -> None:
+    ir = {
+        "format": _FORMAT,
+        "version": IR_VERSION,
+        "source_files": source_files,
+        "models": _encode(models),
+    }
+    Path(path).write_text(json.dumps(ir, separators=(",", ":")))
+
+
+def load(path: str | Path) -> tuple[list[ClassDecl], list[str]]:
+    """
+    Returns:
+        models and the Python files they were parsed from.
+
+    Raises:
+        ValueError: when the file is not a compatible IR dump.
+    """
+    ir = json.loads(Path(path).read_text())
+    if not isinstance(ir, dict) or ir.get("format") != _FORMAT:
+        raise ValueError(f"Not a pydantic2zod IR file: '{path}'")
+    if ir.get("version") != IR_VERSION:
+        raise ValueError(
+            f"Unsupported IR version {ir.get('version')}, expected {IR_VERSION}"
+        )
+
+    return share_equal_types(_decode(ir["models"])), ir["source_files"]
+
+
+def _encode(obj: Any) -> Any:
+    if isinstance(obj, (list, tuple)):
+        return [_encode(o) for o in obj]
+    if not dataclasses.is_dataclass(obj) or isinstance(obj, type):
+        return obj
+
+    data = {_TAG: type(obj).__name__}
+    for f in dataclasses.fields(obj):
+        value = getattr(obj, f.name)
+        if f.default is not dataclasses.MISSING and value == f.default:
+            continue
+        data[f.name] = _encode(value)
+    return data
+
+
+def _decode(data: Any) -> Any:
+    if isinstance(data, list):
+        return [_decode(d) for d in data]
+    if not isinstance(data, dict):
+        return data
+
+    cls = _MODEL_TYPES.get(data.get(_TAG, ""))
+    if cls is None:
+        raise ValueError(f"Unknown IR node: '{data.get(_TAG)}'")
+    return cls(**{k: _decode(v) for k, v in data.items() if k != _TAG})
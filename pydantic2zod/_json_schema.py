@@ -0,0 +1,243 @@
+"""Produces JSON Schema (draft 2020-12) documents."""
+
+import json
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from pydantic2zod.model import (
+    AnnotatedType,
+    AnyType,
+    BuiltinType,
+    ClassDecl,
+    ClassField,
+    EnumDecl,
+    GenericType,
+    KnownType,
+    LiteralType,
+    PrimitiveType,
+    PyBool,
+    PydanticField,
+    PyDict,
+    PyFloat,
+    PyInteger,
+    PyList,
+    PyName,
+    PyNone,
+    PyString,
+    PyType,
+    PyValue,
+    TupleType,
+    UnionType,
+    UserDefinedType,
+)
+
+_logger = logging.getLogger(__name__)
+
+_SCHEMA_DIALECT = "https://json-schema.org/draft/2020-12/schema"
+
+JsonSchema = dict[str, Any]
+
+
+class JsonSchemaEmitter:
+    """Generates a single document with every model under `$defs`.
+
+    Fields of the base models are copied into the schemas of the models that
+    inherit them as, unlike zod's `.extend()`, `allOf` doesn't play well with
+    `"additionalProperties": false`.
+    """
+
+    def emit(self, models: list[ClassDecl]) -> str:
+        models_by_name = {m.name: m for m in models}
+        defs = {}
+        for cls in models:
+            if isinstance(cls, EnumDecl):
+                defs[cls.name] = _enum_to_json_schema(cls)
+            else:
+                defs[cls.name] = _class_to_json_schema(cls, models_by_name)
+
+        return json.dumps({"$schema": _SCHEMA_DIALECT, "$defs": defs}, indent=2)
+
+
+def _enum_to_json_schema(enum: EnumDecl) -> JsonSchema:
+    schema: JsonSchema = {"enum": [_value_to_json(m.value) for m in enum.members]}
+    if enum.comment:
+        schema["description"] = enum.comment
+    return schema
+
+
+def _class_to_json_schema(
+    cls: ClassDecl, models_by_name: dict[str, ClassDecl]
+) -> JsonSchema:
+    properties: dict[str, JsonSchema] = {}
+    required: list[str] = []
+    for f in _inherited_fields(cls, models_by_name):
+        properties[f.name] = _class_field_to_json_schema(f)
+        if f.default_value is None and not isinstance(f.type, AnyType):
+            required.append(f.name)
+
+    schema: JsonSchema = {
+        "type": "object",
+        "properties": properties,
+        "required": required,
+        "additionalProperties": False,
+    }
+    if cls.comment:
+        schema["description"] = cls.comment
+    return schema
+
+
+def _inherited_fields(
+    cls: ClassDecl, models_by_name: dict[str, ClassDecl]
+) -> list[ClassField]:
+    base = cls.base_classes[0] if cls.base_classes else "BaseModel"
+    if base in ["BaseModel", "GenericModel"]:
+        return list(cls.fields)
+    if base_cls := models_by_name.get(base):
+        return [*_inherited_fields(base_cls, models_by_name), *cls.fields]
+
+    _logger.warning("Base model '%s' of '%s' is unknown", base, cls.name)
+    return list(cls.fields)
+
+
+def _class_field_to_json_schema(field: ClassField) -> JsonSchema:
+    schema = _class_field_type_to_json_schema(field.type, None)
+    if field.comment:
+        schema["description"] = field.comment
+    if field.default_value is not None and not isinstance(field.default_value, PyName):
+        schema["default"] = _value_to_json(field.default_value)
+    return schema
+
+
+def _value_to_json(pyval: PyValue) -> Any:
+    match pyval:
+        case PyString(value=value):
+            return value
+        case PyInteger(value=value):
+            return int(value)
+        case PyFloat(value=value):
+            return float(value)
+        case PyNone():
+            return None
+        case PyBool(value=value):
+            return value
+        case PyDict():
+            return {}
+        case PyList():
+            return []
+        case other:
+            raise AssertionError(f"Unsupported value type: '{other}'")
+
+
+def _class_field_type_to_json_schema(
+    field_type: PyType, type_constraints: PydanticField | None
+) -> JsonSchema:
+    match field_type:
+        case BuiltinType(name=type_name) | PrimitiveType(name=type_name):
+            match type_name:
+                case "str":
+                    return {"type": "string"}
+                case "int" | "float":
+                    schema = {"type": "integer" if type_name == "int" else "number"}
+                    if type_constraints:
+                        schema |= _number_constraints(type_constraints)
+                    return schema
+                case "None":
+                    return {"type": "null"}
+                case "bool":
+                    return {"type": "boolean"}
+                case "dict":
+                    return {"type": "object"}
+                case "list":
+                    return {"type": "array"}
+                case other:
+                    raise AssertionError(f"Unsupported field type: '{other}'")
+
+        case LiteralType(value=value):
+            return {"const": value}
+
+        case UnionType(types=types):
+            literals = [t.value for t in types if isinstance(t, LiteralType)]
+            other_types = [t for t in types if not isinstance(t, LiteralType)]
+            if len(literals) > 1:
+                if not other_types:
+                    return {"enum": literals}
+                return {
+                    "anyOf": [
+                        {"enum": literals},
+                        *[
+                            _class_field_type_to_json_schema(t, type_constraints)
+                            for t in other_types
+                        ],
+                    ]
+                }
+            return {
+                "anyOf": [
+                    _class_field_type_to_json_schema(t, type_constraints) for t in types
+                ]
+            }
+
+        case TupleType(types=types):
+            return _tuple_to_json_schema(types, type_constraints)
+
+        case GenericType(generic=generic, type_vars=type_vars):
+            match generic:
+                case "dict":
+                    return {
+                        "type": "object",
+                        "additionalProperties": _class_field_type_to_json_schema(
+                            type_vars[-1], type_constraints
+                        ),
+                    }
+                case "list":
+                    return {
+                        "type": "array",
+                        "items": _class_field_type_to_json_schema(
+                            type_vars[0], type_constraints
+                        ),
+                    }
+                case "tuple":
+                    return _tuple_to_json_schema(type_vars, type_constraints)
+                case other:
+                    raise AssertionError(f"Unsupported generic type: '{other}'")
+
+        case UserDefinedType(name=type_name):
+            return {"$ref": f"#/$defs/{type_name.split('.')[-1]}"}
+
+        case KnownType(json_schema=json_schema):
+            return json.loads(json_schema)
+
+        case AnyType():
+            return {}
+
+        case AnnotatedType(type_=type_, metadata=metadata):
+            return _class_field_type_to_json_schema(type_, metadata)
+
+        case other:
+            raise AssertionError(f"Unsupported field type: '{other}'")
+
+
+def _tuple_to_json_schema(
+    types: Sequence[PyType], type_constraints: PydanticField | None
+) -> JsonSchema:
+    return {
+        "type": "array",
+        "prefixItems": [
+            _class_field_type_to_json_schema(t, type_constraints) for t in types
+        ],
+        "minItems": len(types),
+        "maxItems": len(types),
+    }
+
+
+def _number_constraints(constraints: PydanticField) -> JsonSchema:
+    schema: JsonSchema = {}
+    for keyword, value in [
+        ("exclusiveMinimum", constraints.gt),
+        ("minimum", constraints.ge),
+        ("exclusiveMaximum", constraints.lt),
+        ("maximum", constraints.le),
+    ]:
+        if value is not None:
+            schema[keyword] = _value_to_json(value)
+    return schema
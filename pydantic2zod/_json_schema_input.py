@@ -0,0 +1,306 @@
+"""Builds the program model from JSON Schema documents, e.g. the ones exported by
+pydantic's `model_json_schema()`, when the Python sources are not available.
+
+Every schema in `$defs` (`definitions` in pydantic v1) and every root schema which
+declares an object becomes a model. Pydantic flattens the inherited fields into
+the schemas, hence the models don't extend each other.
+"""
+
+import json
+import logging
+import re
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from networkx import DiGraph, dfs_postorder_nodes
+
+from pydantic2zod._transform import map_field_types, replace_types, share_equal_types
+from pydantic2zod._values import PRIMITIVES, literal_type, to_value
+from pydantic2zod.model import (
+    AnnotatedType,
+    AnyType,
+    BuiltinType,
+    ClassDecl,
+    ClassField,
+    EnumDecl,
+    EnumMember,
+    GenericType,
+    KnownType,
+    PrimitiveType,
+    PydanticField,
+    PyDict,
+    PyList,
+    PyType,
+    PyValue,
+    TupleType,
+    UnionType,
+    UserDefinedType,
+)
+
+_logger = logging.getLogger(__name__)
+
+_JSON_LINES_SUFFIXES = {".jsonl", ".ndjson"}
+"""One document per line."""
+
+_DEFS_KEYWORDS = ["$defs", "definitions"]
+
+_JSON_TYPES: dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "null": None,
+}
+"""Python types of the primitive JSON types."""
+
+_NUMBER_CONSTRAINTS = {
+    "exclusiveMinimum": "gt",
+    "minimum": "ge",
+    "exclusiveMaximum": "lt",
+    "maximum": "le",
+}
+
+
+def read_json_schemas(
+    paths: Iterable[str | Path], known_types: Mapping[str, KnownType]
+) -> list[ClassDecl]:
+    """
+    Args:
+        paths: `.json` files with a single document or `.jsonl` files with one
+            document per line. JSON Lines files are read a line at a time, so only
+            one document is in memory at once.
+        known_types: string formats, e.g. `"format": "uuid"`, are mapped to the
+            known types with the same JSON Schema format.
+
+    Returns:
+        models, dependencies first. A model declared in several documents is
+        taken from the first one.
+    """
+    reader = _SchemaReader(_types_by_format(known_types.values()))
+    for path in paths:
+        for document in _documents(Path(path)):
+            reader.read_document(document)
+
+    ordered = dfs_postorder_nodes(reader.model_graph)
+    models = [reader.models[name] for name in ordered if name in reader.models]
+    if unresolved := set(reader.model_graph.nodes) - reader.models.keys():
+        _logger.warning(
+            "Can't resolve '$ref's, these types become 'Any': %s",
+            ", ".join(sorted(unresolved)),
+        )
+        models = map_field_types(
+            models,
+            lambda tp: replace_types(
+                tp, lambda name: AnyType() if name in unresolved else None
+            ),
+        )
+    return share_equal_types(models)
+
+
+def _documents(path: Path) -> Iterator[dict[str, Any]]:
+    if path.suffix not in _JSON_LINES_SUFFIXES:
+        yield json.loads(path.read_text())
+        return
+
+    with path.open() as lines:
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _types_by_format(known_types: Iterable[KnownType]) -> dict[str, KnownType]:
+    types_by_format = {}
+    for known_type in known_types:
+        schema = json.loads(known_type.json_schema)
+        if schema.get("type") == "string" and (json_format := schema.get("format")):
+            types_by_format.setdefault(json_format, known_type)
+    return types_by_format
+
+
+class _SchemaReader:
+    def __init__(self, types_by_format: dict[str, KnownType]) -> None:
+        self._types_by_format = types_by_format
+        self.models: dict[str, ClassDecl] = {}
+        self.model_graph = DiGraph()
+        self._refs: dict[str, str] = {}
+        """Model names by the JSON pointer of their schema in the current document."""
+
+    def read_document(self, document: dict[str, Any]) -> None:
+        root_name = document.get("title")
+        self._refs = {"#": root_name} if root_name else {}
+        definitions = []
+        for keyword in _DEFS_KEYWORDS:
+            for name, schema in document.get(keyword, {}).items():
+                self._refs[f"#/{keyword}/{_escape_pointer(name)}"] = name
+                definitions.append((name, schema))
+        if root_name and document.get("type") == "object":
+            definitions.append((root_name, document))
+
+        for name, schema in definitions:
+            if name in self.models:
+                continue
+            self.model_graph.add_node(name)
+            self.models[name] = self._model(name, schema)
+
+    def _model(self, name: str, schema: dict[str, Any]) -> ClassDecl:
+        if "enum" in schema:
+            return EnumDecl(
+                name=name,
+                full_path=name,
+                comment=schema.get("description"),
+                members=[
+                    EnumMember(name=_member_name(v), value=to_value(v))
+                    for v in schema["enum"]
+                ],
+            )
+
+        required = set(schema.get("required", []))
+        fields = []
+        for field_name, field_schema in schema.get("properties", {}).items():
+            field_type = self._to_type(field_schema, name)
+            default_value = None
+            if "default" in field_schema:
+                default_value = to_value(field_schema["default"])
+            elif field_name not in required:
+                # `Field(default_factory=...)`, its default is not in the schema.
+                default_value = _empty_value(field_type)
+            fields.append(
+                ClassField(
+                    name=field_name,
+                    type=field_type,
+                    default_value=default_value,
+                    comment=field_schema.get("description"),
+                )
+            )
+        return ClassDecl(
+            name=name,
+            full_path=name,
+            fields=fields,
+            base_classes=["BaseModel"],
+            comment=schema.get("description"),
+        )
+
+    def _to_type(self, schema: dict[str, Any] | bool, model_name: str) -> PyType:
+        if not isinstance(schema, dict) or not schema:
+            # `true` or `{}` accept anything.
+            return AnyType()
+
+        if ref := schema.get("$ref"):
+            return self._ref(ref, model_name)
+        if "const" in schema:
+            return literal_type([schema["const"]])
+        if "enum" in schema:
+            return literal_type(schema["enum"])
+        for keyword in ["anyOf", "oneOf", "allOf"]:
+            if keyword in schema:
+                types = [self._to_type(s, model_name) for s in schema[keyword]]
+                if len(types) == 1:
+                    return types[0]
+                if keyword == "allOf":
+                    _logger.warning("'allOf' is not supported in '%s'", model_name)
+                    return AnyType()
+                return _union(types)
+
+        match schema.get("type"):
+            case list(json_types):
+                return _union(
+                    [
+                        self._to_type(schema | {"type": t}, model_name)
+                        for t in json_types
+                    ]
+                )
+            case "string":
+                if known_type := self._types_by_format.get(schema.get("format", "")):
+                    return known_type
+                return PrimitiveType(name="str")
+            case "integer" | "number" as json_type:
+                number = PrimitiveType(name=PRIMITIVES[_JSON_TYPES[json_type]])
+                if constraints := _constraints(schema):
+                    return AnnotatedType(type_=number, metadata=constraints)
+                return number
+            case "array":
+                if prefix_items := schema.get("prefixItems"):
+                    return TupleType(
+                        types=[self._to_type(s, model_name) for s in prefix_items]
+                    )
+                if items := schema.get("items"):
+                    return GenericType(
+                        generic="list", type_vars=[self._to_type(items, model_name)]
+                    )
+                return BuiltinType(name="list")
+            case "object":
+                if "properties" in schema:
+                    _logger.warning(
+                        "Inline object schemas are not supported in '%s'", model_name
+                    )
+                    return BuiltinType(name="dict")
+                values = schema.get("additionalProperties")
+                if isinstance(values, dict) and values:
+                    return GenericType(
+                        generic="dict",
+                        type_vars=[
+                            PrimitiveType(name="str"),
+                            self._to_type(values, model_name),
+                        ],
+                    )
+                return BuiltinType(name="dict")
+            case json_type if json_type in _JSON_TYPES:
+                return PrimitiveType(name=PRIMITIVES[_JSON_TYPES[json_type]])
+            case other:
+                _logger.warning(
+                    "Unsupported schema type '%s' in '%s'", other, model_name
+                )
+                return AnyType()
+
+    def _ref(self, ref: str, model_name: str) -> PyType:
+        # `other.json#/$defs/Model` - models are unique by name across documents,
+        # hence might be declared in a document which is yet to be read.
+        pointer = ref[ref.index("#") :] if "#" in ref else ref
+        dep = self._refs.get(pointer) or _unescape_pointer(pointer.rsplit("/", 1)[-1])
+        self.model_graph.add_edge(model_name, dep)
+        return UserDefinedType(name=dep)
+
+
+def _union(types: list[PyType]) -> UnionType:
+    flat_types = []
+    for tp in types:
+        match tp:
+            case UnionType(types=union_types):
+                flat_types += union_types
+            case _:
+                flat_types.append(tp)
+    return UnionType(types=flat_types)
+
+
+def _constraints(schema: dict[str, Any]) -> PydanticField | None:
+    constraints = {
+        arg: to_value(schema[keyword])
+        for keyword, arg in _NUMBER_CONSTRAINTS.items()
+        if keyword in schema
+    }
+    return PydanticField(**constraints) if constraints else None
+
+
+def _empty_value(field_type: PyType) -> PyValue | None:
+    match field_type:
+        case GenericType(generic="list") | BuiltinType(name="list"):
+            return PyList()
+        case GenericType(generic="dict") | BuiltinType(name="dict"):
+            return PyDict()
+        case _:
+            return None
+
+
+def _member_name(value: Any) -> str:
+    """Enum member names are not in the schema, made up from the values."""
+    name = re.sub(r"\W", "_", str(value)).upper()
+    return name if name[:1].isalpha() else f"_{name}"
+
+
+def _escape_pointer(name: str) -> str:
+    return name.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape_pointer(segment: str) -> str:
+    return segment.replace("~1", "/").replace("~0", "~")
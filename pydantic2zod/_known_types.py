@@ -0,0 +1,49 @@
+"""Types from the standard library and pydantic which are mapped to zod directly."""
+
+import json
+
+from pydantic2zod.model import KnownType
+
+
+def _string(name: str, zod: str, json_format: str | None = None) -> KnownType:
+    json_schema = {"type": "string"}
+    if json_format:
+        json_schema["format"] = json_format
+    return KnownType(name, zod, "string", json.dumps(json_schema))
+
+
+_NUMBER_OR_STRING = KnownType(
+    "decimal.Decimal",
+    "z.union([z.number(), z.string()])",
+    "number | string",
+    json.dumps({"anyOf": [{"type": "number"}, {"type": "string"}]}),
+)
+
+KNOWN_TYPES: dict[str, KnownType] = {
+    t.name: t
+    for t in [
+        _string("uuid.UUID", "z.string().uuid()", "uuid"),
+        _string("datetime.datetime", "z.string().datetime()", "date-time"),
+        _string("datetime.date", "z.string().date()", "date"),
+        _string("datetime.time", "z.string().time()", "time"),
+        _string("datetime.timedelta", "z.string().duration()", "duration"),
+        _NUMBER_OR_STRING,
+        _string("ipaddress.IPv4Address", 'z.string().ip({ version: "v4" })', "ipv4"),
+        _string("ipaddress.IPv6Address", 'z.string().ip({ version: "v6" })', "ipv6"),
+        _string("pathlib.Path", "z.string()"),
+        *[
+            _string(f"{module}.{name}", zod, json_format)
+            for module in ["pydantic", "pydantic.networks"]
+            for name, zod, json_format in [
+                ("EmailStr", "z.string().email()", "email"),
+                ("AnyUrl", "z.string().url()", "uri"),
+                ("AnyHttpUrl", "z.string().url()", "uri"),
+                ("HttpUrl", "z.string().url()", "uri"),
+                ("IPvAnyAddress", "z.string().ip()", None),
+            ]
+        ],
+        _string("pydantic.SecretStr", "z.string()"),
+        _string("pydantic.types.SecretStr", "z.string()"),
+    ]
+}
+"""Fully qualified names of the built-in well-known types."""
@@ -0,0 +1,132 @@
+"""Tells whether the generated code is up to date without parsing anything.
+
+The manifest is saved next to the generated file and lists every Python file the
+models were parsed from with its content hash, plus the compiler settings.
+"""
+
+import dataclasses
+import json
+import os
+from collections.abc import Sequence
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, distribution
+from pathlib import Path
+from typing import Any
+
+from pydantic2zod._compiler import Compiler
+
+_MANIFEST_VERSION = 1
+
+_PACKAGE_DIR = Path(__file__).parent
+
+
+def manifest_path(out_to: str) -> Path:
+    return Path(f"{out_to}.manifest.json")
+
+
+def compiler_settings(compiler: Compiler, **codegen_options: Any) -> dict[str, Any]:
+    """Everything besides the source code that affects the generated code."""
+    return {
+        "version": _compiler_version(),
+        "compiler": f"{type(compiler).__module__}.{type(compiler).__qualname__}",
+        "model_rename_rules": compiler.MODEL_RENAME_RULES,
+        "ignore_types": sorted(compiler.IGNORE_TYPES),
+        "known_types": [dataclasses.astuple(t) for t in compiler.KNOWN_TYPES],
+        "crawl_roots": sorted(compiler.CRAWL_ROOTS),
+        "max_crawl_depth": compiler.MAX_CRAWL_DEPTH,
+        "crawl_installed_packages": compiler.CRAWL_INSTALLED_PACKAGES,
+        **codegen_options,
+    }
+
+
+def _compiler_version() -> str:
+    """The installed version, or the digest of pydantic2zod's own sources when running
+    from a checkout, where the version doesn't change along with the code."""
+    try:
+        dist = distribution("pydantic2zod")
+    except PackageNotFoundError:
+        return _sources_digest()
+
+    try:
+        direct_url = json.loads(dist.read_text("direct_url.json") or "{}")
+    except ValueError:
+        direct_url = {}
+    if direct_url.get("dir_info", {}).get("editable"):
+        return _sources_digest()
+    return dist.version
+
+
+def _sources_digest() -> str:
+    digest = sha256()
+    for path in sorted(_PACKAGE_DIR.rglob("*.py")):
+        digest.update(path.relative_to(_PACKAGE_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return f"sources-{digest.hexdigest()}"
+
+
+def write_manifest(
+    out_to: str,
+    module_name: str,
+    settings: dict[str, Any],
+    source_files: list[str],
+    extra_outputs: Sequence[str] = (),
+) -> None:
+    """Call after the generated code is saved to `out_to`.
+
+    Args:
+        extra_outputs: other files generated from the same models, e.g. JSON Schema.
+    """
+    base_dir = manifest_path(out_to).parent
+    manifest = {
+        "manifest_version": _MANIFEST_VERSION,
+        "module": module_name,
+        "settings": settings,
+        "output": _hash_file(Path(out_to)),
+        "extra_outputs": {
+            os.path.relpath(f, base_dir): _hash_file(Path(f)) for f in extra_outputs
+        },
+        "sources": {
+            os.path.relpath(f, base_dir): _hash_file(Path(f)) for f in source_files
+        },
+    }
+    manifest_path(out_to).write_text(json.dumps(manifest, indent=2) + "\n")
+
+
+def is_up_to_date(out_to: str, module_name: str, settings: dict[str, Any]) -> bool:
+    """Neither the sources, the settings nor the generated file changed since the
+    manifest was written."""
+    try:
+        manifest = json.loads(manifest_path(out_to).read_text())
+    except (OSError, ValueError):
+        return False
+
+    if (
+        manifest.get("manifest_version") != _MANIFEST_VERSION
+        or manifest.get("module") != module_name
+        or manifest.get("settings") != settings
+        or manifest.get("output") != _hash_file(Path(out_to))
+    ):
+        return False
+
+    base_dir = manifest_path(out_to).parent
+    files = manifest.get("sources", {}) | manifest.get("extra_outputs", {})
+    return all(
+        _hash_file(base_dir / fname) == digest for fname, digest in files.items()
+    )
+
+
+def previous_outputs(out_to: str) -> list[Path]:
+    """The extra outputs listed by the manifest written last time."""
+    try:
+        manifest = json.loads(manifest_path(out_to).read_text())
+    except (OSError, ValueError):
+        return []
+    base_dir = manifest_path(out_to).parent
+    return [base_dir / fname for fname in manifest.get("extra_outputs", {})]
+
+
+def _hash_file(path: Path) -> str | None:
+    try:
+        return sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
@@ -0,0 +1,103 @@
+"""Peak and retained memory of the compilation phases, traced with `tracemalloc`.
+
+Usage:
+    with MemoryReport() as report:
+        with memory_phase("parse"):
+            compiler.parse("my_pkg.models")
+    print(report)
+
+`memory_phase()` does nothing unless a report is being collected, so the
+compiler marks its phases unconditionally.
+"""
+
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from typing_extensions import Self
+
+
+@dataclass
+class PhaseMemory:
+    name: str
+    depth: int
+    """Nesting level: modules are parsed within the parse phase."""
+    peak: int = 0
+    """The most memory in bytes allocated on top of what was before the phase."""
+    retained: int = 0
+    """Memory in bytes still allocated after the phase."""
+
+
+@dataclass
+class _OpenPhase:
+    phase: PhaseMemory
+    start: int
+    peak: int
+    """Highest traced memory so far, as the nested phases reset the peak."""
+
+
+class MemoryReport:
+    def __init__(self) -> None:
+        self.phases: list[PhaseMemory] = []
+        self._open: list[_OpenPhase] = []
+        self._started_tracing = False
+
+    def __enter__(self) -> Self:
+        global _active_report
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        _active_report = self
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        global _active_report
+        _active_report = None
+        if self._started_tracing:
+            tracemalloc.stop()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        current, peak = tracemalloc.get_traced_memory()
+        if self._open:
+            self._open[-1].peak = max(self._open[-1].peak, peak)
+        phase = PhaseMemory(name, depth=len(self._open))
+        self.phases.append(phase)
+        self._open.append(_OpenPhase(phase, start=current, peak=current))
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            opened = self._open.pop()
+            peak = max(opened.peak, peak)
+            phase.peak = peak - opened.start
+            phase.retained = current - opened.start
+            if self._open:
+                self._open[-1].peak = max(self._open[-1].peak, peak)
+
+    def __str__(self) -> str:
+        width = max((len(p.name) + 2 * p.depth for p in self.phases), default=0)
+        lines = [f"{'phase':<{width}}  {'peak':>10}  {'retained':>10}"]
+        for p in self.phases:
+            name = "  " * p.depth + p.name
+            lines.append(f"{name:<{width}}  {_mib(p.peak):>10}  {_mib(p.retained):>10}")
+        return "\n".join(lines)
+
+
+_active_report: MemoryReport | None = None
+
+
+@contextmanager
+def memory_phase(name: str) -> Iterator[None]:
+    """Measure the memory used by the code within, if a `MemoryReport` is active."""
+    if _active_report is None:
+        yield
+    else:
+        with _active_report.phase(name):
+            yield
+
+
+def _mib(size: int) -> str:
+    return f"{size / 2**20:.2f} MiB"
@@ -1,29 +1,47 @@
 """An incomplete Python parser focused around Pydantic declarations."""
 
+import asyncio
+import enum
 import inspect
 import logging
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass, field, replace
+from functools import partial
 from importlib import import_module
-from importlib.util import resolve_name
+from importlib.util import find_spec, resolve_name
 from itertools import chain
 from pathlib import Path
 from types import ModuleType
 from typing import Generic, Literal, NewType, TypeVar, cast
 
 import libcst as cst
-import libcst.matchers as m
 from networkx import DiGraph, dfs_postorder_nodes
 from typing_extensions import Self
 
+from pydantic2zod._boundaries import CrawlBoundaries
+from pydantic2zod._cache import ModuleCache, ParsedModule
+from pydantic2zod._ignore import IgnoredTypes
+from pydantic2zod._known_types import KNOWN_TYPES
+from pydantic2zod._memory import memory_phase
+from pydantic2zod._symbols import SymbolIndex
+from pydantic2zod._trace import trace_span, worker_result, worker_task
+from pydantic2zod._transform import map_field_types, replace_types, share_equal_types
+from pydantic2zod._values import to_value
 from pydantic2zod.model import (
     AnnotatedType,
     AnyType,
     BuiltinType,
     ClassDecl,
     ClassField,
+    EnumDecl,
+    EnumMember,
     GenericType,
     Import,
+    KnownType,
     LiteralType,
     PrimitiveType,
+    PyBool,
     PydanticField,
     PyDict,
     PyFloat,
@@ -41,6 +59,10 @@ from pydantic2zod.model import (
 _logger = logging.getLogger(__name__)
 
 
+_PYDANTIC_BASES = ["pydantic.BaseModel", "pydantic.generics.GenericModel"]
+_ENUM_BASES = ["enum.Enum", "enum.StrEnum", "enum.IntEnum"]
+_DEFAULT_BOUNDARIES = CrawlBoundaries()
+
 Imports = NewType("Imports", dict[str, Import])
 """imported_symbol -> from_module
 
@@ -48,53 +70,390 @@ e.g. Request --> scanner_common.http.cassette
 """
 
 
-def parse(module: ModuleType, ignore_types: set[str]) -> list[ClassDecl]:
+@dataclass
+class ParseResult:
+    models: list[ClassDecl]
+    """Dependencies come first."""
+    source_files: list[str]
+    """Every Python file the models were parsed from."""
+
+
+def parse(
+    module: ModuleType,
+    ignore_types: set[str],
+    cache: ModuleCache | None = None,
+    boundaries: CrawlBoundaries = _DEFAULT_BOUNDARIES,
+    known_types: Mapping[str, KnownType] = KNOWN_TYPES,
+) -> list[ClassDecl]:
     """
     Args:
         ignore_types: fully qualified names of types to ignore when parsing.
             .e.g. `pkg1.module1.MyType` - say when `MyType` is a deeply nested
             complicated type that pydantic2zod is not capable of parsing, we can
             tell the parser to ignore parsing it and instead use `Any` type.
+            `vendor.sdk.*` ignores every type in the package, its modules are not
+            even imported.
+        cache: reuse the modules parsed by previous calls unless their source
+            changed.
+        boundaries: the modules the parser may descend into. The models beyond
+            them are not parsed and the fields of those types become `Any`.
+        known_types: types mapped directly to zod, by their fully qualified names.
+            Their modules are not parsed.
     """
+    return crawl(module.__name__, ignore_types, cache, boundaries, known_types).models
+
+
+def crawl(
+    module_name: str,
+    ignore_types: set[str],
+    cache: ModuleCache | None = None,
+    boundaries: CrawlBoundaries = _DEFAULT_BOUNDARIES,
+    known_types: Mapping[str, KnownType] = KNOWN_TYPES,
+) -> ParseResult:
+    """Same as `parse()` but also tells which files were parsed."""
+    return _finish_crawl(
+        _parse(
+            module_name,
+            set(),
+            ignore_types,
+            cache,
+            boundaries.around(module_name),
+            known_types,
+            SymbolIndex(),
+            0,
+        ),
+        known_types,
+    )
+
+
+async def acrawl(
+    module_name: str,
+    ignore_types: set[str],
+    executor: Executor | None = None,
+    boundaries: CrawlBoundaries = _DEFAULT_BOUNDARIES,
+    known_types: Mapping[str, KnownType] = KNOWN_TYPES,
+) -> ParseResult:
+    """Same as `crawl()` but doesn't block the event loop.
+
+    Files are read in a thread, libcst parsing runs in the given `executor` (the
+    default loop executor when `None`) and the modules the given one depends on are
+    parsed concurrently. The result is the same as of `crawl()`.
+
+    Cancelling the coroutine cancels the pending module parsers, though a module
+    which is being parsed already in the executor runs till completion.
+    """
+    return _finish_crawl(
+        await _aparse(
+            module_name,
+            set(),
+            ignore_types,
+            executor,
+            boundaries.around(module_name),
+            known_types,
+            SymbolIndex(),
+            0,
+        ),
+        known_types,
+    )
+
+
+def _finish_crawl(
+    parsed: "_ParsedModule", known_types: Mapping[str, KnownType]
+) -> ParseResult:
     model_graph = DiGraph()
-    pydantic_models = _parse(module, set(), model_graph, ignore_types)
+    reexports = {
+        alias: model_path
+        for p in parsed.walk()
+        for alias, model_path in p.reexports.items()
+    }
+    pydantic_models = parsed.merge_into(model_graph, reexports)
     models_by_name = {c.full_path: c for c in pydantic_models}
-    ordered_models = list[str](dfs_postorder_nodes(model_graph))
-    return [models_by_name[c] for c in ordered_models if c in models_by_name]
+    with trace_span("sort_models", "graph", models=model_graph.number_of_nodes()):
+        ordered_models = list[str](dfs_postorder_nodes(model_graph))
+    models = [models_by_name[c] for c in ordered_models if c in models_by_name]
+    replacements: dict[str, PyType] = dict(known_types)
+    # The same model might be reached by a shorter path too.
+    beyond_boundaries = {
+        model_path
+        for p in parsed.walk()
+        for model_path in p.skipped
+        if model_path not in models_by_name
+    }
+    if beyond_boundaries:
+        _logger.warning(
+            "Not crawling beyond the boundaries, these types become 'Any': %s",
+            ", ".join(sorted(beyond_boundaries)),
+        )
+        replacements |= {model_path: AnyType() for model_path in beyond_boundaries}
+    replacements |= {
+        alias: replacements.get(model_path, UserDefinedType(name=model_path))
+        for alias, model_path in reexports.items()
+    }
+    models = map_field_types(models, lambda tp: replace_types(tp, replacements.get))
+    return ParseResult(
+        models=share_equal_types(models),
+        source_files=list(dict.fromkeys(p.fname for p in parsed.walk())),
+    )
 
 
 def _parse(
+    module_name: str,
+    parse_only_models: set[str],
+    ignore_types: set[str],
+    cache: ModuleCache | None,
+    boundaries: CrawlBoundaries,
+    known_types: Mapping[str, KnownType],
+    symbols: SymbolIndex,
+    depth: int,
+) -> "_ParsedModule":
+    with trace_span("import_module", "import", module=module_name):
+        fname = import_module(module_name).__file__ or "SHOULD EXIST"
+    _logger.info("Parsing module '%s'", fname)
+
+    def parse_source(source: str) -> ParsedModule:
+        return _parse_module_source(
+            module_name, source, parse_only_models, ignore_types
+        )
+
+    with memory_phase(module_name):
+        if cache is None:
+            with trace_span("read_file", "io", file=fname):
+                source = Path(fname).read_text()
+            classes, depends_on, model_graph = parse_source(source)
+        else:
+            key = (module_name, frozenset(parse_only_models), frozenset(ignore_types))
+            classes, depends_on, model_graph = cache.get_or_parse(
+                key, fname, parse_source
+            )
+
+    parsed = _ParsedModule(fname, classes, model_graph)
+    if depends_on:
+        _log_dependencies(fname, depends_on)
+
+        for model_path in depends_on:
+            model_path = _locate_dependency(
+                parsed, model_path, boundaries, known_types, symbols, depth
+            )
+            if model_path is None:
+                continue
+            dep_module, _, model_name = model_path.rpartition(".")
+            parsed.dependencies.append(
+                _parse(
+                    dep_module,
+                    {model_name},
+                    ignore_types,
+                    cache,
+                    boundaries,
+                    known_types,
+                    symbols,
+                    depth + 1,
+                )
+            )
+
+    return parsed
+
+
+def _parse_source(
     module: ModuleType,
+    source: str,
     parse_only_models: set[str],
     model_graph: DiGraph,
     ignore_types: set[str],
-) -> list[ClassDecl]:
-    fname = module.__file__ or "SHOULD EXIST"
+) -> "_ParseModule":
+    parse_module = _ParseModule(module, model_graph, ignore_types, parse_only_models)
+    with trace_span("cst.parse_module", "parse", module=module.__name__):
+        tree = cst.parse_module(source)
+    with trace_span("visit", "parse", module=module.__name__):
+        return parse_module.visit(tree)
+
+
+def _locate_dependency(
+    parsed: "_ParsedModule",
+    model_path: str,
+    boundaries: CrawlBoundaries,
+    known_types: Mapping[str, KnownType],
+    symbols: SymbolIndex,
+    depth: int,
+) -> str | None:
+    """Where to parse a model the module depends on from.
+
+    Returns:
+        the fully qualified name of the model where it's declared, which differs
+        when a package re-exports the model. `None` when the model is not parsed.
+    """
+    if model_path in known_types:
+        return None
+    if not boundaries.allow(model_path.rpartition(".")[0], depth + 1):
+        parsed.skipped.append(model_path)
+        return None
+
+    declared_path = symbols.resolve(model_path)
+    if declared_path == model_path:
+        return model_path
+    _logger.info("'%s' is declared as '%s'", model_path, declared_path)
+    parsed.reexports[model_path] = declared_path
+    if declared_path in known_types:
+        return None
+    if not boundaries.allow(declared_path.rpartition(".")[0], depth + 1):
+        parsed.skipped.append(declared_path)
+        return None
+    return declared_path
+
+
+def _log_dependencies(fname: str, depends_on: set[str] | list[str]) -> None:
+    _logger.info("'%s' depends on other pydantic models:", fname)
+    for model_path in depends_on:
+        _logger.info("    '%s'", model_path)
+
+
+@dataclass
+class _ParsedModule:
+    """Module parsing results with its own piece of the model graph."""
+
+    fname: str
+    classes: list[ClassDecl]
+    model_graph: DiGraph
+    dependencies: list["_ParsedModule"] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    """Dependencies beyond the crawl boundaries."""
+    reexports: dict[str, str] = field(default_factory=dict)
+    """Dependencies imported from the packages re-exporting them -> where they
+    are declared."""
+
+    def merge_into(
+        self, model_graph: DiGraph, reexports: Mapping[str, str]
+    ) -> list[ClassDecl]:
+        """Merge in the same order `_parse()` would build the model graph, hence
+        the models end up sorted the same way too.
+
+        The re-exported models are renamed to where they are declared.
+        """
+        model_graph.add_nodes_from(reexports.get(n, n) for n in self.model_graph.nodes)
+        model_graph.add_edges_from(
+            (reexports.get(u, u), reexports.get(v, v))
+            for u, v in self.model_graph.edges
+        )
+        classes = list(self.classes)
+        for dep in self.dependencies:
+            classes += dep.merge_into(model_graph, reexports)
+        return classes
+
+    def walk(self) -> Iterator["_ParsedModule"]:
+        """This module and the ones it depends on, depth first."""
+        yield self
+        for dep in self.dependencies:
+            yield from dep.walk()
+
+
+async def _aparse(
+    module_name: str,
+    parse_only_models: set[str],
+    ignore_types: set[str],
+    executor: Executor | None,
+    boundaries: CrawlBoundaries,
+    known_types: Mapping[str, KnownType],
+    symbols: SymbolIndex,
+    depth: int,
+) -> _ParsedModule:
+    loop = asyncio.get_running_loop()
+
+    fname = await asyncio.to_thread(_module_file, module_name)
     _logger.info("Parsing module '%s'", fname)
+    source = await asyncio.to_thread(_read_file, fname)
+    parsed_module = await loop.run_in_executor(
+        executor,
+        worker_task(_parse_module_source),
+        module_name,
+        source,
+        parse_only_models,
+        ignore_types,
+    )
+    classes, depends_on, model_graph = worker_result(parsed_module)
+    parsed = _ParsedModule(fname, classes, model_graph)
+    if not depends_on:
+        return parsed
+
+    _log_dependencies(fname, depends_on)
+    tasks = []
+    for model_path in depends_on:
+        # Scanning a package for re-exports reads its files.
+        model_path = await asyncio.to_thread(
+            _locate_dependency,
+            parsed,
+            model_path,
+            boundaries,
+            known_types,
+            symbols,
+            depth,
+        )
+        if model_path is None:
+            continue
+        dep_module, _, model_name = model_path.rpartition(".")
+        tasks.append(
+            asyncio.ensure_future(
+                _aparse(
+                    dep_module,
+                    {model_name},
+                    ignore_types,
+                    executor,
+                    boundaries,
+                    known_types,
+                    symbols,
+                    depth + 1,
+                )
+            )
+        )
+    try:
+        parsed.dependencies = list(await asyncio.gather(*tasks))
+    except BaseException:
+        for t in tasks:
+            t.cancel()
+        raise
 
-    classes = list[ClassDecl]()
+    return parsed
 
-    parse_module = _ParseModule(module, model_graph, ignore_types, parse_only_models)
-    m = cst.parse_module(Path(fname).read_text())
-    classes += parse_module.visit(m).classes()
 
-    if depends_on := parse_module.external_models():
-        _logger.info("'%s' depends on other pydantic models:", fname)
-        for model_path in depends_on:
-            _logger.info("    '%s'", model_path)
+def _module_file(module_name: str) -> str:
+    spec = find_spec(module_name)
+    return (spec and spec.origin) or "SHOULD EXIST"
 
-        for model_path in depends_on:
-            m = import_module(".".join(model_path.split(".")[:-1]))
-            model_name = model_path.split(".")[-1]
-            classes += _parse(m, {model_name}, model_graph, ignore_types)
 
-    return classes
+def _read_file(fname: str) -> str:
+    with trace_span("read_file", "io", file=fname):
+        return Path(fname).read_text()
+
+
+def _parse_module_source(
+    module_name: str,
+    source: str,
+    parse_only_models: set[str],
+    ignore_types: set[str],
+) -> ParsedModule:
+    """Parse a single module.
+
+    Takes and returns only picklable values so that it could be run in a process
+    pool too.
+    """
+    model_graph = DiGraph()
+    with trace_span("import_module", "import", module=module_name):
+        module = import_module(module_name)
+    parse_module = _parse_source(
+        module,
+        source,
+        parse_only_models,
+        model_graph,
+        ignore_types,
+    )
+    return parse_module.classes(), list(parse_module.external_models()), model_graph
 
 
 _NodeT = TypeVar("_NodeT", bound=cst.CSTNode)
 
 
-class _Parse(m.MatcherDecoratableVisitor, Generic[_NodeT]):
+class _Parse(cst.CSTVisitor, Generic[_NodeT]):
+    """Plain visitors: matcher decorators are checked against the ancestors of
+    every visited node, which dominated parsing of large modules."""
+
     def visit(self, node: _NodeT) -> Self:
         node.visit(self)
         return self
@@ -111,12 +470,12 @@ class _ParseModule(_Parse[cst.Module]):
         """
         Args:
             ignore_types: fully qualified names of types to ignore when parsing:
-                'pkg1.module1.MyType'
+                'pkg1.module1.MyType' or whole packages: 'vendor.sdk.*'
         """
         super().__init__()
 
         self._parse_only_models = parse_only_models
-        self._ignore_types = ignore_types or set()
+        self._ignore_types = IgnoredTypes(ignore_types or set())
         self._model_graph = model_graph
         self._parsing_module = module
 
@@ -137,35 +496,45 @@ class _ParseModule(_Parse[cst.Module]):
     def external_models(self) -> set[str]:
         """A List of pydantic models coming from other Python modules.
 
-        Built-in common types like uuid.UUID are filtered out so that pydantic2zod
-        would not try to parse them recursively.
+        Well-known types like uuid.UUID are among them, `crawl()` doesn't parse
+        them though.
         """
         return self._external_models
 
     def classes(self) -> list[ClassDecl]:
         return list(self._pydantic_classes.values())
 
-    def visit_ImportFrom(self, node: cst.ImportFrom):
-        self._imports |= {
-            i.alias or i.name: i for i in _ParseImportFrom().visit(node).imports()
-        }
-
-    def visit_ClassDef(self, node: cst.ClassDef):
+    def visit_ClassDef(self, node: cst.ClassDef) -> bool:
         cls = _ParseClassDecl().visit(node).class_decl
-        cls.full_path = f"{self._parsing_module.__name__}.{cls.name}"
+        cls = replace(cls, full_path=f"{self._parsing_module.__name__}.{cls.name}")
         self._class_nodes[cls.name] = node
         self._classes[cls.name] = cls
+        # Only the top-level classes are models, their bodies are parsed lazily.
+        return False
 
-    @m.call_if_inside(
-        m.AnnAssign(annotation=m.Annotation(annotation=m.Name("TypeAlias")))
-    )
-    # Only global namespace.
-    @m.call_if_not_inside(m.AllOf(m.ClassDef(), m.FunctionDef()))
-    def visit_AnnAssign(self, node: cst.AnnAssign):
-        target = cst.ensure_type(node.target, cst.Name).value
-        # We will parse the alias declaration lazily when one is used within a pydantic
-        # model.
-        self._alias_nodes[target] = node
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
+        return False
+
+    def visit_SimpleStatementLine(self, node: cst.SimpleStatementLine) -> bool:
+        # Only the global namespace: class and function bodies are not visited.
+        for stmt in node.body:
+            match stmt:
+                case cst.ImportFrom():
+                    self._imports |= {
+                        i.alias or i.name: i
+                        for i in _ParseImportFrom().visit(stmt).imports()
+                    }
+                case cst.AnnAssign(
+                    target=cst.Name(value=target),
+                    annotation=cst.Annotation(annotation=cst.Name(value="TypeAlias")),
+                ):
+                    # We will parse the alias declaration lazily when one is used
+                    # within a pydantic model.
+                    self._alias_nodes[target] = stmt
+                case _:
+                    ...
+        # No need to descend into expressions.
+        return False
 
     def leave_Module(self, original_node: cst.Module) -> None:
         """Parse the class definitions and resolve imported classes."""
@@ -177,26 +546,37 @@ class _ParseModule(_Parse[cst.Module]):
             for cls in self._pydantic_classes.values():
                 self._parse_class_deps(cls)
 
-        for cls in self._pydantic_classes.values():
-            for field in cls.fields:
-                # MyType(str) --> str
-                if isinstance(field.type, UserDefinedType):
-                    if user_type := self._classes.get(field.type.name):
-                        if next(iter(user_type.base_classes), "") == "str":
-                            field.type = BuiltinType(name="str")
+        # Everything needed is in the IR by now: don't keep the syntax tree alive for
+        # as long as the visitor is.
+        self._class_nodes.clear()
+        self._alias_nodes.clear()
+
+        for name, cls in self._pydantic_classes.items():
+            [self._pydantic_classes[name]] = map_field_types(
+                [cls], partial(self._finish_field_type, cls)
+            )
+
+    def _finish_field_type(self, cls: ClassDecl, field_type: PyType) -> PyType:
+        # MyType(str) --> str
+        if isinstance(field_type, UserDefinedType):
+            user_type = self._classes.get(field_type.name)
+            if user_type and not self._is_enum(user_type):
+                if next(iter(user_type.base_classes), "") == "str":
+                    field_type = BuiltinType(name="str")
 
-                self._resolve_class_field_names(field.type)
+        field_type = self._resolve_class_field_names(field_type)
+        field_type = replace_types(field_type, self._replace_ignored_type)
 
-                if isinstance(field.type, UserDefinedType):
-                    if (
-                        field.type.name in self._ignore_types
-                        or field.type.name in cls.type_vars
-                    ):
-                        # Yet to learn know how to parse generic type variables.
-                        field.type = AnyType()
+        if isinstance(field_type, UserDefinedType):
+            if field_type.name in cls.type_vars:
+                # Yet to learn know how to parse generic type variables.
+                return AnyType()
+        return field_type
 
     def _recursively_parse_pydantic_model(self, cls: ClassDecl) -> None:
-        if not self._is_pydantic_model(cls) or cls.name in self._pydantic_classes:
+        if cls.name in self._pydantic_classes:
+            return None
+        if not (self._is_pydantic_model(cls) or self._is_enum(cls)):
             return None
 
         if fully_parsed_cls := self._finish_parsing_class(cls):
@@ -207,11 +587,12 @@ class _ParseModule(_Parse[cst.Module]):
         local_deps = []
         for dep in self._class_deps(cls):
             if resolved_dep_path := self._is_imported(dep):
-                if resolved_dep_path not in [
-                    "uuid.UUID",
-                    "datetime.datetime",
-                    "pydantic.BaseModel",
-                    "pydantic.generics.GenericModel",
+                if resolved_dep_path in self._ignore_types:
+                    # Don't even import the module.
+                    _logger.info("Ignore parsing '%s'", resolved_dep_path)
+                elif resolved_dep_path not in [
+                    *_PYDANTIC_BASES,
+                    *_ENUM_BASES,
                 ]:
                     self._external_models.add(resolved_dep_path)
                     self._model_graph.add_edge(cls.full_path, resolved_dep_path)
@@ -227,20 +608,24 @@ class _ParseModule(_Parse[cst.Module]):
                 )
         return local_deps
 
-    def _resolve_class_field_names(self, field_type: PyType) -> None:
+    def _resolve_class_field_names(self, field_type: PyType) -> PyType:
         """Resolve fully qualified model names in the field type."""
         match field_type:
             case UserDefinedType(name=name):
                 if full_qual_name := self._qualname(name):
-                    field_type.name = full_qual_name
-            case GenericType(type_vars=type_vars):
-                for type_var in type_vars:
-                    self._resolve_class_field_names(type_var)
+                    return UserDefinedType(name=full_qual_name)
+            case GenericType(generic=generic, type_vars=type_vars):
+                return GenericType(
+                    generic, [self._resolve_class_field_names(t) for t in type_vars]
+                )
             case UnionType(types=types):
-                for type_ in types:
-                    self._resolve_class_field_names(type_)
+                return UnionType([self._resolve_class_field_names(t) for t in types])
             case _:
                 ...
+        return field_type
+
+    def _replace_ignored_type(self, full_name: str) -> PyType | None:
+        return AnyType() if full_name in self._ignore_types else None
 
     def _qualname(self, type_name: str) -> str | None:
         # Type is local to this module.
@@ -265,15 +650,14 @@ class _ParseModule(_Parse[cst.Module]):
         return abs_cls_name
 
     def _class_deps(self, cls: ClassDecl) -> list[str]:
+        if isinstance(cls, EnumDecl):
+            # Enum members are plain values, hence nothing to depend on.
+            return []
+
         deps = [
             c
             for c in cls.base_classes
-            if self._is_imported(c)
-            not in [
-                "pydantic.BaseModel",
-                "pydantic.generics.GenericModel",
-                "typing.Generic",
-            ]
+            if self._is_imported(c) not in [*_PYDANTIC_BASES, "typing.Generic"]
         ]
         for f in cls.fields:
             for type_ in _get_user_defined_types(f.type):
@@ -286,7 +670,7 @@ class _ParseModule(_Parse[cst.Module]):
         """This case is easier as we traverse classes in a linear order parsing one by
         one."""
         for cls_decl in self._classes.values():
-            if self._is_pydantic_model(cls_decl):
+            if self._is_pydantic_model(cls_decl) or self._is_enum(cls_decl):
                 self._finish_parsing_class(cls_decl)
 
     def _finish_parsing_class(self, cls_decl: ClassDecl) -> ClassDecl | None:
@@ -294,14 +678,21 @@ class _ParseModule(_Parse[cst.Module]):
             _logger.info("Ignore parsing '%s'", cls_decl.full_path)
             return None
 
+        if self._is_enum(cls_decl):
+            live_enum = getattr(self._parsing_module, cls_decl.name, None)
+            parse_enum = _ParseEnumDecl(live_enum)
+            enum_decl = parse_enum.visit(self._class_nodes[cls_decl.name]).enum_decl
+            enum_decl = replace(enum_decl, full_path=cls_decl.full_path)
+            self._model_graph.add_node(enum_decl.full_path)
+            self._pydantic_classes[enum_decl.name] = enum_decl
+            return enum_decl
+
         cls = _ParseClassDecl().visit(self._class_nodes[cls_decl.name]).class_decl
-        cls.full_path = cls_decl.full_path
+        [cls] = map_field_types(
+            [replace(cls, full_path=cls_decl.full_path)], self._resolve_type_aliases
+        )
         self._model_graph.add_node(cls.full_path)
         self._pydantic_classes[cls.name] = cls
-
-        for f in cls.fields:
-            f.type = self._resolve_type_aliases(f.type)
-
         return cls
 
     def _resolve_type_aliases(self, tp: PyType) -> PyType:
@@ -310,9 +701,10 @@ class _ParseModule(_Parse[cst.Module]):
                 if node := self._alias_nodes.get(name):
                     assert node.value
                     return _extract_type(node.value)
-            case GenericType(type_vars=type_vars):
-                for i, type_var in enumerate(type_vars):
-                    tp.type_vars[i] = self._resolve_type_aliases(type_var)
+            case GenericType(generic=generic, type_vars=type_vars):
+                return GenericType(
+                    generic, [self._resolve_type_aliases(t) for t in type_vars]
+                )
             case _:
                 ...
 
@@ -320,10 +712,7 @@ class _ParseModule(_Parse[cst.Module]):
 
     def _is_pydantic_model(self, cls: ClassDecl) -> bool:
         for b in cls.base_classes:
-            if self._is_imported(b) in [
-                "pydantic.BaseModel",
-                "pydantic.generics.GenericModel",
-            ]:
+            if self._is_imported(b) in _PYDANTIC_BASES:
                 return True
 
         # TODO(povilas): when the base is imported model, it COULD be pydantic model
@@ -334,93 +723,229 @@ class _ParseModule(_Parse[cst.Module]):
 
         return False
 
+    def _is_enum(self, cls: ClassDecl) -> bool:
+        return any(self._is_imported(b) in _ENUM_BASES for b in cls.base_classes)
+
 
 class _ParseClassDecl(_Parse[cst.ClassDef]):
     def __init__(self) -> None:
         super().__init__()
-        self.class_decl = ClassDecl(name="to_be_parsed", base_classes=[])
+        self._name = "to_be_parsed"
+        self._base_classes: list[str] = []
+        self._comment: str | None = None
+        self._fields: list[ClassField] = []
+        self._type_vars: list[str] = []
         self._last_field_nr = 0
+        self._last_field: ClassField | None = None
+        """The one a docstring belongs to, `None` after a `ClassVar`."""
         self._depth = 0
 
-    def visit_ClassDef(self, node: cst.ClassDef):
+    @property
+    def class_decl(self) -> ClassDecl:
+        return ClassDecl(
+            name=self._name,
+            fields=self._fields,
+            base_classes=self._base_classes,
+            comment=self._comment,
+            type_vars=self._type_vars,
+        )
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> bool:
         # Guard against nested classes, e.g.
         #
         #     class Model(BaseModel):
         #         class Config:
         self._depth += 1
         if self._depth > 1:
-            return
+            return False
 
-        base_classes = [
-            b.value.value for b in node.bases if isinstance(b.value, cst.Name)
-        ]
-        self.class_decl = ClassDecl(name=node.name.value, base_classes=base_classes)
+        self._name = node.name.value
+        self._base_classes = _base_class_names(node)
+        for base in node.bases:
+            if isinstance(base.value, cst.Subscript):
+                for element in base.value.slice:
+                    self._type_vars += _names_within(element)
+        return True
 
-    @m.call_if_inside(m.ClassDef(bases=[m.AtLeastN(n=1)]))
-    @m.call_if_inside(m.Arg(value=m.Subscript()))
-    @m.call_if_inside(m.SubscriptElement())
-    def visit_Name(self, node: cst.Name) -> None:
-        self.class_decl.type_vars.append(node.value)
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
+        return False
 
-    @m.call_if_inside(m.ClassDef())
-    @m.call_if_not_inside(m.FunctionDef())
-    @m.call_if_inside(m.SimpleStatementLine(body=[m.AtMostN(m.Expr(), n=1)]))
-    def visit_SimpleString(self, node: cst.SimpleString):
-        comment = node.value.replace('"""', "")
+    def visit_SimpleStatementLine(self, node: cst.SimpleStatementLine) -> bool:
+        self._parse_statements(node.body)
+        return False
+
+    def visit_SimpleStatementSuite(self, node: cst.SimpleStatementSuite) -> bool:
+        """The one-line body, e.g. `class A(BaseModel): x: int; y: str`."""
+        self._parse_statements(node.body)
+        return False
 
+    def _parse_statements(self, statements: Sequence[cst.BaseSmallStatement]) -> None:
+        for stmt in statements:
+            match stmt:
+                case cst.Expr(value=cst.SimpleString(value=value)):
+                    self._parse_comment(value.replace('"""', ""))
+                case cst.AnnAssign():
+                    self._parse_field(stmt)
+                case _:
+                    ...
+
+    def _parse_comment(self, comment: str) -> None:
         if not self._last_field_nr:
-            self.class_decl.comment = comment
-        else:
-            self.class_decl.fields[self._last_field_nr - 1].comment = comment
+            self._comment = comment
+        elif self._last_field:
+            self._last_field = replace(self._last_field, comment=comment)
+            self._fields[-1] = self._last_field
 
-    @m.call_if_inside(m.ClassDef())
-    @m.call_if_not_inside(m.FunctionDef())
-    def visit_AnnAssign(self, node: cst.AnnAssign):
+    def _parse_field(self, node: cst.AnnAssign) -> None:
         self._last_field_nr += 1
 
         target = cst.ensure_type(node.target, cst.Name).value
         type_ = _extract_type(node.annotation.annotation)
         # ClassVars in pydantic models don't get serialized, hence we skip them.
         if isinstance(type_, UserDefinedType) and type_.name == "ClassVar":
+            self._last_field = None
             return
 
         default_value = _parse_value(node.value) if node.value else None
-        self.class_decl.fields.append(
-            ClassField(name=target, type=type_, default_value=default_value),
+        self._last_field = ClassField(
+            name=target, type=type_, default_value=default_value
+        )
+        self._fields.append(self._last_field)
+
+
+class _ParseEnumDecl(_Parse[cst.ClassDef]):
+    def __init__(self, live_enum: object = None) -> None:
+        """
+        Args:
+            live_enum: the imported enum class, its members have the values of
+                `auto()` and other non-literal expressions evaluated.
+        """
+        super().__init__()
+        self._name = "to_be_parsed"
+        self._base_classes: list[str] = []
+        self._comment: str | None = None
+        self._members: list[EnumMember] = []
+        self._depth = 0
+        self._live_members: Mapping[str, enum.Enum] = (
+            live_enum.__members__
+            if isinstance(live_enum, type) and issubclass(live_enum, enum.Enum)
+            else {}
+        )
+
+    @property
+    def enum_decl(self) -> EnumDecl:
+        return EnumDecl(
+            name=self._name,
+            base_classes=self._base_classes,
+            comment=self._comment,
+            members=self._members,
         )
 
+    def visit_ClassDef(self, node: cst.ClassDef) -> bool:
+        self._depth += 1
+        if self._depth > 1:
+            return False
+
+        self._name = node.name.value
+        self._base_classes = _base_class_names(node)
+        return True
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
+        return False
+
+    def visit_SimpleStatementLine(self, node: cst.SimpleStatementLine) -> bool:
+        self._parse_statements(node.body)
+        return False
+
+    def visit_SimpleStatementSuite(self, node: cst.SimpleStatementSuite) -> bool:
+        """The one-line body, e.g. `class Color(Enum): RED = 1`."""
+        self._parse_statements(node.body)
+        return False
+
+    def _parse_statements(self, statements: Sequence[cst.BaseSmallStatement]) -> None:
+        for stmt in statements:
+            match stmt:
+                case cst.Expr(value=cst.SimpleString(value=value)):
+                    if not self._members:
+                        self._comment = value.replace('"""', "")
+                case cst.Assign():
+                    self._parse_member(stmt)
+                case _:
+                    ...
+
+    def _parse_member(self, node: cst.Assign) -> None:
+        if len(node.targets) != 1 or not isinstance(node.targets[0].target, cst.Name):
+            _logger.warning("Unsupported enum member declaration: '%s'", node)
+            return
+
+        name = node.targets[0].target.value
+        # Enum's own configuration, e.g. `_ignore_`, is not a member.
+        if name.startswith("_"):
+            return
+
+        # The module isn't reloaded when its source changes, e.g. in the daemon,
+        # hence the live values are only for what the source doesn't spell out.
+        if _is_literal(node.value):
+            value = _parse_value(node.value)
+        elif (live_member := self._live_members.get(name)) is not None:
+            if live_member.name != name:
+                # An alias of another member, e.g. `DEFAULT = LIGHT`.
+                return
+            value = to_value(live_member.value)
+        else:
+            value = _parse_value(node.value)
+        self._members.append(EnumMember(name=name, value=value))
+
 
 class _ParseImportFrom(_Parse[cst.ImportFrom]):
     def __init__(self) -> None:
         super().__init__()
-        self._from = list[str]()
+        self._from = ""
         self._imports = list[Import]()
-        self._relative = 0
 
     def imports(self) -> list[Import]:
-        for imp in self._imports:
-            imp.from_module = "." * self._relative + ".".join(self._from)
-        return self._imports
-
-    def visit_ImportFrom(self, node: cst.ImportFrom):
-        self._relative = len(list(node.relative))
-
-    @m.call_if_not_inside(m.ImportAlias())
-    def visit_Name(self, node: cst.Name):
-        self._from.append(node.value)
-
-    def visit_ImportAlias(self, node: cst.ImportAlias) -> None:
-        import_name = cst.ensure_type(node.name, cst.Name).value
-        import_ = Import(from_module="", name=import_name)
-        if node.asname:
-            if isinstance(node.asname.name, cst.Name):
-                import_.alias = node.asname.name.value
-            else:
-                _logger.warning(
-                    "Don't know how to parse this import alias: '%s'", node.asname
-                )
+        return [replace(imp, from_module=self._from) for imp in self._imports]
+
+    def visit_ImportFrom(self, node: cst.ImportFrom) -> bool:
+        module = _dotted_name(node.module) if node.module else ""
+        self._from = "." * len(node.relative) + module
+        if isinstance(node.names, cst.ImportStar):
+            return False
+
+        for alias_node in node.names:
+            import_name = cst.ensure_type(alias_node.name, cst.Name).value
+            alias = None
+            if alias_node.asname:
+                if isinstance(alias_node.asname.name, cst.Name):
+                    alias = alias_node.asname.name.value
+                else:
+                    _logger.warning(
+                        "Don't know how to parse this import alias: '%s'",
+                        alias_node.asname,
+                    )
+            self._imports.append(Import(from_module="", name=import_name, alias=alias))
+        return False
+
+
+def _base_class_names(node: cst.ClassDef) -> list[str]:
+    return [b.value.value for b in node.bases if isinstance(b.value, cst.Name)]
+
+
+def _names_within(node: cst.CSTNode) -> list[str]:
+    """All the names in the expression, e.g. `T` and `U` in `Generic[T, U]`."""
+    if isinstance(node, cst.Name):
+        return [node.value]
+    return list(chain(*[_names_within(c) for c in node.children]))
 
-        self._imports.append(import_)
+
+def _dotted_name(node: cst.BaseExpression) -> str:
+    match node:
+        case cst.Name(value=name):
+            return name
+        case cst.Attribute(value=value, attr=cst.Name(value=attr)):
+            return f"{_dotted_name(value)}.{attr}"
+        case _:
+            raise AssertionError(f"Unexpected node in dotted name: '{node.__class__}'")
 
 
 def _extract_type(node: cst.BaseExpression) -> PyType:
@@ -561,6 +1086,8 @@ def _parse_value(node: cst.BaseExpression) -> PyValue:
             return PyString(value=value.replace('"', ""))
         case cst.Name(value="None"):
             return PyNone()
+        case cst.Name(value="True" | "False" as value):
+            return PyBool(value=value == "True")
         case cst.Dict():
             return PyDict()
         case cst.List():
@@ -580,51 +1107,59 @@ def _parse_value(node: cst.BaseExpression) -> PyValue:
             return PyNone()
 
 
+def _is_literal(node: cst.BaseExpression) -> bool:
+    match node:
+        case cst.SimpleString() | cst.Integer() | cst.Float():
+            return True
+        case cst.Name(value="None" | "True" | "False"):
+            return True
+        case _:
+            return False
+
+
 def _parse_value_from_call(node: cst.Call) -> PyValue | None:
-    if m.matches(
-        node,
-        m.Call(
-            func=m.Name("Field"),
-            args=[m.Arg(value=m.Name("list"), keyword=m.Name("default_factory"))],
-        ),
-    ):
-        return PyList()
-    if m.matches(
-        node,
-        m.Call(
-            func=m.Name("Field"),
-            args=[m.Arg(value=m.Name("dict"), keyword=m.Name("default_factory"))],
-        ),
-    ):
-        return PyDict()
-    return None
+    match node:
+        case cst.Call(
+            func=cst.Name(value="Field"),
+            args=[
+                cst.Arg(
+                    value=cst.Name(value="list"),
+                    keyword=cst.Name(value="default_factory"),
+                )
+            ],
+        ):
+            return PyList()
+        case cst.Call(
+            func=cst.Name(value="Field"),
+            args=[
+                cst.Arg(
+                    value=cst.Name(value="dict"),
+                    keyword=cst.Name(value="default_factory"),
+                )
+            ],
+        ):
+            return PyDict()
+        case _:
+            return None
 
 
 def _parse_field_constraints(node: cst.BaseExpression) -> PydanticField | None:
-    if not m.matches(
-        node,
-        m.Call(func=m.Name("Field")),
-    ):
-        return None
-    node = cst.ensure_type(node, cst.Call)
+    match node:
+        case cst.Call(func=cst.Name(value="Field"), args=args):
+            ...
+        case _:
+            return None
 
-    field_decl = PydanticField()
+    constraints: dict[str, PyValue] = {}
 
-    for arg in node.args:
+    for arg in args:
         if not (arg_name := arg.keyword):
             continue
 
-        arg_value = _parse_value(arg.value)
         match arg_name.value:
-            case "gt":
-                field_decl.gt = arg_value
-            case "ge":
-                field_decl.ge = arg_value
-            case "lt":
-                field_decl.lt = arg_value
-            case "le":
-                field_decl.le = arg_value
+            case "gt" | "ge" | "lt" | "le" as constraint:
+                constraints[constraint] = _parse_value(arg.value)
             case _:
                 ...
 
-    return field_decl
+    return PydanticField(**constraints)
@@ -0,0 +1,102 @@
+"""Model rename rules compiled into a single regular expression."""
+
+import re
+
+_REGEX_PREFIX = "re:"
+_PLACEHOLDER = re.compile(r"\$(\d+)")
+_IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*", re.ASCII)
+
+
+class RenameRules:
+    """Maps fully qualified model names to the names used in the generated code.
+
+    Rules are matched against the whole name:
+
+        "pkg.module.Model": "Model1"            exact name
+        "billing.v2.*Response": "V2$1"          `*` matches within a dotted segment
+        "legacy.**.*": "Legacy$2"               `**` matches across segments
+        r"re:pkg\\.v(\\d+)\\.(\\w+)": "$2V$1"      regular expression
+
+    Wildcards and regex groups are captured and numbered from `$1` in the
+    replacement. Exact names take precedence, otherwise the first matching
+    pattern wins. All the patterns are joined into a single regex, so they can't
+    use backreferences or named groups.
+
+    The new names must be valid TypeScript identifiers, e.g. `legacy.**` renaming
+    `legacy.orders.Order` to `Legacyorders.Order` is an error.
+    """
+
+    def __init__(self, rules: dict[str, str]) -> None:
+        self._exact: dict[str, str] = {}
+        self._patterns: dict[int, tuple[str, str, int]] = {}
+        """Pattern's group in the combined regex: rule, replacement, last inner
+        group."""
+
+        alternatives: list[str] = []
+        group_count = 0
+        for rule, replacement in rules.items():
+            if rule.startswith(_REGEX_PREFIX):
+                pattern = rule.removeprefix(_REGEX_PREFIX)
+            elif "*" in rule:
+                pattern = _glob_to_regex(rule)
+            else:
+                self._exact[rule] = _check_identifier(replacement, rule, rule)
+                continue
+
+            groups = re.compile(pattern).groups
+            alternatives.append(f"({pattern})")
+            self._patterns[group_count + 1] = (
+                rule,
+                replacement,
+                group_count + 1 + groups,
+            )
+            group_count += 1 + groups
+
+        self._matcher = re.compile("|".join(alternatives)) if alternatives else None
+        self._resolved: dict[str, str | None] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._exact or self._patterns)
+
+    def rename(self, full_name: str) -> str | None:
+        """New name or `None` if no rule matches.
+
+        Raises:
+            ValueError: the new name is not a valid identifier.
+        """
+        try:
+            return self._resolved[full_name]
+        except KeyError:
+            new_name = self._resolved[full_name] = self._match(full_name)
+            return new_name
+
+    def _match(self, full_name: str) -> str | None:
+        if new_name := self._exact.get(full_name):
+            return new_name
+        if self._matcher is None or not (match := self._matcher.fullmatch(full_name)):
+            return None
+
+        # The pattern's group closes after its inner groups.
+        rule_group = match.lastindex or 0
+        rule, replacement, last_group = self._patterns[rule_group]
+        captured = match.groups()[rule_group:last_group]
+        new_name = _PLACEHOLDER.sub(
+            lambda m: captured[int(m.group(1)) - 1] or "", replacement
+        )
+        return _check_identifier(new_name, full_name, rule)
+
+
+def _check_identifier(new_name: str, full_name: str, rule: str) -> str:
+    if not _IDENTIFIER.fullmatch(new_name):
+        raise ValueError(
+            f"Rule '{rule}' renames '{full_name}' to '{new_name}', which is not"
+            " a valid identifier"
+        )
+    return new_name
+
+
+def _glob_to_regex(glob: str) -> str:
+    parts = re.split(r"(\*\*|\*)", glob)
+    return "".join(
+        "(.*)" if p == "**" else "([^.]*)" if p == "*" else re.escape(p) for p in parts
+    )
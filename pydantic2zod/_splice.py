@@ -0,0 +1,123 @@
+"""Updates only the changed models in the previously generated zod code.
+
+Every model's code is wrapped in markers carrying the digest of the code:
+
+    // pydantic2zod:begin Order 3f2a9c1b0d4e5f67
+    export const Order = z.object({ ... });
+    // pydantic2zod:end Order
+
+so that a small change to the models makes a small diff of the output.
+"""
+
+import logging
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from pydantic2zod._codegen import Fragment
+
+_logger = logging.getLogger(__name__)
+
+_BEGIN = re.compile(r"^// pydantic2zod:begin (?P<name>\S+) (?P<digest>[0-9a-f]+)$")
+_END = "// pydantic2zod:end {name}"
+
+
+@dataclass(frozen=True)
+class _Block:
+    name: str
+    digest: str
+    """As written in the begin marker."""
+    code: str
+    """Between the markers."""
+
+
+def splice(existing: str, header: str, fragments: Sequence[Fragment]) -> str:
+    """Replace, add and remove the blocks of the models whose code changed.
+
+    The unchanged blocks keep their places, so do the changed ones. The new ones
+    are inserted after the model preceding them in `fragments`. The models are
+    reordered like `fragments` only when a block would precede the models it
+    refers to otherwise. Anything but the blocks, e.g. code without the markers,
+    is replaced by `header`.
+
+    Args:
+        existing: code produced by `splice()` before, or anything else to start over.
+        fragments: dependencies first.
+
+    Returns:
+        the new code, the same as `existing` when nothing changed.
+    """
+    old_blocks = {b.name: b for b in _parse_blocks(existing)}
+    new_fragments = {f.name: f for f in fragments}
+
+    order = [name for name in old_blocks if name in new_fragments]
+    placed = set(order)
+    for i, fragment in enumerate(fragments):
+        if fragment.name not in placed:
+            after = order.index(fragments[i - 1].name) + 1 if i else 0
+            order.insert(after, fragment.name)
+            placed.add(fragment.name)
+    if not _dependencies_first(order, new_fragments):
+        _logger.info("Reordering the models which refer to the ones following them")
+        order = [f.name for f in fragments]
+
+    replaced = [
+        name
+        for name in order
+        if name in old_blocks
+        and not _is_intact(old_blocks[name], new_fragments[name].digest)
+    ]
+    _logger.info(
+        "Spliced the models: %d replaced, %d added, %d removed",
+        len(replaced),
+        len(new_fragments.keys() - old_blocks.keys()),
+        len(old_blocks.keys() - new_fragments.keys()),
+    )
+    return "\n".join([header, *[_wrap(new_fragments[name]) for name in order]])
+
+
+def _wrap(fragment: Fragment) -> str:
+    return (
+        f"// pydantic2zod:begin {fragment.name} {fragment.digest}\n"
+        f"{fragment.code}\n"
+        f"{_END.format(name=fragment.name)}\n"
+    )
+
+
+def _is_intact(block: _Block, digest: str) -> bool:
+    """The block is up to date and wasn't edited by hand."""
+    return block.digest == digest and Fragment(block.name, block.code).digest == digest
+
+
+def _dependencies_first(order: list[str], fragments: dict[str, Fragment]) -> bool:
+    declared = set[str]()
+    for name in order:
+        if any(
+            dep in fragments and dep not in declared and dep != name
+            for dep in fragments[name].depends_on
+        ):
+            return False
+        declared.add(name)
+    return True
+
+
+def _parse_blocks(code: str) -> list[_Block]:
+    """
+    Raises:
+        ValueError: a block is missing its end marker.
+    """
+    blocks = []
+    lines = code.splitlines()
+    i = 0
+    while i < len(lines):
+        if not (begin := _BEGIN.match(lines[i])):
+            i += 1
+            continue
+        name = begin["name"]
+        try:
+            end = lines.index(_END.format(name=name), i + 1)
+        except ValueError:
+            raise ValueError(f"The block of '{name}' has no end marker") from None
+        blocks.append(_Block(name, begin["digest"], "\n".join(lines[i + 1 : end])))
+        i = end + 1
+    return blocks
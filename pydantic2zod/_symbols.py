@@ -0,0 +1,137 @@
+"""Where the symbols imported from packages are declared.
+
+Packages often re-export their models, e.g. `common/__init__.py` does
+`from .geo.models import Address`. The index tells the crawler to parse
+`common.geo.models` for `common.Address` instead of the `__init__` module, which
+doesn't declare the class.
+"""
+
+import ast
+import logging
+import threading
+from importlib.util import find_spec, resolve_name
+from pathlib import Path
+
+from pydantic2zod._trace import trace_span
+
+_logger = logging.getLogger(__name__)
+
+
+class SymbolIndex:
+    """Follows the `from x import y` chains across packages.
+
+    Every module on the way is scanned once, when a symbol from it is resolved the
+    first time. The scan reads the module's top-level statements with the standard
+    library's `ast` and imports nothing, not even the parent packages.
+
+    Usage:
+        index = SymbolIndex()
+        index.resolve("common.Address")  # "common.geo.models.Address"
+    """
+
+    def __init__(self) -> None:
+        self._scanned = set[str]()
+        self._imports: dict[str, str] = {}
+        """common.Address -> common.geo.models.Address"""
+        # The crawler resolves the dependencies in threads when run by `acrawl()`.
+        self._lock = threading.Lock()
+
+    def resolve(self, symbol: str) -> str:
+        """
+        Args:
+            symbol: a fully qualified name, e.g. `common.Address`.
+
+        Returns:
+            where the symbol is declared, or the symbol itself when it's not
+            imported from elsewhere.
+        """
+        seen = set[str]()
+        while symbol not in seen:
+            seen.add(symbol)
+            self._scan(symbol.rpartition(".")[0])
+            if (imported_from := self._imports.get(symbol)) is None:
+                break
+            symbol = imported_from
+        return symbol
+
+    def _scan(self, module_name: str) -> None:
+        with self._lock:
+            if module_name in self._scanned:
+                return
+            self._scanned.add(module_name)
+            if fname := _module_file(module_name):
+                with trace_span("index_symbols", "io", module=module_name):
+                    self._scan_module(module_name, fname)
+
+    def _scan_module(self, module_name: str, fname: Path) -> None:
+        try:
+            tree = ast.parse(fname.read_text(), str(fname))
+        except (OSError, SyntaxError, ValueError) as e:
+            _logger.debug("Not indexing '%s': %s", fname, e)
+            return
+
+        package = (
+            module_name
+            if fname.name == "__init__.py"
+            else module_name.rpartition(".")[0]
+        )
+        for stmt in _top_level_statements(tree.body):
+            match stmt:
+                case ast.ImportFrom(module=from_module, names=names, level=level):
+                    try:
+                        abs_from_module = resolve_name(
+                            "." * level + (from_module or ""), package
+                        )
+                    except (ImportError, ValueError):
+                        continue
+                    for alias in names:
+                        if alias.name == "*":
+                            continue
+                        name = alias.asname or alias.name
+                        self._imports[f"{module_name}.{name}"] = (
+                            f"{abs_from_module}.{alias.name}"
+                        )
+                case ast.ClassDef(name=name):
+                    # Declared after being imported.
+                    self._imports.pop(f"{module_name}.{name}", None)
+                case _:
+                    ...
+
+
+def _module_file(module_name: str) -> Path | None:
+    """Finds the source file without importing the parent packages, as
+    `find_spec()` would do."""
+    top_level, *submodules = module_name.split(".")
+    try:
+        spec = find_spec(top_level)
+    except (ImportError, ValueError):
+        return None
+    if not spec:
+        return None
+    if not submodules:
+        return (
+            Path(spec.origin) if spec.origin and spec.origin.endswith(".py") else None
+        )
+
+    for location in spec.submodule_search_locations or []:
+        path = Path(location, *submodules)
+        for fname in [path / "__init__.py", path.with_suffix(".py")]:
+            if fname.is_file():
+                return fname
+    return None
+
+
+def _top_level_statements(body: list[ast.stmt]) -> list[ast.stmt]:
+    """Including the ones guarded by `if TYPE_CHECKING:` or `try:`."""
+    statements = []
+    for stmt in body:
+        match stmt:
+            case ast.If(body=if_body, orelse=orelse):
+                statements += _top_level_statements(if_body + orelse)
+            case ast.Try(body=try_body, handlers=handlers, orelse=orelse):
+                statements += _top_level_statements(try_body + orelse)
+                for handler in handlers:
+                    statements += _top_level_statements(handler.body)
+            case _:
+                statements.append(stmt)
+    return statements
@@ -0,0 +1,137 @@
+"""Timeline of the compilation in the Chrome trace-event format, viewable in Perfetto
+or chrome://tracing.
+
+Usage:
+    with Trace() as trace:
+        compiler.parse("my_pkg.models").to_zod()
+    trace.save("trace.json")
+
+Like `memory_phase()`, `trace_span()` does nothing unless a trace is being recorded,
+so the compiler marks its steps unconditionally. The functions run in a process
+pool are wrapped with `worker_task()`, their events are sent back along with the
+results.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+from typing_extensions import Self
+
+_T = TypeVar("_T")
+
+
+class Trace:
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = [_process_name("pydantic2zod")]
+        """Appended to from the executor threads too, `list.append()` is atomic."""
+
+    def __enter__(self) -> Self:
+        global _active_trace
+        _active_trace = self
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        global _active_trace
+        _active_trace = None
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[None]:
+        event = {"name": name, "cat": category, "pid": os.getpid()}
+        event["tid"] = threading.get_native_id()
+        self.events.append(event | {"ph": "B", "ts": _now(), "args": args})
+        try:
+            yield
+        finally:
+            self.events.append(event | {"ph": "E", "ts": _now()})
+
+    def save(self, path: str | Path) -> None:
+        trace = {"traceEvents": self.events, "displayTimeUnit": "ms"}
+        Path(path).write_text(json.dumps(trace))
+
+
+_active_trace: Trace | None = None
+
+
+@contextmanager
+def trace_span(name: str, category: str, **args: Any) -> Iterator[None]:
+    """Record the begin and end of the code within, if a `Trace` is active.
+
+    Args:
+        category: groups the spans, e.g. "parse" or "codegen".
+        args: shown along with the span, must be JSON serializable.
+    """
+    if _active_trace is None:
+        yield
+    else:
+        with _active_trace.span(name, category, **args):
+            yield
+
+
+def worker_task(task: Callable[..., _T]) -> Callable[..., _T]:
+    """Wrap a function run in an executor, so that the spans it records in a worker
+    process end up in the active trace. Unwrap its results with `worker_result()`.
+
+    Returns:
+        the same function when no trace is active.
+    """
+    if _active_trace is None:
+        return task
+    return _WorkerTask(task, os.getpid())
+
+
+def worker_result(result: _T) -> _T:
+    """The result of a `worker_task()`, its events are added to the active trace."""
+    if isinstance(result, _TracedResult):
+        if _active_trace is not None:
+            _active_trace.events += result.events
+        return result.result
+    return result
+
+
+@dataclass
+class _TracedResult(Generic[_T]):
+    result: _T
+    events: list[dict[str, Any]]
+
+
+@dataclass
+class _WorkerTask(Generic[_T]):
+    task: Callable[..., _T]
+    parent_pid: int
+
+    def __call__(self, *args: Any) -> Any:
+        if os.getpid() == self.parent_pid:
+            # A thread of the same process records into the active trace.
+            return self.task(*args)
+
+        global _active_trace
+        # Forked workers inherit a copy of the parent's trace, don't record into it.
+        parent_trace, _active_trace = _active_trace, Trace()
+        try:
+            result = self.task(*args)
+            events = _active_trace.events
+        finally:
+            _active_trace = parent_trace
+        events[0] = _process_name(f"worker {os.getpid()}")
+        return _TracedResult(result, events)
+
+
+def _process_name(name: str) -> dict[str, Any]:
+    return {
+        "name": "process_name",
+        "ph": "M",
+        "pid": os.getpid(),
+        "args": {"name": name},
+    }
+
+
+def _now() -> float:
+    """Microseconds of the wall clock, which is the same for all the processes."""
+    return time.time_ns() / 1000
@@ -0,0 +1,91 @@
+"""Transformations of the parsed models shared by the frontends and the codegen."""
+
+from collections.abc import Callable, Sequence
+from dataclasses import replace
+
+from pydantic2zod.model import (
+    AnnotatedType,
+    ClassDecl,
+    ClassField,
+    GenericType,
+    PyType,
+    TupleType,
+    UnionType,
+    UserDefinedType,
+)
+
+
+def share_equal_types(models: list[ClassDecl]) -> list[ClassDecl]:
+    """Make the structurally equal field types the same object.
+
+    Hashing a type walks it all the first time. Shared types are hashed once, so
+    that looking up the code generated for them is cheap.
+    """
+    shared: dict[PyType, PyType] = {}
+    return map_field_types(models, lambda tp: shared.setdefault(tp, tp))
+
+
+def map_field_types(
+    models: list[ClassDecl], map_type: Callable[[PyType], PyType]
+) -> list[ClassDecl]:
+    """
+    Returns:
+        new models with the field types returned by `map_type`. The fields and the
+        models whose types are the same objects are reused.
+    """
+    mapped_models = []
+    for model in models:
+        fields = [_map_field_type(f, map_type) for f in model.fields]
+        if any(new is not old for new, old in zip(fields, model.fields)):
+            model = replace(model, fields=fields)
+        mapped_models.append(model)
+    return mapped_models
+
+
+def _map_field_type(
+    field: ClassField, map_type: Callable[[PyType], PyType]
+) -> ClassField:
+    if (field_type := map_type(field.type)) is field.type:
+        return field
+    return replace(field, type=field_type)
+
+
+def replace_types(
+    field_type: PyType, replace_model: Callable[[str], PyType | None]
+) -> PyType:
+    """Replace the references to other models, nested ones too.
+
+    Args:
+        replace_model: returns the replacement of a model by its fully qualified
+            name or `None` to keep it.
+
+    Returns:
+        the same `field_type` when nothing is replaced.
+    """
+    match field_type:
+        case UserDefinedType(name=name):
+            return replace_model(name) or field_type
+        case GenericType(generic=generic, type_vars=type_vars):
+            if (new_vars := _replace_types(type_vars, replace_model)) is not type_vars:
+                return GenericType(generic, new_vars)
+        case UnionType(types=types):
+            if (new_types := _replace_types(types, replace_model)) is not types:
+                return UnionType(new_types)
+        case TupleType(types=types):
+            if (new_types := _replace_types(types, replace_model)) is not types:
+                return TupleType(new_types)
+        case AnnotatedType(type_=type_, metadata=metadata):
+            if (new_type := replace_types(type_, replace_model)) is not type_:
+                return AnnotatedType(new_type, metadata)
+        case _:
+            ...
+    return field_type
+
+
+def _replace_types(
+    types: Sequence[PyType], replace_model: Callable[[str], PyType | None]
+) -> Sequence[PyType]:
+    new_types = [replace_types(t, replace_model) for t in types]
+    if all(new is old for new, old in zip(new_types, types)):
+        return types
+    return new_types
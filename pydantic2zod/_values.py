@@ -0,0 +1,70 @@
+"""Python values and primitive types in the program model, shared by the frontends.
+
+Doesn't depend on pydantic, so that parsing the sources doesn't need it installed.
+"""
+
+import enum
+import logging
+from collections.abc import Sequence
+from typing import Any, Literal
+
+from pydantic2zod.model import (
+    AnyType,
+    LiteralType,
+    PyBool,
+    PyDict,
+    PyFloat,
+    PyInteger,
+    PyList,
+    PyNone,
+    PyString,
+    PyValue,
+    UnionType,
+)
+
+_logger = logging.getLogger(__name__)
+
+PRIMITIVES: dict[Any, Literal["str", "bytes", "int", "float", "bool", "None"]] = {
+    str: "str",
+    bytes: "bytes",
+    int: "int",
+    float: "float",
+    bool: "bool",
+    None: "None",
+    type(None): "None",
+}
+"""Names of the primitive types by the Python type."""
+
+
+def to_value(value: Any) -> PyValue:
+    """The IR of a Python value, e.g. a default or an enum member."""
+    match value:
+        case None:
+            return PyNone()
+        case enum.Enum(value=member_value):
+            return to_value(member_value)
+        case str():
+            return PyString(value=value)
+        case bool():
+            return PyBool(value=value)
+        case int():
+            return PyInteger(value=str(value))
+        case float():
+            return PyFloat(value=repr(value))
+        case dict() if not value:
+            return PyDict()
+        case list() if not value:
+            return PyList()
+        case other:
+            _logger.warning("Unsupported value type: '%s'", other)
+            return PyNone()
+
+
+def literal_type(values: Sequence[Any]) -> LiteralType | UnionType | AnyType:
+    """The type of `Literal[*values]`."""
+    if not all(isinstance(v, str) for v in values):
+        _logger.warning("Only string literals are supported: '%s'", values)
+        return AnyType()
+    if len(values) == 1:
+        return LiteralType(value=values[0])
+    return UnionType(types=[LiteralType(value=v) for v in values])
@@ -2,21 +2,68 @@
 
 Once the source code is parsed we use this in-mem model to manipulate it
 programmatically: e.g. generate TypeScript code, etc.
+
+The model is immutable, so that the same parsed models could be shared by several
+compilations. Modify it with `dataclasses.replace()`, which creates a new object
+and reuses the unchanged parts:
+
+    replace(cls, fields=[replace(f, type=AnyType()) for f in cls.fields])
 """
 
-from dataclasses import dataclass, field
-from typing import Literal
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+
+class _Frozen:
+    """Lists given to the constructor are kept as tuples, so that nobody could
+    modify them in place."""
+
+    __slots__ = ()
+
+    def __post_init__(self) -> None:
+        for name, value in self.__dict__.items():
+            if value.__class__ is list:
+                object.__setattr__(self, name, tuple(value))
+
+
+class _ValueObject:
+    """Compared and hashed by the field values, so that structurally equal types could
+    be used as dict keys, e.g. to reuse the code generated for them.
 
+    Subclasses are declared with `@dataclass(frozen=True, eq=False)` to keep these
+    methods. The hash is computed once.
+    """
 
-@dataclass
-class PyType: ...
+    __slots__ = ("_hash",)
 
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        # Dataclass fields.
+        return self.__dict__ == other.__dict__
 
-@dataclass
-class PyValue: ...
+    def __hash__(self) -> int:
+        value_hash = getattr(self, "_hash", None)
+        if value_hash is None:
+            value_hash = hash((self.__class__, *self.__dict__.values()))
+            object.__setattr__(self, "_hash", value_hash)
+        return value_hash
 
+    def __getstate__(self) -> dict[str, Any]:
+        # String hashes differ between processes, so the cached hash is not copied.
+        return self.__dict__
 
-@dataclass
+
+@dataclass(frozen=True, eq=False)
+class PyType(_ValueObject): ...
+
+
+@dataclass(frozen=True, eq=False)
+class PyValue(_ValueObject): ...
+
+
+@dataclass(frozen=True)
 class Import:
     from_module: str
     "pkg.module1"
@@ -28,7 +75,7 @@ class Import:
     """`import module.Class as OtherClass`"""
 
 
-@dataclass
+@dataclass(frozen=True)
 class ClassField:
     name: str
     type: PyType
@@ -36,24 +83,37 @@ class ClassField:
     comment: str | None = None
 
 
-@dataclass
-class ClassDecl:
+@dataclass(frozen=True)
+class ClassDecl(_Frozen):
     name: str
     full_path: str = ""
     """pkg1.module.ClassName"""
-    fields: list[ClassField] = field(default_factory=list)
-    base_classes: list[str] = field(default_factory=list)
+    fields: Sequence[ClassField] = ()
+    base_classes: Sequence[str] = ()
     comment: str | None = None
-    type_vars: list[str] = field(default_factory=list)
+    type_vars: Sequence[str] = ()
     """Generic type variables as they appear in `Cls(Generic[T1, T2, T3])`."""
 
 
-@dataclass
+@dataclass(frozen=True)
+class EnumMember:
+    name: str
+    value: PyValue
+
+
+@dataclass(frozen=True)
+class EnumDecl(ClassDecl):
+    """`enum.Enum` subclass: a named set of values rather than a data model."""
+
+    members: Sequence[EnumMember] = ()
+
+
+@dataclass(frozen=True, eq=False)
 class PyString(PyValue):
     value: str
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class PyNone(PyValue):
     """A placeholder for `None` value."""
 
@@ -61,34 +121,39 @@ class PyNone(PyValue):
         return "PyNone"
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class PyName(PyValue):
     """A symbolic reference to a variable, class, function, etc."""
 
     value: str
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
+class PyBool(PyValue):
+    value: bool
+
+
+@dataclass(frozen=True, eq=False)
 class PyDict(PyValue):
     """Represents an empty dict for now."""
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class PyList(PyValue):
     """Represents an empty list for now."""
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class PyInteger(PyValue):
     value: str
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class PyFloat(PyValue):
     value: str
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class BuiltinType(PyType):
     name: Literal[
         "str",
@@ -102,44 +167,64 @@ class BuiltinType(PyType):
     ]
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class PrimitiveType(PyType):
     name: Literal["str", "bytes", "int", "float", "bool", "None"]
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class UserDefinedType(PyType):
     name: str
 
 
-@dataclass
-class GenericType(PyType):
+@dataclass(frozen=True, eq=False)
+class GenericType(_Frozen, PyType):
     generic: str
-    type_vars: list[PyType]
+    type_vars: Sequence[PyType]
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class LiteralType(PyType):
     value: str
 
 
-@dataclass
-class UnionType(PyType):
-    types: list[PyType]
+@dataclass(frozen=True, eq=False)
+class UnionType(_Frozen, PyType):
+    types: Sequence[PyType]
+
+
+@dataclass(frozen=True, eq=False)
+class TupleType(_Frozen, PyType):
+    types: Sequence[PyType]
+
+
+@dataclass(frozen=True, eq=False)
+class KnownType(PyType):
+    """A well-known type from outside the parsed sources, e.g. `decimal.Decimal`.
+
+    It's not parsed but mapped directly to the target languages.
+    """
+
+    name: str
+    "decimal.Decimal"
+
+    zod: str
+    "z.union([z.number(), z.string()])"
 
+    ts: str = "any"
+    "number | string"
 
-@dataclass
-class TupleType(PyType):
-    types: list[PyType]
+    json_schema: str = "{}"
+    """JSON encoded: `{"anyOf": [{"type": "number"}, {"type": "string"}]}`"""
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class AnyType(PyType):
     """Represents `typing.Any`."""
 
 
-@dataclass
-class PydanticField:
+@dataclass(frozen=True, eq=False)
+class PydanticField(_ValueObject):
     """Some constraints from `pydantic.Field()` declaration."""
 
     gt: PyValue | None = None
@@ -148,7 +233,7 @@ class PydanticField:
     le: PyValue | None = None
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class AnnotatedType(PyType):
     """Represents `typing.Annotated`."""
 
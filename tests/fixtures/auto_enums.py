@@ -0,0 +1,26 @@
+from enum import Enum, IntEnum, auto
+
+from pydantic import BaseModel
+
+
+class Color(Enum):
+    RED = auto()
+    GREEN = auto()
+
+
+class Shade(str, Enum):
+    LIGHT = "light"
+    DARK = "dark"
+    DEFAULT = LIGHT
+
+
+class Level(IntEnum):
+    ZERO = 0
+    ONE = 1
+    DEFAULT = ZERO
+
+
+class Paint(BaseModel):
+    color: Color
+    shade: Shade
+    level: Level
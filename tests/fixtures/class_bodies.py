@@ -0,0 +1,25 @@
+from typing import ClassVar
+
+from pydantic import BaseModel, field_validator
+
+
+class Order(BaseModel):
+    """An order."""
+
+    table: ClassVar[str] = "orders"
+    """Not a field."""
+    id: int
+
+    class Meta:
+        table: str = "orders"
+        """Not a comment of the model."""
+
+    total: float
+    """In euros."""
+
+    @field_validator("total")
+    @classmethod
+    def _positive(cls, total: float) -> float:
+        checked: float = abs(total)
+        "Not a comment either."
+        return checked
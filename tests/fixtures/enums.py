@@ -0,0 +1,25 @@
+from enum import Enum, IntEnum
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+class Currency(str, Enum):
+    """ISO 4217 currency code."""
+
+    EUR = "EUR"
+    USD = "USD"
+    GBP = "GBP"
+
+
+class Priority(IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class Payment(BaseModel):
+    currency: Currency
+    priority: Priority
+    method: Literal["card", "transfer", "cash"]
+    channel: Optional[Literal["web", "mobile"]]
+    status: Literal["pending"] | Literal["done"] | None
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from .enums import Currency, Priority
+
+
+class Base(BaseModel):
+    """Shared by all the records."""
+
+    id: UUID
+    created_at: datetime
+
+
+class Tag(BaseModel):
+    name: str
+    weight: float = 0.0
+
+
+class Entry(Base):
+    title: str
+    """Shown in the UI."""
+    count: int
+    tags: list[Tag] = Field(default_factory=list)
+    labels: dict[str, int] = Field(default_factory=dict)
+    extra: dict
+    items: list
+    kind: Literal["a", "b"]
+    single: Literal["x"]
+    parent: Optional[Tag]
+    span: tuple[int, str]
+    currency: Currency
+    priority: Priority
+    enabled: bool
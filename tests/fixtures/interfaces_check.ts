@@ -0,0 +1,25 @@
+/**
+ * The interfaces generated with `interfaces=True` must describe the same values as
+ * the types zod infers from the schemas generated without it. Compiled by
+ * `tests/test_compile.py` next to the generated `declared_*.ts` and `inferred_*.ts`.
+ */
+import type * as declared from "./declared_interfaces";
+import type * as declaredOverrides from "./declared_overrides";
+import type * as inferred from "./inferred_interfaces";
+import type * as inferredOverrides from "./inferred_overrides";
+
+/** Mutually assignable, even if spelled differently. */
+type Same<A, B> = [A] extends [B] ? ([B] extends [A] ? true : false) : false;
+type Assert<T extends true> = T;
+
+export type Checks = [
+  Assert<Same<declared.CurrencyType, inferred.CurrencyType>>,
+  Assert<Same<declared.PriorityType, inferred.PriorityType>>,
+  Assert<Same<declared.BaseType, inferred.BaseType>>,
+  Assert<Same<declared.TagType, inferred.TagType>>,
+  Assert<Same<declared.EntryType, inferred.EntryType>>,
+  Assert<Same<declaredOverrides.AnimalType, inferredOverrides.AnimalType>>,
+  Assert<Same<declaredOverrides.DogType, inferredOverrides.DogType>>,
+  Assert<Same<declaredOverrides.PuppyType, inferredOverrides.PuppyType>>,
+  Assert<Same<declaredOverrides.CatType, inferredOverrides.CatType>>,
+];
@@ -0,0 +1,13 @@
+from datetime import date
+from decimal import Decimal
+from ipaddress import IPv4Address
+
+from pydantic import BaseModel, HttpUrl
+
+
+class Invoice(BaseModel):
+    issued_on: date
+    total: Decimal
+    payment_url: HttpUrl
+    client_ip: IPv4Address | None
+    due_dates: list[date]
@@ -0,0 +1,11 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+# fmt: off
+class Point(BaseModel): x: int; y: str
+
+
+class Color(Enum): RED = 1; GREEN = 2
+# fmt: on
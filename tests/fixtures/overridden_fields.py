@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+
+class Animal(BaseModel):
+    name: str
+    age: int
+
+
+class Dog(Animal):
+    age: float  # pyright: ignore[reportIncompatibleVariableOverride]
+    """Dogs age in fractions of years."""
+    breed: str
+
+
+class Puppy(Dog):
+    name: str | None  # pyright: ignore[reportIncompatibleVariableOverride]
+
+
+class Cat(Animal):
+    indoor: bool
@@ -0,0 +1,3 @@
+from .geo import Address
+
+__all__ = ["Address"]
@@ -0,0 +1 @@
+from tests.fixtures.reexports.geo.models import Address as Address
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+from tests.fixtures.reexports import Address
+
+
+class User(BaseModel):
+    address: Address
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+from .vendor.sdk import Client, Token
+
+
+class Account(BaseModel):
+    name: str
+    client: Client
+    tokens: list[Token]
@@ -6,6 +6,53 @@ from snapshottest import Snapshot
 
 snapshots = Snapshot()
 
+snapshots["TestEmitters.test_plain_typescript_types 1"] = """
+/**
+ * NOTE: automatically generated by the pydantic2zod compiler.
+ */
+
+/**
+ * Shared by all the records.
+ */
+export interface BaseType {
+  id: string;
+  created_at: string;
+}
+
+export interface TagType {
+  name: string;
+  weight: number;
+}
+
+/**
+ * ISO 4217 currency code.
+ */
+export type CurrencyType =
+  | "EUR"
+  | "USD"
+  | "GBP";
+
+export type PriorityType =
+  | 1
+  | 2;
+
+export interface EntryType extends BaseType {
+  title: string;
+  count: number;
+  tags: Array<TagType>;
+  labels: Record<string, number>;
+  extra: Record<string, any>;
+  items: Array<any>;
+  kind: "a" | "b";
+  single: "x";
+  parent: TagType | null;
+  span: [number, string];
+  currency: CurrencyType;
+  priority: PriorityType;
+  enabled: boolean;
+}
+"""
+
 snapshots["test_annotated_fields 1"] = """
 /**
  * NOTE: automatically generated by the pydantic2zod compiler.
@@ -53,6 +100,241 @@ export const RpcMessage = z.object({
 export type RpcMessageType = z.infer<typeof RpcMessage>;
 """
 
+snapshots["test_enums_and_literal_sets 1"] = """
+/**
+ * NOTE: automatically generated by the pydantic2zod compiler.
+ */
+
+import { z } from "zod";
+
+/**
+ * ISO 4217 currency code.
+ */
+export const Currency = z.enum([
+  "EUR",
+  "USD",
+  "GBP",
+]);
+export type CurrencyType = z.infer<typeof Currency>;
+
+export const Priority = z.nativeEnum({
+  LOW: 1,
+  HIGH: 2,
+} as const);
+export type PriorityType = z.infer<typeof Priority>;
+
+export const Payment = z.object({
+  currency: Currency,
+  priority: Priority,
+  method: z.enum([
+    "card",
+    "transfer",
+    "cash",
+  ]),
+  channel: z.union([
+    z.enum([
+      "web",
+      "mobile",
+    ]),
+    z.null(),
+  ]),
+  status: z.union([
+    z.enum([
+      "pending",
+      "done",
+    ]),
+    z.null(),
+  ]),
+}).strict();
+export type PaymentType = z.infer<typeof Payment>;
+"""
+
+snapshots["test_explicit_interfaces 1"] = """
+/**
+ * NOTE: automatically generated by the pydantic2zod compiler.
+ */
+
+import { z } from "zod";
+
+/**
+ * Shared by all the records.
+ */
+export interface BaseType {
+  id: string;
+  created_at: string;
+}
+const _BaseShape = {
+  id: z.string().uuid(),
+  created_at: z.string().datetime(),
+};
+export const Base: z.ZodType<BaseType, z.ZodTypeDef, unknown> = z.object(_BaseShape).strict();
+
+export interface TagType {
+  name: string;
+  weight: number;
+}
+export const Tag: z.ZodType<TagType, z.ZodTypeDef, unknown> = z.object({
+  name: z.string(),
+  weight: z.number().default(0.0),
+}).strict();
+
+/**
+ * ISO 4217 currency code.
+ */
+export const Currency = z.enum([
+  "EUR",
+  "USD",
+  "GBP",
+]);
+export type CurrencyType = z.infer<typeof Currency>;
+
+export const Priority = z.nativeEnum({
+  LOW: 1,
+  HIGH: 2,
+} as const);
+export type PriorityType = z.infer<typeof Priority>;
+
+export interface EntryType extends BaseType {
+  title: string;
+  count: number;
+  tags: Array<TagType>;
+  labels: Record<string, number>;
+  extra: Record<string, any>;
+  items: Array<any>;
+  kind: "a" | "b";
+  single: "x";
+  parent: TagType | null;
+  span: [number, string];
+  currency: CurrencyType;
+  priority: PriorityType;
+  enabled: boolean;
+}
+export const Entry: z.ZodType<EntryType, z.ZodTypeDef, unknown> = z.object({
+  ..._BaseShape,
+  /**
+   * Shown in the UI.
+   */
+  title: z.string(),
+  count: z.number().int(),
+  tags: z.array(Tag).default([]),
+  labels: z.record(z.string(), z.number().int()).default({}),
+  extra: z.record(z.any()),
+  items: z.array(z.any()),
+  kind: z.enum([
+    "a",
+    "b",
+  ]),
+  single: z.literal("x"),
+  parent: z.union([
+    Tag,
+    z.null(),
+  ]),
+  span: z.tuple([
+    z.number().int(),
+    z.string(),
+  ]),
+  currency: Currency,
+  priority: Priority,
+  enabled: z.boolean(),
+}).strict();
+"""
+
+snapshots["test_explicit_interfaces_with_lazy_schemas 1"] = """
+/**
+ * NOTE: automatically generated by the pydantic2zod compiler.
+ */
+
+import { z } from "zod";
+
+/** Builds the schema on first use and reuses it afterwards. */
+function _lazy<T>(build: () => T): () => T {
+  let schema: T | undefined;
+  return () => (schema ??= build());
+}
+
+/**
+ * Shared by all the records.
+ */
+export interface BaseType {
+  id: string;
+  created_at: string;
+}
+const _BaseShape = _lazy(() => ({
+  id: z.string().uuid(),
+  created_at: z.string().datetime(),
+}));
+export const Base: () => z.ZodType<BaseType, z.ZodTypeDef, unknown> = _lazy(() => z.object(_BaseShape()).strict());
+
+export interface TagType {
+  name: string;
+  weight: number;
+}
+export const Tag: () => z.ZodType<TagType, z.ZodTypeDef, unknown> = _lazy(() => z.object({
+  name: z.string(),
+  weight: z.number().default(0.0),
+}).strict());
+
+/**
+ * ISO 4217 currency code.
+ */
+export const Currency = _lazy(() => z.enum([
+  "EUR",
+  "USD",
+  "GBP",
+]));
+export type CurrencyType = z.infer<ReturnType<typeof Currency>>;
+
+export const Priority = _lazy(() => z.nativeEnum({
+  LOW: 1,
+  HIGH: 2,
+} as const));
+export type PriorityType = z.infer<ReturnType<typeof Priority>>;
+
+export interface EntryType extends BaseType {
+  title: string;
+  count: number;
+  tags: Array<TagType>;
+  labels: Record<string, number>;
+  extra: Record<string, any>;
+  items: Array<any>;
+  kind: "a" | "b";
+  single: "x";
+  parent: TagType | null;
+  span: [number, string];
+  currency: CurrencyType;
+  priority: PriorityType;
+  enabled: boolean;
+}
+export const Entry: () => z.ZodType<EntryType, z.ZodTypeDef, unknown> = _lazy(() => z.object({
+  ..._BaseShape(),
+  /**
+   * Shown in the UI.
+   */
+  title: z.string(),
+  count: z.number().int(),
+  tags: z.array(Tag()).default([]),
+  labels: z.record(z.string(), z.number().int()).default({}),
+  extra: z.record(z.any()),
+  items: z.array(z.any()),
+  kind: z.enum([
+    "a",
+    "b",
+  ]),
+  single: z.literal("x"),
+  parent: z.union([
+    Tag(),
+    z.null(),
+  ]),
+  span: z.tuple([
+    z.number().int(),
+    z.string(),
+  ]),
+  currency: Currency(),
+  priority: Priority(),
+  enabled: z.boolean(),
+}).strict());
+"""
+
 snapshots["test_generic_field_type_is_any_with_no_typevar_bounds 1"] = """
 /**
  * NOTE: automatically generated by the pydantic2zod compiler.
@@ -97,6 +379,37 @@ export const Class = z.object({
 export type ClassType = z.infer<typeof Class>;
 """
 
+snapshots["test_lazy_schemas 1"] = """
+/**
+ * NOTE: automatically generated by the pydantic2zod compiler.
+ */
+
+import { z } from "zod";
+
+/** Builds the schema on first use and reuses it afterwards. */
+function _lazy<T>(build: () => T): () => T {
+  let schema: T | undefined;
+  return () => (schema ??= build());
+}
+
+export const Class = _lazy(() => z.object({
+  name: z.string(),
+  methods: z.array(z.string()),
+}).strict());
+export type ClassType = z.infer<ReturnType<typeof Class>>;
+
+export const DataClass = _lazy(() => Class().extend({
+  frozen: z.boolean(),
+}).strict());
+export type DataClassType = z.infer<ReturnType<typeof DataClass>>;
+
+export const Module = _lazy(() => z.object({
+  name: z.string(),
+  classes: z.array(DataClass()),
+}).strict());
+export type ModuleType = z.infer<ReturnType<typeof Module>>;
+"""
+
 snapshots["test_renames_models_based_on_given_rules 1"] = """
 /**
  * NOTE: automatically generated by the pydantic2zod compiler.
@@ -135,6 +448,26 @@ export const User = z.object({
 export type UserType = z.infer<typeof User>;
 """
 
+snapshots["test_well_known_types 1"] = """
+/**
+ * NOTE: automatically generated by the pydantic2zod compiler.
+ */
+
+import { z } from "zod";
+
+export const Invoice = z.object({
+  issued_on: z.string().date(),
+  total: z.union([z.number(), z.string()]),
+  payment_url: z.string().url(),
+  client_ip: z.union([
+    z.string().ip({ version: "v4" }),
+    z.null(),
+  ]),
+  due_dates: z.array(z.string().date()),
+}).strict();
+export type InvoiceType = z.infer<typeof Invoice>;
+"""
+
 snapshots["test_with_pydantic_model_config 1"] = """
 /**
  * NOTE: automatically generated by the pydantic2zod compiler.
@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import pytest
+
+from pydantic2zod import CacheStats, Compiler, ModuleCache
+
+
+def test_reuses_modules_across_parse_calls():
+    compiler = Compiler()
+    compiler.parse("tests.fixtures.interfaces")
+    first_stats = compiler.module_cache.stats()
+    zod_src = compiler.parse("tests.fixtures.interfaces").to_zod()
+
+    stats = compiler.module_cache.stats()
+    assert stats.misses == first_stats.misses
+    assert stats.hits == first_stats.misses
+    assert zod_src == Compiler().parse("tests.fixtures.interfaces").to_zod()
+
+
+def test_shared_between_compilers():
+    cache = ModuleCache()
+    Compiler(module_cache=cache).parse("tests.fixtures.external")
+    Compiler(module_cache=cache).parse("tests.fixtures.external")
+
+    stats = cache.stats()
+    assert stats.hits == stats.misses == stats.entries
+    assert stats.size > 0
+
+
+def _write_modules(tmp_path: Path, prefix: str, count: int) -> list[str]:
+    """Module names are unique per test as the imported modules stay imported."""
+    modules = [f"{prefix}_{i}" for i in range(count)]
+    for i, module in enumerate(modules):
+        (tmp_path / f"{module}.py").write_text(
+            f"from pydantic import BaseModel\n\nclass M{i}(BaseModel):\n    x: int\n"
+        )
+    return modules
+
+
+def test_evicts_least_recently_used(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    first, second, third = _write_modules(tmp_path, "lru_models", 3)
+    compiler = Compiler(module_cache=ModuleCache(max_entries=2))
+
+    compiler.parse(first).parse(second).parse(first).parse(third).parse(first)
+
+    assert compiler.module_cache.stats() == CacheStats(
+        hits=2,
+        misses=3,
+        evictions=1,
+        entries=2,
+        size=compiler.module_cache.stats().size,
+    )
+
+
+def test_bounded_by_size(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    modules = _write_modules(tmp_path, "sized_models", 3)
+    cache = ModuleCache(max_entries=None, max_bytes=1)
+
+    for module in modules:
+        Compiler(module_cache=cache).parse(module)
+
+    stats = cache.stats()
+    assert (stats.entries, stats.evictions) == (1, 2)
+
+
+def test_parses_modified_modules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    [module] = _write_modules(tmp_path, "modified_models", 1)
+    compiler = Compiler()
+    compiler.parse(module)
+
+    fname = tmp_path / f"{module}.py"
+    fname.write_text(fname.read_text().replace("x: int", "x: float"))
+
+    assert "x: z.number()," in compiler.parse(module).to_zod()
+    assert compiler.module_cache.stats().misses == 2
@@ -0,0 +1,103 @@
+from pydantic2zod._chunks import split_into_chunks
+from pydantic2zod._compiler import Compiler
+from pydantic2zod.model import ClassDecl, ClassField, UserDefinedType
+
+
+def _model(full_path: str, *deps: str) -> ClassDecl:
+    return ClassDecl(
+        name=full_path.split(".")[-1],
+        full_path=full_path,
+        base_classes=["BaseModel"],
+        fields=[ClassField(name=d.lower(), type=UserDefinedType(name=d)) for d in deps],
+    )
+
+
+def _chunk_names(models: list[ClassDecl], max_chunk_size: int) -> dict[str, str]:
+    chunks = split_into_chunks(models, lambda _: 10, max_chunk_size)
+    return {cls.name: c.name for c in chunks for cls in c.models}
+
+
+def test_whole_package_when_it_fits():
+    models = [_model("shop.orders.Order"), _model("shop.users.User")]
+
+    assert _chunk_names(models, 20) == {"Order": "models", "User": "models"}
+    assert _chunk_names([*models, _model("billing.Invoice")], 20) == {
+        "Invoice": "billing",
+        "Order": "shop",
+        "User": "shop",
+    }
+
+
+def test_splits_modules_too_large_on_their_own():
+    models = [
+        _model("shop.orders.Item"),
+        _model("shop.orders.Order", "Item"),
+        _model("shop.orders.Refund", "Order"),
+        _model("shop.users.User"),
+    ]
+
+    assert _chunk_names(models, 20) == {
+        "Item": "shop.orders",
+        "Order": "shop.orders",
+        "Refund": "shop.orders.2",
+        "User": "shop.users",
+    }
+
+
+def test_models_stay_in_their_chunks_when_others_are_added():
+    models = [
+        _model("shop.orders.Order"),
+        _model("shop.users.User"),
+        _model("shop.users.Address"),
+    ]
+    before = _chunk_names(models, 20)
+
+    after = _chunk_names([*models, _model("shop.users.Phone")], 20)
+
+    assert after == before | {"Phone": "shop.users.2"}
+
+
+def test_merges_chunks_importing_each_other():
+    models = [
+        _model("shop.a.Tag"),
+        _model("shop.b.Item", "Tag"),
+        _model("shop.a.Order", "Item"),
+        _model("shop.c.User"),
+    ]
+
+    assert _chunk_names(models, 20) == {
+        "Tag": "shop.a",
+        "Order": "shop.a",
+        "Item": "shop.a",
+        "User": "shop.c",
+    }
+
+
+def test_chunks_import_only_what_they_use():
+    chunks = Compiler().parse("tests.fixtures.interfaces").to_zod_chunks(300)
+
+    assert chunks["index.ts"].endswith(
+        'export * from "./tests.fixtures.enums";\n'
+        'export * from "./tests.fixtures.interfaces";\n'
+        'export * from "./tests.fixtures.interfaces.2";\n'
+        'export * from "./tests.fixtures.interfaces.3";\n'
+    )
+    assert 'from "./' not in chunks["tests.fixtures.enums.ts"]
+    assert (
+        'import { Currency, Priority } from "./tests.fixtures.enums";\n'
+        'import { Base } from "./tests.fixtures.interfaces";\n'
+        'import { Tag } from "./tests.fixtures.interfaces.2";\n'
+    ) in chunks["tests.fixtures.interfaces.3.ts"]
+    assert (
+        "export const Entry = Base.extend({" in chunks["tests.fixtures.interfaces.3.ts"]
+    )
+
+
+def test_keeps_shared_shapes_with_subclasses():
+    compiler = Compiler().parse("tests.fixtures.interfaces")
+
+    chunks = compiler.to_zod_chunks(300, interfaces=True)
+
+    [chunk] = [code for code in chunks.values() if "const _BaseShape" in code]
+    assert "export interface EntryType extends BaseType {" in chunk
+    assert 'import { Tag, type TagType } from "./tests.fixtures.interfaces.2";' in chunk
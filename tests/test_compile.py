@@ -1,8 +1,20 @@
+import asyncio
+import json
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import FrozenInstanceError, replace
+from enum import Enum
+from pathlib import Path
+
 import pydantic
 import pytest
 from snapshottest.module import SnapshotTest
 
+from pydantic2zod import JsonSchemaEmitter, ModuleCache, TsTypesEmitter, _codegen
 from pydantic2zod._compiler import Compiler
+from pydantic2zod.model import ClassDecl, KnownType
 
 
 def test_renames_models_based_on_given_rules(snapshot: SnapshotTest):
@@ -48,9 +60,368 @@ def test_builtin_types(snapshot: SnapshotTest):
     snapshot.assert_match(out_src)
 
 
+def test_well_known_types(snapshot: SnapshotTest):
+    out_src = Compiler().parse("tests.fixtures.known_types").to_zod()
+    snapshot.assert_match(out_src)
+
+
+def test_custom_well_known_types():
+    class MyCompiler(Compiler):
+        KNOWN_TYPES = [KnownType("decimal.Decimal", "z.string()", "string")]
+
+    out_src = MyCompiler().parse("tests.fixtures.known_types").to_zod()
+
+    assert "  total: z.string(),\n" in out_src
+
+
 @pytest.mark.skipif(
     not pydantic.VERSION.startswith("2"), reason="Only works with pydantic v2"
 )
 def test_annotated_fields(snapshot: SnapshotTest):
     out_src = Compiler().parse("tests.fixtures.annotated_fields").to_zod()
     snapshot.assert_match(out_src)
+
+
+def test_enums_and_literal_sets(snapshot: SnapshotTest):
+    out_src = Compiler().parse("tests.fixtures.enums").to_zod()
+    snapshot.assert_match(out_src)
+
+
+def test_lazy_schemas(snapshot: SnapshotTest):
+    out_src = Compiler().parse("tests.fixtures.external").to_zod(lazy=True)
+    snapshot.assert_match(out_src)
+
+
+def test_explicit_interfaces(snapshot: SnapshotTest):
+    out_src = Compiler().parse("tests.fixtures.interfaces").to_zod(interfaces=True)
+    snapshot.assert_match(out_src)
+
+
+def test_explicit_interfaces_with_lazy_schemas(snapshot: SnapshotTest):
+    out_src = (
+        Compiler().parse("tests.fixtures.interfaces").to_zod(lazy=True, interfaces=True)
+    )
+    snapshot.assert_match(out_src)
+
+
+def test_interfaces_omit_overridden_fields():
+    out_src = (
+        Compiler().parse("tests.fixtures.overridden_fields").to_zod(interfaces=True)
+    )
+
+    assert 'export interface DogType extends Omit<AnimalType, "age"> {' in out_src
+    # Inherited from the base of the base.
+    assert 'export interface PuppyType extends Omit<DogType, "name"> {' in out_src
+    assert "export interface CatType extends AnimalType {" in out_src
+
+
+_NODE_MODULES = Path(__file__).parent.parent / "node_modules"
+
+
+@pytest.mark.skipif(
+    not (_NODE_MODULES / ".bin" / "tsc").exists(),
+    reason="Needs typescript and zod, run `npm ci`",
+)
+def test_interfaces_match_inferred_types(tmp_path: Path):
+    for name, module in [
+        ("interfaces", "tests.fixtures.interfaces"),
+        ("overrides", "tests.fixtures.overridden_fields"),
+    ]:
+        compiler = Compiler().parse(module)
+        (tmp_path / f"declared_{name}.ts").write_text(compiler.to_zod(interfaces=True))
+        (tmp_path / f"inferred_{name}.ts").write_text(compiler.to_zod())
+    shutil.copy(Path(__file__).parent / "fixtures" / "interfaces_check.ts", tmp_path)
+    tsconfig = {
+        "compilerOptions": {
+            "strict": True,
+            "noEmit": True,
+            "target": "es2020",
+            "module": "commonjs",
+            "skipLibCheck": True,
+            "baseUrl": ".",
+            "paths": {"zod": [str(_NODE_MODULES / "zod")]},
+        },
+        "files": ["interfaces_check.ts"],
+    }
+    (tmp_path / "tsconfig.json").write_text(json.dumps(tsconfig))
+
+    tsc = subprocess.run(
+        [_NODE_MODULES / ".bin" / "tsc", "-p", tmp_path],
+        capture_output=True,
+        text=True,
+    )
+
+    assert tsc.returncode == 0, tsc.stdout
+
+
+class TestEmitters:
+    def test_generates_all_outputs_from_one_parse(self):
+        compiler = Compiler().parse("tests.fixtures.interfaces")
+        zod_src, _, _ = compiler.emit(
+            [compiler.zod_emitter(), TsTypesEmitter(), JsonSchemaEmitter()]
+        )
+
+        assert zod_src == Compiler().parse("tests.fixtures.interfaces").to_zod()
+
+    def test_plain_typescript_types(self, snapshot: SnapshotTest):
+        out_src = Compiler().parse("tests.fixtures.interfaces").emit([TsTypesEmitter()])
+        snapshot.assert_match(out_src[0])
+
+    def test_json_schema(self):
+        [out] = (
+            Compiler().parse("tests.fixtures.interfaces").emit([JsonSchemaEmitter()])
+        )
+        defs = json.loads(out)["$defs"]
+
+        assert defs["Currency"] == {
+            "enum": ["EUR", "USD", "GBP"],
+            "description": "ISO 4217 currency code.",
+        }
+        assert defs["Priority"] == {"enum": [1, 2]}
+        assert defs["Tag"] == {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "weight": {"type": "number", "default": 0.0},
+            },
+            "required": ["name"],
+            "additionalProperties": False,
+        }
+        entry = defs["Entry"]
+        assert entry["required"] == [
+            "id",
+            "created_at",
+            "title",
+            "count",
+            "extra",
+            "items",
+            "kind",
+            "single",
+            "parent",
+            "span",
+            "currency",
+            "priority",
+            "enabled",
+        ]
+        assert entry["properties"]["id"] == {"type": "string", "format": "uuid"}
+        assert entry["properties"]["title"] == {
+            "type": "string",
+            "description": "Shown in the UI.",
+        }
+        assert entry["properties"]["tags"] == {
+            "type": "array",
+            "items": {"$ref": "#/$defs/Tag"},
+            "default": [],
+        }
+        assert entry["properties"]["labels"]["additionalProperties"] == {
+            "type": "integer"
+        }
+        assert entry["properties"]["kind"] == {"enum": ["a", "b"]}
+        assert entry["properties"]["single"] == {"const": "x"}
+        assert entry["properties"]["parent"] == {
+            "anyOf": [{"$ref": "#/$defs/Tag"}, {"type": "null"}]
+        }
+        assert entry["properties"]["span"] == {
+            "type": "array",
+            "prefixItems": [{"type": "integer"}, {"type": "string"}],
+            "minItems": 2,
+            "maxItems": 2,
+        }
+
+    def test_json_schema_of_boolean_values(self):
+        [out] = Compiler().parse_classes([Toggle]).emit([JsonSchemaEmitter()])
+        defs = json.loads(out)["$defs"]
+
+        assert defs["Switch"] == {"enum": [True, False]}
+        assert defs["Toggle"]["properties"]["enabled"] == {
+            "type": "boolean",
+            "default": True,
+        }
+
+
+class Switch(Enum):
+    YES = True
+    NO = False
+
+
+class Toggle(pydantic.BaseModel):
+    flag: Switch
+    enabled: bool = True
+
+
+class TestParallelCodegen:
+    @pytest.mark.parametrize(
+        "lazy,interfaces", [(False, False), (True, False), (True, True)]
+    )
+    def test_generates_the_same_code_as_serial(
+        self, lazy: bool, interfaces: bool, monkeypatch: pytest.MonkeyPatch
+    ):
+        # A batch per model.
+        monkeypatch.setattr(_codegen, "_MIN_BATCH_SIZE", 1)
+        compiler = Compiler().parse("tests.fixtures.interfaces")
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            out_src = compiler.to_zod(lazy, interfaces, executor)
+
+        assert out_src == (
+            Compiler().parse("tests.fixtures.interfaces").to_zod(lazy, interfaces)
+        )
+
+
+class _RenamingCompiler(Compiler):
+    MODEL_RENAME_RULES = {
+        "tests.fixtures.all_in_one.Class": "BaseClass",
+        "tests.fixtures.*.*": "Fixture$2",
+    }
+
+    def _modify_models(self, pydantic_models: list[ClassDecl]) -> list[ClassDecl]:
+        return [
+            replace(
+                model,
+                comment=None,
+                fields=[f for f in model.fields if f.name != "title"],
+            )
+            for model in pydantic_models
+        ]
+
+
+class TestConcurrency:
+    _MODULES = [
+        "tests.fixtures.unique_names",
+        "tests.fixtures.interfaces",
+        "tests.fixtures.external",
+        "tests.fixtures.generic_models",
+        "tests.fixtures.known_types",
+    ]
+
+    def test_codegen_doesnt_modify_parsed_models(self):
+        compiler = _RenamingCompiler().parse("tests.fixtures.interfaces")
+        parsed_models = deepcopy(compiler.models())
+
+        out_src = compiler.to_zod()
+
+        assert compiler.models() == parsed_models
+        assert compiler.to_zod() == out_src
+        assert "FixtureTag" in out_src
+
+    def test_class_attributes_are_captured_per_instance(self):
+        class MyCompiler(Compiler):
+            MODEL_RENAME_RULES = {"tests.fixtures.all_in_one.Class": "BaseClass"}
+
+        compiler = MyCompiler()
+        MyCompiler.MODEL_RENAME_RULES["tests.fixtures.all_in_one.Class"] = "Renamed"
+
+        assert "BaseClass" in compiler.parse("tests.fixtures.unique_names").to_zod()
+
+    def test_compiles_the_same_in_threads(self):
+        expected = {m: _RenamingCompiler().parse(m).to_zod() for m in self._MODULES}
+        shared_cache = ModuleCache(max_entries=3)
+        shared_compiler = _RenamingCompiler().parse("tests.fixtures.interfaces")
+
+        def compile_(i: int) -> tuple[str, str]:
+            module = self._MODULES[i % len(self._MODULES)]
+            if i % 3 == 0:
+                return "tests.fixtures.interfaces", shared_compiler.to_zod()
+            compiler = _RenamingCompiler(module_cache=shared_cache)
+            return module, compiler.parse(module).to_zod()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(compile_, range(200)))
+
+        assert all(out_src == expected[module] for module, out_src in results)
+
+
+class _KeepModels:
+    def __init__(self) -> None:
+        self.models: list[ClassDecl] = []
+
+    def emit(self, models: list[ClassDecl]) -> str:
+        self.models = models
+        return ""
+
+
+class TestImmutableIr:
+    def test_models_cant_be_modified_in_place(self):
+        [model, *_] = Compiler().parse("tests.fixtures.interfaces").models()
+
+        with pytest.raises(FrozenInstanceError):
+            model.name = "Renamed"  # pyright: ignore[reportAttributeAccessIssue]
+        assert isinstance(model.fields, tuple)
+
+    def test_variants_share_unchanged_models(self):
+        class MyCompiler(Compiler):
+            MODEL_RENAME_RULES = {"tests.fixtures.interfaces.Entry": "Item"}
+
+        compiler = Compiler().parse("tests.fixtures.interfaces")
+        parsed = compiler.models()
+        public, internal = _KeepModels(), _KeepModels()
+        MyCompiler().load_models(parsed, compiler.source_files()).emit([public])
+        compiler.emit([internal])
+
+        assert internal.models == parsed
+        assert all(a is b for a, b in zip(internal.models, parsed))
+        renamed = [a.name for a, b in zip(public.models, parsed) if a is not b]
+        assert renamed == ["Item"]
+
+
+class TestAsyncApi:
+    def test_compiles_the_same_as_sync_api(self):
+        async def compile_() -> str:
+            return await (await Compiler().aparse("tests.fixtures.external")).ato_zod()
+
+        assert asyncio.run(compile_()) == (
+            Compiler().parse("tests.fixtures.external").to_zod()
+        )
+
+    def test_parses_in_process_pool(self):
+        async def compile_() -> str:
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                compiler = await Compiler().aparse(
+                    "tests.fixtures.external", executor=executor
+                )
+            return compiler.to_zod()
+
+        assert asyncio.run(compile_()) == (
+            Compiler().parse("tests.fixtures.external").to_zod()
+        )
+
+    def test_times_out(self):
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(Compiler().aparse("tests.fixtures.external", timeout=0))
+
+
+class TestIr:
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "tests.fixtures.interfaces",
+            "tests.fixtures.enums",
+            "tests.fixtures.default_values_list",
+            "tests.fixtures.default_values_dict",
+            "tests.fixtures.generic_models",
+            "tests.fixtures.known_types",
+            pytest.param(
+                "tests.fixtures.annotated_fields",
+                marks=pytest.mark.skipif(
+                    not pydantic.VERSION.startswith("2"),
+                    reason="Only works with pydantic v2",
+                ),
+            ),
+        ],
+    )
+    def test_generates_the_same_code_from_loaded_ir(self, module: str, tmp_path: Path):
+        ir_path = tmp_path / "models.json"
+        Compiler().parse(module).dump_ir(ir_path)
+
+        assert Compiler().load_ir(ir_path).to_zod() == (
+            Compiler().parse(module).to_zod()
+        )
+
+    def test_rejects_incompatible_versions(self, tmp_path: Path):
+        ir_path = tmp_path / "models.json"
+        Compiler().parse("tests.fixtures.enums").dump_ir(ir_path)
+        ir = json.loads(ir_path.read_text())
+        ir_path.write_text(json.dumps(ir | {"version": 0}))
+
+        with pytest.raises(ValueError, match="Unsupported IR version"):
+            Compiler().load_ir(ir_path)
@@ -0,0 +1,143 @@
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from pydantic2zod.__main__ import app
+from pydantic2zod._compiler import Compiler
+from pydantic2zod._daemon import Daemon, request_compile, request_shutdown
+
+
+def _compile_request(module: str) -> str:
+    return json.dumps(
+        {"jsonrpc": "2.0", "id": 1, "method": "compile", "params": {"module": module}}
+    )
+
+
+def test_compiles_modules():
+    response = json.loads(Daemon().handle(_compile_request("tests.fixtures.external")))
+
+    compiler = Compiler().parse("tests.fixtures.external")
+    assert response == {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {"code": compiler.to_zod(), "sources": compiler.source_files()},
+    }
+
+
+def test_reports_unknown_methods():
+    response = json.loads(Daemon().handle('{"id": 3, "method": "build"}'))
+
+    assert response["id"] == 3
+    assert response["error"]["code"] == -32601
+
+
+@pytest.mark.parametrize("request_line", ["[1]", '"x"', "null"])
+def test_reports_invalid_requests(request_line: str):
+    response = json.loads(Daemon().handle(request_line))
+
+    assert response["error"]["code"] == -32600
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        [1],
+        {"module": "tests.fixtures.external", "compiler_cls": "x"},
+        {"module": "tests.fixtures.external", "lazy": "yes"},
+    ],
+)
+def test_reports_invalid_params(params: object):
+    request = {"jsonrpc": "2.0", "id": 2, "method": "compile", "params": params}
+    response = json.loads(Daemon().handle(json.dumps(request)))
+
+    assert response["id"] == 2
+    assert response["error"]["code"] == -32602
+
+
+def test_reports_compile_errors():
+    response = json.loads(Daemon().handle(_compile_request("tests.no_such_module")))
+
+    assert response["error"]["code"] == -32000
+
+
+def test_parses_only_modified_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    models = tmp_path / "daemon_models.py"
+    models.write_text(
+        "from pydantic import BaseModel\n\nclass A(BaseModel):\n    x: int\n"
+    )
+    daemon = Daemon()
+    daemon.handle(_compile_request("daemon_models"))
+
+    caplog.set_level(logging.DEBUG)
+    # Touched, but not modified.
+    os.utime(models, ns=(time.time_ns(), time.time_ns() + 10**9))
+    daemon.handle(_compile_request("daemon_models"))
+    assert "is up to date" in caplog.text
+
+    caplog.clear()
+    models.write_text(models.read_text().replace("x: int", "x: str"))
+    response = json.loads(daemon.handle(_compile_request("daemon_models")))
+    assert "is up to date" not in caplog.text
+    assert "x: z.string()" in response["result"]["code"]
+
+
+def test_emits_edited_enum_values(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    models = tmp_path / "daemon_enums.py"
+    models.write_text(
+        "from enum import Enum\nfrom pydantic import BaseModel\n\n"
+        'class Color(str, Enum):\n    RED = "red"\n\n'
+        "class Paint(BaseModel):\n    color: Color\n"
+    )
+    daemon = Daemon()
+    daemon.handle(_compile_request("daemon_enums"))
+
+    # The imported module keeps the old values.
+    models.write_text(models.read_text().replace('"red"', '"crimson"'))
+    response = json.loads(daemon.handle(_compile_request("daemon_enums")))
+    assert '"crimson"' in response["result"]["code"]
+
+
+def test_serves_unix_socket(tmp_path: Path):
+    socket_path = str(tmp_path / "daemon.sock")
+    daemon = Daemon()
+    server = threading.Thread(target=daemon.serve_unix_socket, args=(socket_path,))
+    server.start()
+    while not os.path.exists(socket_path):
+        time.sleep(0.01)
+
+    try:
+        zod_src, _ = request_compile(socket_path, "tests.fixtures.builtin_types")
+    finally:
+        request_shutdown(socket_path)
+        server.join()
+
+    assert zod_src == Compiler().parse("tests.fixtures.builtin_types").to_zod()
+    assert not os.path.exists(socket_path)
+
+
+def test_client_fails_when_no_daemon_listens(tmp_path: Path):
+    with pytest.raises(OSError):
+        request_compile(str(tmp_path / "daemon.sock"), "tests.fixtures.builtin_types")
+
+
+def test_cli_serves_or_compiles_by_default(tmp_path: Path):
+    runner = CliRunner()
+
+    help_text = runner.invoke(app, ["--help"]).output
+    assert "serve" in help_text
+    assert "compile" in help_text
+
+    out_to = tmp_path / "models.ts"
+    result = runner.invoke(app, ["tests.fixtures.external", str(out_to), "-s"])
+    assert result.exit_code == 0
+    assert out_to.read_text() == Compiler().parse("tests.fixtures.external").to_zod()
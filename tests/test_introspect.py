@@ -0,0 +1,167 @@
+# pyright: reportPrivateUsage=false
+
+import enum
+from importlib import import_module
+
+import pydantic
+import pytest
+from pydantic import BaseModel, Field, create_model
+
+from pydantic2zod import Compiler
+from pydantic2zod.model import (
+    AnyType,
+    ClassDecl,
+    ClassField,
+    GenericType,
+    PrimitiveType,
+    PyBool,
+    PyInteger,
+    PyNone,
+    UnionType,
+    UserDefinedType,
+)
+
+pytestmark = pytest.mark.skipif(
+    not pydantic.VERSION.startswith("2"), reason="Only works with pydantic v2"
+)
+
+
+def _module_classes(module_name: str) -> list[type]:
+    module = import_module(module_name)
+    return [
+        cls
+        for cls in vars(module).values()
+        if isinstance(cls, type)
+        and cls.__module__ == module_name
+        and issubclass(cls, (BaseModel, enum.Enum))
+    ]
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "tests.fixtures.builtin_types",
+        "tests.fixtures.external",
+        "tests.fixtures.type_alias",
+        "tests.fixtures.default_values_list",
+        "tests.fixtures.default_values_dict",
+        "tests.fixtures.class_vars",
+        "tests.fixtures.with_model_config",
+        "tests.fixtures.known_types",
+        "tests.fixtures.generic_models",
+        "tests.fixtures.enums",
+        "tests.fixtures.unique_names",
+        "tests.fixtures.user_defined_types",
+    ],
+)
+def test_generates_the_same_code_as_from_sources(module: str):
+    assert Compiler().parse_classes(_module_classes(module)).to_zod() == (
+        Compiler().parse(module).to_zod()
+    )
+
+
+def test_includes_dependencies_and_source_files():
+    from tests.fixtures.external import Module
+
+    compiler = Compiler().parse_classes([Module])
+
+    assert sorted(compiler.source_files()) == sorted(
+        Compiler().parse("tests.fixtures.external").source_files()
+    )
+
+
+class _Timestamps:
+    created_at: int = 0
+
+
+class _Parent(BaseModel):
+    name: str
+
+
+class _Child(_Timestamps, _Parent):
+    """Inherits fields from a mixin."""
+
+    enabled: bool = True
+    parent: _Parent | None = Field(None, description="Who owns it.")
+
+
+def test_models_the_parser_cannot_see():
+    dynamic = create_model("Dynamic", children=(list[_Child], ...), size=(int, 1))
+
+    models = Compiler().parse_classes([dynamic])._pydantic_models
+
+    parent, child, dynamic_cls = models
+    assert parent.name == "_Parent"
+    assert child == ClassDecl(
+        name="_Child",
+        full_path=f"{__name__}._Child",
+        base_classes=["_Parent"],
+        comment="Inherits fields from a mixin.",
+        fields=[
+            ClassField(
+                name="created_at",
+                type=PrimitiveType(name="int"),
+                default_value=PyInteger(value="0"),
+            ),
+            ClassField(
+                name="enabled",
+                type=PrimitiveType(name="bool"),
+                default_value=PyBool(value=True),
+            ),
+            ClassField(
+                name="parent",
+                type=UnionType(
+                    types=[
+                        UserDefinedType(name=f"{__name__}._Parent"),
+                        PrimitiveType(name="None"),
+                    ]
+                ),
+                default_value=PyNone(),
+                comment="Who owns it.",
+            ),
+        ],
+    )
+    assert list(dynamic_cls.fields) == [
+        ClassField(
+            name="children",
+            type=GenericType(
+                generic="list", type_vars=[UserDefinedType(name=f"{__name__}._Child")]
+            ),
+        ),
+        ClassField(
+            name="size",
+            type=PrimitiveType(name="int"),
+            default_value=PyInteger(value="1"),
+        ),
+    ]
+
+
+def test_ignored_types():
+    class MyCompiler(Compiler):
+        IGNORE_TYPES = {f"{__name__}.*"}
+
+    from tests.fixtures.external import Module
+
+    class Owner(BaseModel):
+        module: Module
+        child: _Child
+
+    models = MyCompiler().parse_classes([Owner])._pydantic_models
+
+    assert [m.name for m in models] == [
+        "Class",
+        "DataClass",
+        "Module",
+        "Owner",
+    ]
+    assert models[-1].fields[1].type == AnyType()
+
+
+def test_long_chains_of_models():
+    models: list[type[BaseModel]] = [create_model("M0", x=(int, ...))]
+    for i in range(1, 2000):
+        models.append(create_model(f"M{i}", prev=(models[-1], ...)))
+
+    compiled = Compiler().parse_classes([models[-1]])._pydantic_models
+
+    assert [m.name for m in compiled] == [m.__name__ for m in models]
@@ -0,0 +1,92 @@
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from pydantic2zod import Compiler
+from pydantic2zod._json_schema_input import read_json_schemas
+from pydantic2zod._known_types import KNOWN_TYPES
+from pydantic2zod.model import (
+    AnyType,
+    EnumDecl,
+    EnumMember,
+    GenericType,
+    PyList,
+    PyString,
+    UserDefinedType,
+)
+
+_SCHEMAS = Path(__file__).parent / "fixtures" / "schemas"
+
+
+def test_builds_models_from_pydantic_json_schema():
+    models = read_json_schemas([_SCHEMAS / "entry.schema.json"], KNOWN_TYPES)
+
+    assert [m.name for m in models] == ["Currency", "Priority", "Tag", "Entry"]
+    currency = models[0]
+    assert isinstance(currency, EnumDecl)
+    assert list(currency.members) == [
+        EnumMember(name="EUR", value=PyString(value="EUR")),
+        EnumMember(name="USD", value=PyString(value="USD")),
+        EnumMember(name="GBP", value=PyString(value="GBP")),
+    ]
+
+    entry = models[-1]
+    fields = {f.name: f for f in entry.fields}
+    assert fields["id"].type is KNOWN_TYPES["uuid.UUID"]
+    assert fields["tags"].type == GenericType(
+        generic="list", type_vars=[UserDefinedType(name="Tag")]
+    )
+    # `Field(default_factory=list)` is not in the schema.
+    assert fields["tags"].default_value == PyList()
+    assert fields["title"].default_value is None
+
+
+def test_compiles_json_schema():
+    zod = Compiler().parse_json_schema(_SCHEMAS / "entry.schema.json").to_zod()
+
+    assert "id: z.string().uuid()," in zod
+    assert "created_at: z.string().datetime()," in zod
+    assert "tags: z.array(Tag).default([])," in zod
+    assert "currency: Currency," in zod
+    assert zod.index("export const Tag") < zod.index("export const Entry")
+
+
+def test_refs_across_json_lines_documents():
+    models = read_json_schemas([_SCHEMAS / "models.jsonl"], KNOWN_TYPES)
+
+    assert [m.name for m in models] == ["Invoice", "Tag", "Order"]
+    order = models[-1]
+    assert order.fields[0].type == UserDefinedType(name="Invoice")
+
+
+def test_first_declaration_wins(tmp_path: Path):
+    tag = {"title": "Tag", "type": "object", "properties": {"name": {"type": "string"}}}
+    other_tag = tag | {"properties": {"weight": {"type": "number"}}}
+    fname = tmp_path / "tags.jsonl"
+    fname.write_text(f"{json.dumps(tag)}\n\n{json.dumps(other_tag)}\n")
+
+    [model] = read_json_schemas([fname], KNOWN_TYPES)
+
+    assert [f.name for f in model.fields] == ["name"]
+
+
+def test_unresolved_refs_become_any(tmp_path: Path, caplog: pytest.LogCaptureFixture):
+    fname = tmp_path / "order.json"
+    fname.write_text(
+        json.dumps(
+            {
+                "title": "Order",
+                "type": "object",
+                "properties": {"customer": {"$ref": "customer.json#/$defs/Customer"}},
+                "required": ["customer"],
+            }
+        )
+    )
+
+    with caplog.at_level(logging.WARNING):
+        [model] = read_json_schemas([fname], KNOWN_TYPES)
+
+    assert model.fields[0].type == AnyType()
+    assert "Customer" in caplog.text
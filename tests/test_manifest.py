@@ -0,0 +1,102 @@
+import sys
+from importlib.metadata import PackageNotFoundError
+from pathlib import Path
+
+import pytest
+
+from pydantic2zod import _manifest
+from pydantic2zod._compiler import Compiler
+from pydantic2zod._manifest import compiler_settings, is_up_to_date, write_manifest
+
+
+@pytest.fixture
+def compiled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, Path]:
+    """Returns the model source and the generated code files."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "manifest_models", raising=False)
+    models = tmp_path / "manifest_models.py"
+    models.write_text(
+        "from pydantic import BaseModel\n\nclass A(BaseModel):\n    x: int\n"
+    )
+
+    compiler = Compiler().parse("manifest_models")
+    out_to = tmp_path / "out" / "models.ts"
+    out_to.parent.mkdir()
+    out_to.write_text(compiler.to_zod())
+    write_manifest(
+        str(out_to),
+        "manifest_models",
+        compiler_settings(compiler),
+        compiler.source_files(),
+    )
+    return models, out_to
+
+
+def test_is_up_to_date_when_nothing_changed(compiled: tuple[Path, Path]):
+    _, out_to = compiled
+
+    assert is_up_to_date(str(out_to), "manifest_models", compiler_settings(Compiler()))
+
+
+def test_is_stale_when_source_changes(compiled: tuple[Path, Path]):
+    models, out_to = compiled
+    models.write_text(models.read_text().replace("x: int", "x: str"))
+
+    assert not is_up_to_date(
+        str(out_to), "manifest_models", compiler_settings(Compiler())
+    )
+
+
+def test_is_stale_when_settings_change(compiled: tuple[Path, Path]):
+    class MyCompiler(Compiler):
+        MODEL_RENAME_RULES = {"manifest_models.A": "B"}
+
+    _, out_to = compiled
+
+    assert not is_up_to_date(
+        str(out_to), "manifest_models", compiler_settings(MyCompiler())
+    )
+    assert not is_up_to_date(
+        str(out_to), "manifest_models", compiler_settings(Compiler(), lazy=True)
+    )
+
+
+def test_is_stale_when_output_is_modified(compiled: tuple[Path, Path]):
+    _, out_to = compiled
+    out_to.write_text(out_to.read_text() + "// edited\n")
+
+    assert not is_up_to_date(
+        str(out_to), "manifest_models", compiler_settings(Compiler())
+    )
+
+
+def test_is_stale_when_extra_output_is_modified(compiled: tuple[Path, Path]):
+    models, out_to = compiled
+    schema = out_to.parent / "models.schema.json"
+    schema.write_text("{}")
+    settings = compiler_settings(Compiler())
+    write_manifest(
+        str(out_to), "manifest_models", settings, [str(models)], [str(schema)]
+    )
+    assert is_up_to_date(str(out_to), "manifest_models", settings)
+
+    schema.unlink()
+
+    assert not is_up_to_date(str(out_to), "manifest_models", settings)
+
+
+def test_is_stale_when_compiler_changes_in_checkout(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    def not_installed(name: str):
+        raise PackageNotFoundError(name)
+
+    monkeypatch.setattr(_manifest, "distribution", not_installed)
+    monkeypatch.setattr(_manifest, "_PACKAGE_DIR", tmp_path)
+    codegen = tmp_path / "_codegen.py"
+    codegen.write_text("INDENT = 2\n")
+    settings = compiler_settings(Compiler())
+
+    codegen.write_text("INDENT = 4\n")
+
+    assert compiler_settings(Compiler()) != settings
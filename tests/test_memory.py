@@ -0,0 +1,28 @@
+from pydantic2zod._compiler import Compiler
+from pydantic2zod._memory import MemoryReport, memory_phase
+
+
+def test_reports_memory_per_phase_and_module():
+    with MemoryReport() as report:
+        Compiler().parse("tests.fixtures.interfaces").to_zod()
+
+    assert [(p.name, p.depth) for p in report.phases] == [
+        ("parse", 0),
+        ("tests.fixtures.interfaces", 1),
+        ("tests.fixtures.enums", 1),
+        ("tests.fixtures.enums", 1),
+        ("codegen", 0),
+    ]
+    parse, module = report.phases[:2]
+    assert parse.peak >= module.peak > 0
+    assert module.peak >= module.retained
+
+
+def test_phases_are_not_measured_without_report():
+    with memory_phase("parse"):
+        pass
+
+    with MemoryReport() as report:
+        pass
+
+    assert report.phases == []
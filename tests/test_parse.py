@@ -1,16 +1,30 @@
 # pyright: reportPrivateUsage=false
 
+import asyncio
+import logging
+import subprocess
+import sys
 from importlib import import_module
+from pathlib import Path
 
+import pytest
 from networkx import DiGraph
 
-from pydantic2zod._parser import _ParseModule, parse
+from pydantic2zod import _boundaries
+from pydantic2zod._boundaries import CrawlBoundaries
+from pydantic2zod._ignore import IgnoredTypes
+from pydantic2zod._known_types import KNOWN_TYPES
+from pydantic2zod._parser import _ParseModule, acrawl, crawl, parse
 from pydantic2zod.model import (
     AnyType,
     ClassDecl,
     ClassField,
+    EnumDecl,
+    EnumMember,
     GenericType,
     PrimitiveType,
+    PyInteger,
+    PyString,
     UnionType,
     UserDefinedType,
 )
@@ -62,6 +76,123 @@ def test_recurses_into_imported_modules():
     ]
 
 
+def test_parser_does_not_need_pydantic():
+    imports = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, pydantic2zod._parser; print('pydantic' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert imports.stdout.strip() == "False"
+
+
+class TestCrawlBoundaries:
+    def test_max_depth(self, caplog: pytest.LogCaptureFixture):
+        parsed = crawl(
+            "tests.fixtures.external", set(), boundaries=CrawlBoundaries(max_depth=0)
+        )
+
+        assert parsed.models == [
+            ClassDecl(
+                name="Module",
+                full_path="tests.fixtures.external.Module",
+                fields=[
+                    ClassField(name="name", type=PrimitiveType(name="str")),
+                    ClassField(
+                        name="classes",
+                        type=GenericType(generic="list", type_vars=[AnyType()]),
+                    ),
+                ],
+                base_classes=["BaseModel"],
+            ),
+        ]
+        assert parsed.source_files == [
+            str(Path("tests/fixtures/external.py").absolute())
+        ]
+        [warning] = [r for r in caplog.records if r.levelno == logging.WARNING]
+        assert "tests.fixtures.all_in_one.DataClass" in warning.getMessage()
+
+    def test_roots(self):
+        parsed = crawl(
+            "tests.fixtures.uses_vendor",
+            set(),
+            boundaries=CrawlBoundaries(roots=frozenset({"tests.fixtures.vendor"})),
+        )
+
+        # The parsed module itself is always within the boundaries.
+        assert [c.name for c in parsed.models] == ["Token", "Client", "Account"]
+
+        parsed = crawl(
+            "tests.fixtures.uses_vendor",
+            set(),
+            boundaries=CrawlBoundaries(roots=frozenset({"tests.fixtures.other"})),
+        )
+
+        assert [c.name for c in parsed.models] == ["Account"]
+
+    def test_installed_packages(self):
+        boundaries = CrawlBoundaries(installed_packages=False)
+
+        assert not boundaries.allow("json.decoder", 1)
+        assert not boundaries.allow("pydantic.main", 1)
+        assert boundaries.allow("tests.fixtures.vendor.sdk", 1)
+        assert CrawlBoundaries().allow("pydantic.main", 1)
+
+    def test_parses_own_package_when_installed(self, monkeypatch: pytest.MonkeyPatch):
+        # e.g. installed from a wheel in a Docker image.
+        monkeypatch.setattr(_boundaries, "is_installed", lambda _: True)
+
+        boundaries = CrawlBoundaries(installed_packages=False)
+        parsed = crawl("tests.fixtures.external", set(), boundaries=boundaries)
+
+        assert [c.name for c in parsed.models] == ["Class", "DataClass", "Module"]
+        assert not boundaries.around("tests.fixtures").allow("pydantic", 1)
+
+
+def test_maps_well_known_types_without_parsing_them():
+    parsed = crawl("tests.fixtures.known_types", set())
+
+    [invoice] = parsed.models
+    assert [f.type for f in invoice.fields] == [
+        KNOWN_TYPES["datetime.date"],
+        KNOWN_TYPES["decimal.Decimal"],
+        KNOWN_TYPES["pydantic.HttpUrl"],
+        UnionType(
+            types=[KNOWN_TYPES["ipaddress.IPv4Address"], PrimitiveType(name="None")]
+        ),
+        GenericType(generic="list", type_vars=[KNOWN_TYPES["datetime.date"]]),
+    ]
+    assert parsed.source_files == [
+        str(Path("tests/fixtures/known_types.py").absolute())
+    ]
+
+
+class TestReexports:
+    def test_parses_models_where_they_are_declared(self):
+        parsed = crawl("tests.fixtures.uses_reexports", set())
+
+        address_path = "tests.fixtures.reexports.geo.models.Address"
+        assert [c.full_path for c in parsed.models] == [
+            address_path,
+            "tests.fixtures.uses_reexports.User",
+        ]
+        assert parsed.models[1].fields[0].type == UserDefinedType(name=address_path)
+        assert parsed.source_files == [
+            str(Path("tests/fixtures/uses_reexports.py").absolute()),
+            str(Path("tests/fixtures/reexports/geo/models.py").absolute()),
+        ]
+
+    def test_async_crawler_too(self):
+        parsed = asyncio.run(acrawl("tests.fixtures.uses_reexports", set()))
+
+        assert parsed == crawl("tests.fixtures.uses_reexports", set())
+
+
 class TestParseModule:
     def test_parses_all_pydantic_models_within_same_module(self):
         """
@@ -172,6 +303,64 @@ class TestParseModule:
             ),
         ]
 
+    def test_parses_one_line_class_bodies(self):
+        parse = _ParseModule(
+            import_module("tests.fixtures.one_line_bodies"), DiGraph(), set()
+        ).exec()
+
+        point, color = parse.classes()
+        assert list(point.fields) == [
+            ClassField(name="x", type=PrimitiveType(name="int")),
+            ClassField(name="y", type=PrimitiveType(name="str")),
+        ]
+        assert isinstance(color, EnumDecl)
+        assert list(color.members) == [
+            EnumMember(name="RED", value=PyInteger(value="1")),
+            EnumMember(name="GREEN", value=PyInteger(value="2")),
+        ]
+
+    def test_reads_enum_values_evaluated_at_import(self):
+        parse = _ParseModule(
+            import_module("tests.fixtures.auto_enums"), DiGraph(), set()
+        ).exec()
+
+        color, shade, level, _ = parse.classes()
+        assert isinstance(color, EnumDecl)
+        assert list(color.members) == [
+            EnumMember(name="RED", value=PyInteger(value="1")),
+            EnumMember(name="GREEN", value=PyInteger(value="2")),
+        ]
+        assert isinstance(shade, EnumDecl)
+        assert [m.name for m in shade.members] == ["LIGHT", "DARK"]
+        # Falsy, yet the alias is skipped.
+        assert isinstance(level, EnumDecl)
+        assert list(level.members) == [
+            EnumMember(name="ZERO", value=PyInteger(value="0")),
+            EnumMember(name="ONE", value=PyInteger(value="1")),
+        ]
+
+    def test_skips_nested_classes_and_methods(self):
+        parse = _ParseModule(
+            import_module("tests.fixtures.class_bodies"), DiGraph(), set()
+        ).exec()
+
+        assert parse.classes() == [
+            ClassDecl(
+                name="Order",
+                full_path="tests.fixtures.class_bodies.Order",
+                fields=[
+                    ClassField(name="id", type=PrimitiveType(name="int")),
+                    ClassField(
+                        name="total",
+                        type=PrimitiveType(name="float"),
+                        comment="In euros.",
+                    ),
+                ],
+                base_classes=["BaseModel"],
+                comment="An order.",
+            ),
+        ]
+
     def test_supports_explicit_type_alias(self):
         parse = _ParseModule(
             import_module("tests.fixtures.type_alias"), DiGraph(), set()
@@ -266,8 +455,8 @@ class TestParseModule:
                 base_classes=["BaseModel"],
             )
         ]
-        # built-in types are not considered external models
-        assert parse.external_models() == set()
+        # well-known types are not parsed by crawl() though
+        assert parse.external_models() == {"uuid.UUID", "datetime.datetime"}
 
     def test_resolves_import_aliases(self):
         parse = _ParseModule(
@@ -296,6 +485,35 @@ class TestParseModule:
         # built-in types are not considered external models
         assert parse.external_models() == set(["tests.fixtures.all_in_one.Class"])
 
+    def test_parses_enums_as_value_sets(self):
+        parse = _ParseModule(
+            import_module("tests.fixtures.enums"), DiGraph(), set()
+        ).exec()
+
+        currency, priority = parse.classes()[:2]
+        assert currency == EnumDecl(
+            name="Currency",
+            full_path="tests.fixtures.enums.Currency",
+            base_classes=["str", "Enum"],
+            comment="ISO 4217 currency code.",
+            members=[
+                EnumMember(name="EUR", value=PyString(value="EUR")),
+                EnumMember(name="USD", value=PyString(value="USD")),
+                EnumMember(name="GBP", value=PyString(value="GBP")),
+            ],
+        )
+        assert priority == EnumDecl(
+            name="Priority",
+            full_path="tests.fixtures.enums.Priority",
+            base_classes=["IntEnum"],
+            members=[
+                EnumMember(name="LOW", value=PyInteger(value="1")),
+                EnumMember(name="HIGH", value=PyInteger(value="2")),
+            ],
+        )
+        # enum base classes are not crawled
+        assert parse.external_models() == set()
+
     class TestIgnoreModels:
         def test_basic(self):
             """Class fields with ignored types become `AnyType`"""
@@ -338,16 +556,79 @@ class TestParseModule:
                         ClassField(name="name", type=PrimitiveType(name="str")),
                         ClassField(
                             name="classes",
-                            type=GenericType(
-                                generic="list",
-                                type_vars=[
-                                    UserDefinedType(
-                                        name="tests.fixtures.all_in_one.Class"
-                                    )
-                                ],
-                            ),
+                            type=GenericType(generic="list", type_vars=[AnyType()]),
                         ),
                     ],
                     base_classes=["BaseModel"],
                 ),
             ]
+
+        def test_whole_packages(self):
+            """Modules of the ignored packages are not even parsed."""
+            parsed = crawl("tests.fixtures.uses_vendor", {"tests.fixtures.vendor.*"})
+
+            assert parsed.models == [
+                ClassDecl(
+                    name="Account",
+                    full_path="tests.fixtures.uses_vendor.Account",
+                    fields=[
+                        ClassField(name="name", type=PrimitiveType(name="str")),
+                        ClassField(name="client", type=AnyType()),
+                        ClassField(
+                            name="tokens",
+                            type=GenericType(generic="list", type_vars=[AnyType()]),
+                        ),
+                    ],
+                    base_classes=["BaseModel"],
+                ),
+            ]
+            assert not [f for f in parsed.source_files if "vendor" in Path(f).parts]
+
+
+class TestIgnoredTypes:
+    def test_exact_names(self):
+        ignored = IgnoredTypes({"pkg.module.MyType"})
+
+        assert "pkg.module.MyType" in ignored
+        assert "pkg.module.OtherType" not in ignored
+        assert "pkg.module" not in ignored
+        assert "pkg.module.MyType.Nested" not in ignored
+
+    def test_packages(self):
+        ignored = IgnoredTypes({"vendor.sdk.*"})
+
+        assert "vendor.sdk.Client" in ignored
+        assert "vendor.sdk.v2.auth.Token" in ignored
+        assert "vendor.sdk" not in ignored
+        assert "vendor.sdk_extras.Client" not in ignored
+
+    def test_only_trailing_wildcard_is_supported(self):
+        with pytest.raises(ValueError):
+            IgnoredTypes({"vendor.*.Client"})
+        with pytest.raises(ValueError):
+            IgnoredTypes({"vendor.sdk.Client*"})
+
+
+def test_structurally_equal_field_types_are_shared():
+    m = import_module("tests.fixtures.default_values_list")
+
+    [cls] = [c for c in parse(m, set()) if c.name == "Class"]
+
+    methods, dunder_methods = [
+        f.type for f in cls.fields if f.name in ["methods", "dunder_methods"]
+    ]
+    assert methods == GenericType(generic="list", type_vars=[PrimitiveType(name="str")])
+    assert methods is dunder_methods
+    assert hash(methods) == hash(
+        GenericType(generic="list", type_vars=[PrimitiveType(name="str")])
+    )
+
+
+def test_syntax_tree_is_released_once_module_is_parsed():
+    parse = _ParseModule(
+        import_module("tests.fixtures.type_alias"), DiGraph(), set()
+    ).exec()
+
+    assert parse.classes()
+    assert parse._class_nodes == {}
+    assert parse._alias_nodes == {}
@@ -0,0 +1,63 @@
+import pytest
+
+from pydantic2zod._compiler import Compiler
+from pydantic2zod._rename import RenameRules
+
+
+@pytest.mark.parametrize(
+    "name,new_name",
+    [
+        ("pkg.models.User", "Account"),
+        ("billing.v2.InvoiceResponse", "V2Invoice"),
+        ("billing.v2.nested.InvoiceResponse", None),
+        ("legacy.orders.Order", "LegacyOrder"),
+        ("legacy.orders.v1.Order", "LegacyOrder"),
+        ("pkg.v3.Item", "ItemV3"),
+        ("pkg.models.Other", None),
+    ],
+)
+def test_renames_by_exact_name_glob_or_regex(name: str, new_name: str | None):
+    rules = RenameRules(
+        {
+            "pkg.models.User": "Account",
+            "billing.v2.*Response": "V2$1",
+            "legacy.**.*": "Legacy$2",
+            r"re:pkg\.v(\d+)\.(\w+)": "$2V$1",
+        }
+    )
+
+    assert rules.rename(name) == new_name
+
+
+def test_rejects_names_which_are_not_identifiers():
+    rules = RenameRules({"legacy.**": "Legacy$1"})
+
+    with pytest.raises(ValueError, match="'Legacyorders.Order'"):
+        rules.rename("legacy.orders.Order")
+    with pytest.raises(ValueError, match="'Order-2'"):
+        RenameRules({"pkg.Order": "Order-2"})
+
+
+def test_exact_names_take_precedence_over_patterns():
+    rules = RenameRules({"pkg.*": "Pattern$1", "pkg.User": "Exact"})
+
+    assert rules.rename("pkg.User") == "Exact"
+    assert rules.rename("pkg.Order") == "PatternOrder"
+
+
+def test_first_matching_pattern_wins():
+    rules = RenameRules({"pkg.*Response": "First$1", "pkg.**": "Second$1"})
+
+    assert rules.rename("pkg.UserResponse") == "FirstUser"
+    assert rules.rename("pkg.User") == "SecondUser"
+
+
+def test_renames_models_and_their_references_by_pattern():
+    class MyCompiler(Compiler):
+        MODEL_RENAME_RULES = {"tests.fixtures.all_in_one.*": "Base$1"}
+
+    out_src = MyCompiler().parse("tests.fixtures.unique_names").to_zod()
+
+    assert "export const BaseClass = z.object({" in out_src
+    assert "classes: z.array(BaseClass)," in out_src
+    assert "export const Class = z.object({" in out_src
@@ -0,0 +1,107 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from pydantic2zod._codegen import Fragment
+from pydantic2zod._compiler import Compiler
+from pydantic2zod._splice import splice
+
+
+def _names(code: str) -> list[str]:
+    return [
+        line.split()[2]
+        for line in code.splitlines()
+        if line.startswith("// pydantic2zod:begin ")
+    ]
+
+
+def test_fragments_make_up_the_whole_code():
+    compiler = Compiler().parse("tests.fixtures.interfaces")
+
+    fragments = compiler.to_zod_fragments()
+
+    header = compiler.zod_emitter().header()
+    assert "\n".join([header, *[f.code + "\n" for f in fragments]]) == (
+        compiler.to_zod()
+    )
+    assert len({f.digest for f in fragments}) == len(fragments)
+
+
+def test_wraps_models_in_markers():
+    code = splice("", "// header\n", [Fragment("A", "const A = 1;")])
+
+    assert code == (
+        "// header\n"
+        "\n"
+        f"// pydantic2zod:begin A {Fragment('A', 'const A = 1;').digest}\n"
+        "const A = 1;\n"
+        "// pydantic2zod:end A\n"
+    )
+
+
+def test_replaces_only_changed_models(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "splice_models", raising=False)
+    models = tmp_path / "splice_models.py"
+    source = (
+        "from pydantic import BaseModel\n\n"
+        "class Item(BaseModel):\n    name: str\n\n"
+        "class Order(BaseModel):\n    items: list[Item]\n\n"
+        "class User(BaseModel):\n    email: str\n"
+    )
+    models.write_text(source)
+    existing = Compiler().parse("splice_models").splice_zod("")
+
+    assert Compiler().parse("splice_models").splice_zod(existing) == existing
+
+    models.write_text(source.replace("email: str", "email: int"))
+    monkeypatch.delitem(sys.modules, "splice_models")
+    spliced = Compiler().parse("splice_models").splice_zod(existing)
+
+    changed = set(spliced.splitlines()) ^ set(existing.splitlines())
+    assert len(changed) == 4
+    assert all("User" in line or "email" in line for line in changed)
+
+
+def test_keeps_the_models_in_place():
+    existing = splice(
+        "", "", [Fragment("A", "a"), Fragment("B", "b"), Fragment("C", "c")]
+    )
+
+    spliced = splice(
+        existing,
+        "",
+        [Fragment("C", "c"), Fragment("D", "d"), Fragment("A", "a2")],
+    )
+
+    assert _names(spliced) == ["A", "C", "D"]
+    assert "a2" in spliced
+
+
+def test_reorders_models_preceding_their_dependencies():
+    existing = splice("", "", [Fragment("A", "a"), Fragment("B", "b")])
+
+    spliced = splice(
+        existing, "", [Fragment("B", "b"), Fragment("A", "a = B", depends_on=["B"])]
+    )
+
+    assert _names(spliced) == ["B", "A"]
+
+
+def test_replaces_code_outside_markers_and_edited_models():
+    existing = splice("", "// old header\n", [Fragment("A", "a"), Fragment("B", "b")])
+    existing = existing.replace("\na\n", "\nedited\n") + "const extra = 1;\n"
+
+    spliced = splice(existing, "// header\n", [Fragment("A", "a"), Fragment("B", "b")])
+
+    assert spliced == splice(
+        "", "// header\n", [Fragment("A", "a"), Fragment("B", "b")]
+    )
+
+
+def test_fails_on_unterminated_block():
+    existing = splice("", "", [Fragment("A", "a")]).replace("// pydantic2zod:end A", "")
+
+    with pytest.raises(ValueError, match="'A' has no end marker"):
+        splice(existing, "", [Fragment("A", "a")])
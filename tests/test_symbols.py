@@ -0,0 +1,75 @@
+from pathlib import Path
+
+import pytest
+
+from pydantic2zod._symbols import SymbolIndex
+
+
+def _write_package(root: Path, files: dict[str, str]) -> None:
+    for name, source in files.items():
+        fname = root / name
+        fname.parent.mkdir(parents=True, exist_ok=True)
+        fname.write_text(source)
+
+
+def test_follows_reexport_chains(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _write_package(
+        tmp_path,
+        {
+            "symbols_chain/__init__.py": "from .geo import Address as Addr\n",
+            "symbols_chain/geo/__init__.py": (
+                "from symbols_chain.geo.models import Address\n"
+            ),
+            "symbols_chain/geo/models.py": "class Address:\n    ...\n",
+        },
+    )
+
+    index = SymbolIndex()
+
+    assert index.resolve("symbols_chain.Addr") == "symbols_chain.geo.models.Address"
+    assert index.resolve("symbols_chain.geo.Address") == (
+        "symbols_chain.geo.models.Address"
+    )
+    assert index.resolve("symbols_chain.Address") == "symbols_chain.Address"
+
+
+def test_classes_declared_after_imports_win(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _write_package(
+        tmp_path,
+        {
+            "symbols_redeclared/__init__.py": (
+                "from typing import TYPE_CHECKING\n"
+                "if TYPE_CHECKING:\n"
+                "    from .models import Tag, User\n"
+                "class User:\n"
+                "    ...\n"
+            ),
+            "symbols_redeclared/models.py": "class Tag:\n    ...\n",
+        },
+    )
+
+    index = SymbolIndex()
+
+    assert index.resolve("symbols_redeclared.User") == "symbols_redeclared.User"
+    assert index.resolve("symbols_redeclared.Tag") == "symbols_redeclared.models.Tag"
+
+
+def test_survives_import_cycles_and_broken_modules(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _write_package(
+        tmp_path,
+        {
+            "symbols_cycle/__init__.py": "from .a import A\n",
+            "symbols_cycle/a.py": "from symbols_cycle import A\n",
+            "symbols_cycle/broken.py": "class Broken(\n",
+        },
+    )
+
+    assert SymbolIndex().resolve("symbols_cycle.A") == "symbols_cycle.A"
+    assert SymbolIndex().resolve("no_such_package.A") == "no_such_package.A"
@@ -0,0 +1,56 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from pydantic2zod._compiler import Compiler
+from pydantic2zod._trace import Trace, trace_span
+
+_MODELS = ["Base", "Tag", "Currency", "Priority", "Entry"]
+
+
+def test_records_compilation_steps(tmp_path: Path):
+    with Trace() as trace:
+        Compiler().parse("tests.fixtures.interfaces").to_zod()
+    trace.save(tmp_path / "trace.json")
+
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    spans = [e for e in events if e["ph"] == "B"]
+    assert {e["name"] for e in spans} == {
+        "parse",
+        "import_module",
+        "index_symbols",
+        "read_file",
+        "cst.parse_module",
+        "visit",
+        "sort_models",
+        "ZodEmitter",
+        "codegen_model",
+    }
+    assert [
+        e["args"]["model"] for e in spans if e["name"] == "codegen_model"
+    ] == _MODELS
+    assert len(spans) == len([e for e in events if e["ph"] == "E"])
+    assert all(e["pid"] == os.getpid() for e in events)
+
+
+def test_records_events_of_worker_processes():
+    with (
+        Trace() as trace,
+        ProcessPoolExecutor(1) as executor,
+    ):
+        Compiler().parse("tests.fixtures.interfaces").to_zod(executor=executor)
+
+    worker_events = [e for e in trace.events if e["pid"] != os.getpid()]
+    assert worker_events[0]["name"] == "process_name"
+    assert [e["args"]["model"] for e in worker_events if e["ph"] == "B"] == _MODELS
+
+
+def test_spans_are_not_recorded_without_trace():
+    with trace_span("parse", "compile"):
+        pass
+
+    with Trace() as trace:
+        pass
+
+    assert [e["ph"] for e in trace.events] == ["M"]